@@ -20,27 +20,29 @@ Your Goal: Answer student questions accurately using ONLY the provided Course Co
 
 const MAX_RETRIES = 3;
 
-// VUT Navy Blue Theme Icons (Flat SVGs)
+// URL of this script; currentScript is null when it runs as a module or from a
+// callback, so fall back to js/ai_chat.js under the page's base URL
+const SCRIPT_URL = document.currentScript ? document.currentScript.src : new URL("js/ai_chat.js", document.baseURI).href;
+
+// VUT Navy Blue Theme Icons (from the shared sprite, scripts/icons.py)
 const COLOR_PRIMARY = "#002F6E";
+const ICON_SPRITE = new URL("../images/icons.svg", SCRIPT_URL).href;
+
+function spriteIcon(name, size = 16, align = "text-bottom") {
+    return `<svg width="${size}" height="${size}" color="${COLOR_PRIMARY}" style="vertical-align: ${align};"><use href="${ICON_SPRITE}#${name}"></use></svg>`;
+}
+
 const ICONS = {
-    settings: `<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="${COLOR_PRIMARY}" width="20" height="20" style="vertical-align: middle;"><path d="M19.14 12.94c.04-.3.06-.61.06-.94 0-.32-.02-.64-.07-.94l2.03-1.58a.49.49 0 0 0 .12-.61l-1.92-3.32a.488.488 0 0 0-.59-.22l-2.39.96c-.5-.38-1.03-.7-1.62-.94l-.36-2.54a.484.484 0 0 0-.48-.41h-3.84c-.24 0-.43.17-.47.41l-.36 2.54c-.59.24-1.13.57-1.62.94l-2.39-.96c-.22-.08-.47 0-.59.22L2.74 8.87c-.12.21-.08.47.12.61l2.03 1.58c-.05.3-.09.63-.09.94s.02.64.07.94l-2.03 1.58a.49.49 0 0 0-.12.61l1.92 3.32c.12.22.37.29.59.22l2.39-.96c.5.38 1.03.7 1.62.94l.36 2.54c.05.24.24.41.48.41h3.84c.24 0 .44-.17.47-.41l.36-2.54c.59-.24 1.13-.58 1.62-.94l2.39.96c.22.08.47 0 .59-.22l1.92-3.32c.12-.22.07-.47-.12-.61l-2.01-1.58zM12 15.6c-1.98 0-3.6-1.62-3.6-3.6s1.62-3.6 3.6-3.6 3.6 1.62 3.6 3.6-1.62 3.6-3.6 3.6z"/></svg>`,
-    wave: `<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="${COLOR_PRIMARY}" width="16" height="16" style="vertical-align: middle;"><path d="M16 6l-1-1-4 4-4-4-1 1 5 5 5-5z" transform="rotate(180 12 12)"/></svg>`, // Simple filler, actually lets use a real HAND or INFO
-    info: `<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="${COLOR_PRIMARY}" width="16" height="16" style="vertical-align: text-bottom;"><path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm1 15h-2v-6h2v6zm0-8h-2V7h2v2z"/></svg>`,
-    check: `<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="${COLOR_PRIMARY}" width="16" height="16" style="vertical-align: text-bottom;"><path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm-2 15l-5-5 1.41-1.41L10 14.17l7.59-7.59L19 8l-9 9z"/></svg>`,
-    error: `<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="${COLOR_PRIMARY}" width="16" height="16" style="vertical-align: text-bottom;"><path d="M12 2C6.47 2 2 6.47 2 12s4.47 10 10 10 10-4.47 10-10S17.53 2 12 2zm5 13.59L15.59 17 12 13.41 8.41 17 7 15.59 10.59 12 7 8.41 8.41 7 12 10.59 15.59 7 17 8.41 13.41 12 17 15.59z"/></svg>`,
-    wait: `<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="${COLOR_PRIMARY}" width="16" height="16" style="vertical-align: text-bottom;"><path d="M11.99 2C6.47 2 2 6.48 2 12s4.47 10 9.99 10C17.52 22 22 17.52 22 12S17.52 2 11.99 2zM12 20c-4.42 0-8-3.58-8-8s3.58-8 8-8 8 3.58 8 8-3.58 8-8 8z"/><path d="M12.5 7H11v6l5.25 3.15.75-1.23-4.5-2.67z"/></svg>`,
-    alert: `<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="${COLOR_PRIMARY}" width="16" height="16" style="vertical-align: text-bottom;"><path d="M12 2L1 21h22L12 2zm1 17h-2v-2h2v2zm0-4h-2V8h2v7z"/></svg>`
+    settings: spriteIcon("settings", 20, "middle"),
+    info: spriteIcon("info"),
+    check: spriteIcon("check"),
+    error: spriteIcon("error"),
+    wait: spriteIcon("wait"),
+    alert: spriteIcon("alert")
 };
 
 // Initialize
 document.addEventListener("DOMContentLoaded", () => {
-    // Check if context is loaded
-    if (typeof COURSE_CONTEXT === 'undefined') {
-        console.error("COURSE_CONTEXT not loaded!");
-        addMessage(`${ICONS.alert} Error: Course knowledge base not loaded.`, false);
-        return;
-    }
-
     setupUI();
 });
 
@@ -129,77 +131,127 @@ window.sendMessage = async function () {
 };
 
 // Helper: Prune Context to stay within Rate Limits
-function getRelevantContext(question) {
-    if (!COURSE_CONTEXT) return "";
-
-    // If context is huge, we split it by Weeks
-    // Delimiter based on your course_context.js format "--- WEEK X NOTES ---"
-    const weeks = COURSE_CONTEXT.split("--- WEEK");
-
-    // Always keep the Introduction/Week 1 if it falls before the first split or is the first chunk
-    let relevantChunks = [];
-
-    // Simple Keyword Matching
-    const lowerQ = question.toLowerCase();
+// The course context is built by scripts/generate_course_context.py into js/context/:
+//   manifest.json  { tokenizer, bm25: {k1, b, avgdl, doc_count}, index_shards, weeks: {week: file},
+//                    chunks: [{id, week, title, chars, length, norm}] }
+//   index_NN.json  { index: {term: [[chunkId, tf], ...]}, idf: {term: idf} }
+//   week_N.json    { week, chunks: {chunkId: text} }
+// Nothing is downloaded until the first question; after that only the index shards
+// of the question's terms and the weeks of the selected sections are fetched, once each.
+// Sections are ranked with BM25; idf and the per-section length norm are precomputed.
+const MAX_CONTEXT_CHARS = 15000;
+const FALLBACK_CONTEXT_CHARS = 5000;
+const WEEK_MENTION_BOOST = 100;
+// Sections scoring below this fraction of the best match are not worth their tokens
+const MIN_RELATIVE_SCORE = 0.25;
+
+// Resolve js/context/ next to this script so pages at any depth can embed the tutor
+const CONTEXT_BASE_URL = new URL("context/", SCRIPT_URL).href;
+const contextFiles = new Map(); // file name -> Promise of parsed JSON
+let contextStopwords = null;
+
+function fetchContextFile(name) {
+    if (!contextFiles.has(name)) {
+        const request = fetch(CONTEXT_BASE_URL + name).then(response => {
+            if (!response.ok) throw new Error(`${name}: HTTP ${response.status}`);
+            return response.json();
+        });
+        // Forget failed requests so the next question can try again
+        request.catch(() => contextFiles.delete(name));
+        contextFiles.set(name, request);
+    }
+    return contextFiles.get(name);
+}
 
-    // Check which week might be relevant
-    weeks.forEach(chunk => {
-        if (!chunk.trim()) return;
+// Shard of a term: 32-bit FNV-1a hash modulo the shard count (same as the generator)
+function indexShardName(term, shardCount) {
+    let h = 0x811c9dc5;
+    for (let i = 0; i < term.length; i++) {
+        h ^= term.charCodeAt(i);
+        h = Math.imul(h, 0x01000193) >>> 0;
+    }
+    return `index_${String(h % shardCount).padStart(2, "0")}.json`;
+}
 
-        // Re-add the "WEEK" prefix removed by split if needed, or just process the chunk
-        // Let's identify the week number from the chunk header roughly
-        const content = "WEEK" + chunk;
+// Split text into index terms using the same settings the index was built with
+function tokenizeQuestion(text, tokenizer) {
+    if (!contextStopwords) contextStopwords = new Set(tokenizer.stopwords);
 
-        // Strategy: 
-        // 1. If question mentions "Week X", explicitly include that.
-        // 2. If chunk contains keywords from the question, include it.
-        // 3. Limit to max 2-3 chunks to save tokens.
+    const tokens = text.toLowerCase().match(new RegExp(tokenizer.pattern, "g")) || [];
+    return tokens.filter(t => t.length >= tokenizer.min_length && !contextStopwords.has(t));
+}
 
-        let score = 0;
+// Fetch the text of the given sections (grouped by week) and format them in course order
+async function loadChunkTexts(manifest, chunks) {
+    const weeks = [...new Set(chunks.map(c => c.week))];
+    const weekData = await Promise.all(weeks.map(week => fetchContextFile(manifest.weeks[week])));
+    const texts = new Map();
+    weekData.forEach(data => {
+        Object.entries(data.chunks).forEach(([chunkId, text]) => texts.set(Number(chunkId), text));
+    });
 
-        // Explicit Week Mention
-        // e.g. "Week 3" -> matches "WEEK 3"
-        if (content.match(/WEEK\s+(\d+)/i)) {
-            const weekNum = content.match(/WEEK\s+(\d+)/i)[1];
-            if (lowerQ.includes(`week ${weekNum}`) || lowerQ.includes(`week${weekNum}`)) {
-                score += 100;
-            }
-        }
+    return [...chunks]
+        .sort((a, b) => a.id - b.id)
+        .map(chunk => `--- WEEK ${chunk.week}: ${chunk.title} ---\n${texts.get(chunk.id)}`)
+        .join("\n\n");
+}
 
-        // Keyword matching
-        const words = lowerQ.split(/\s+/).filter(w => w.length > 3);
-        words.forEach(word => {
-            if (content.toLowerCase().includes(word)) score++;
+async function getRelevantContext(question) {
+    const manifest = await fetchContextFile("manifest.json");
+    const chunks = manifest.chunks;
+    const scores = new Map();
+
+    const k1 = manifest.bm25.k1;
+    const terms = [...new Set(tokenizeQuestion(question, manifest.tokenizer))];
+    const shards = await Promise.all(terms.map(term => fetchContextFile(indexShardName(term, manifest.index_shards))));
+
+    // BM25: one index lookup per distinct question term
+    terms.forEach((term, i) => {
+        const postings = shards[i].index[term];
+        if (!postings) return;
+        const idf = shards[i].idf[term];
+        postings.forEach(([chunkId, tf]) => {
+            const termScore = idf * tf * (k1 + 1) / (tf + chunks[chunkId].norm);
+            scores.set(chunkId, (scores.get(chunkId) || 0) + termScore);
         });
-
-        if (score > 0) {
-            relevantChunks.push({ content, score });
-        }
     });
 
-    // Sort by relevance
-    relevantChunks.sort((a, b) => b.score - a.score);
+    // Explicit Week Mention, e.g. "Week 3" or "week3"
+    const mentionedWeeks = new Set();
+    for (const match of question.toLowerCase().matchAll(/week\s*(\d+)/g)) {
+        mentionedWeeks.add(parseInt(match[1], 10));
+    }
+    if (mentionedWeeks.size > 0) {
+        chunks.forEach(chunk => {
+            if (mentionedWeeks.has(chunk.week)) {
+                scores.set(chunk.id, (scores.get(chunk.id) || 0) + WEEK_MENTION_BOOST);
+            }
+        });
+    }
 
-    // Take top 3 relevant chunks + basic system info
-    // If no keywords matched, default to the first chunk (Introduction) or just a short summary
-    if (relevantChunks.length === 0) {
+    // If nothing matched, default to the start of the course, truncated
+    if (scores.size === 0) {
         console.warn("No relevant context found. Sending truncated fallback.");
-        // FIX: Ensure we truncate even if we return weeks[0]
-        const rawFallback = weeks[0] ? ("WEEK" + weeks[0]) : COURSE_CONTEXT;
-        return rawFallback.slice(0, 5000) + "\n... [Fallback Truncated]";
+        const fallback = await loadChunkTexts(manifest, chunks.filter(c => c.week === chunks[0].week));
+        return fallback.slice(0, FALLBACK_CONTEXT_CHARS) + "\n... [Fallback Truncated]";
     }
 
-    // STAGE 2 DECISION: Enforce strict character limit (approx 4000 tokens)
-    // Even if we found relevant chunks, we must not exceed the prompt quota.
-    const MAX_CHARS = 15000;
-    let finalContext = relevantChunks.slice(0, 2).map(c => c.content).join("\n\n ... [Context Truncated] ... \n\n");
-
-    if (finalContext.length > MAX_CHARS) {
-        console.warn(`Context too large (${finalContext.length}), truncating to ${MAX_CHARS}`);
-        finalContext = finalContext.substring(0, MAX_CHARS) + "\n... [Strict Limit Truncated]";
+    // Take the best sections until the character budget is spent; sections
+    // that do not fit are skipped so smaller relevant ones can still be sent
+    const ranked = [...scores.entries()].sort((a, b) => b[1] - a[1]);
+    const minScore = ranked[0][1] * MIN_RELATIVE_SCORE;
+    const selected = [];
+    let used = 0;
+    for (const [chunkId, score] of ranked) {
+        if (score < minScore) break;
+        const chunk = chunks[chunkId];
+        const size = chunk.chars + chunk.title.length + 20;
+        if (used + size > MAX_CONTEXT_CHARS) continue;
+        selected.push(chunk);
+        used += size;
     }
 
-    return finalContext;
+    return loadChunkTexts(manifest, selected);
 }
 
 // Recursive function to handle sending with retries
@@ -207,7 +259,15 @@ async function sendToGemini(question, retryCount = 0) {
     showTyping();
 
     // INTELLIGENT CONTEXT: Only send relevant parts to save tokens/quota
-    const slimContext = getRelevantContext(question);
+    let slimContext;
+    try {
+        slimContext = await getRelevantContext(question);
+    } catch (error) {
+        hideTyping();
+        console.error("Course context could not be loaded:", error);
+        addMessage(`${ICONS.alert} Error: Course knowledge base not loaded.`, false);
+        return;
+    }
 
     // Debug info for User in Console
     console.log(`Sending Query to Gemini. Context Size: ${slimContext.length} chars`);
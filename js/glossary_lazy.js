@@ -0,0 +1,107 @@
+// Lazily rendered glossary (glossary.html built with create_glossary.py --lazy)
+// The page holds one placeholder per letter (<div class="letter-section" data-letter>)
+// and the cards come from glossary_cards.json next to this file. A letter's cards are
+// rendered when its section nears the viewport, or on demand:
+//   - deep links (glossary.html#Term-Name) render the card's letter and scroll to it
+//   - searches (glossary_search.js) render the letters holding matches and hide the rest
+
+const GLOSSARY_CARDS_URL = new URL("glossary_cards.json",
+    document.currentScript ? document.currentScript.src : new URL("js/", document.baseURI)).href;
+const RENDER_MARGIN = '800px 0px';
+
+let glossarySections = null; // letter -> cards
+let glossaryLetterOf = null; // card ID -> letter
+const renderedLetters = new Set();
+
+const glossaryCardsReady = fetch(GLOSSARY_CARDS_URL)
+    .then(response => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        return response.json();
+    })
+    .then(data => {
+        glossarySections = new Map();
+        glossaryLetterOf = new Map();
+        data.sections.forEach(section => {
+            glossarySections.set(section.letter, section.cards);
+            section.cards.forEach(card => glossaryLetterOf.set(card.slug, section.letter));
+        });
+        return data;
+    });
+
+glossaryCardsReady.catch(error => console.error("Glossary terms could not be loaded:", error));
+
+// Card meta icons from the shared sprite (create_glossary.CATEGORY_ICON / WEEK_ICON)
+const CATEGORY_ICON = '<svg width="16" height="16" color="#c9984a" class="inline-block mr-1"><use href="images/icons.svg#folder"></use></svg>';
+const WEEK_ICON = '<svg width="16" height="16" color="#c9984a" class="inline-block mr-1"><use href="images/icons.svg#calendar"></use></svg>';
+
+// Same markup as create_glossary.render_card
+function cardMarkup(card) {
+    let html = `
+            <div class="term-card" data-category="${card.category}" id="${card.slug}">
+                <div class="term-title">${card.term}</div>
+                <div class="term-definition">${card.definition}</div>
+                <div class="term-meta">
+                    <span class="term-category">${CATEGORY_ICON} ${card.category}</span>
+                    <a href="${card.week_link}" class="term-week" title="Jump to Week ${card.week} Student Notes">${WEEK_ICON} Week ${card.week}</a>
+                </div>`;
+    if (card.related) {
+        const links = card.related.map(related =>
+            `<a href="${related.slug ? '#' + related.slug : '#'}" class="related-link" onclick="searchTerm('${related.term}'); return false;">${related.term}</a>`);
+        html += `
+                <div class="related-terms">
+                    <strong>Related:</strong> ${links.join('')}
+                </div>`;
+    }
+    return html + `
+            </div>`;
+}
+
+function renderLetter(letter) {
+    if (renderedLetters.has(letter) || !glossarySections.has(letter)) return;
+    renderedLetters.add(letter);
+
+    const section = document.getElementById(`letter-${letter}`);
+    const cards = glossarySections.get(letter);
+    section.insertAdjacentHTML('beforeend', cards.map(cardMarkup).join(''));
+    section.style.minHeight = '';
+
+    // Cards rendered while a search is active start out filtered like the others
+    if (typeof glossaryCardShown === 'function') {
+        cards.forEach(card => {
+            if (!glossaryCardShown(card.slug)) document.getElementById(card.slug).style.display = 'none';
+        });
+    }
+}
+
+function showDeepLink() {
+    const slug = decodeURIComponent(window.location.hash.slice(1));
+    if (!glossaryLetterOf.has(slug)) return;
+    renderLetter(glossaryLetterOf.get(slug));
+    document.getElementById(slug).scrollIntoView({block: 'start'});
+}
+
+// Called by glossary_search.js with the IDs of the cards that pass the filter (null: all)
+function glossaryFilterChanged(visibleSlugs) {
+    glossaryCardsReady.then(() => {
+        const letters = visibleSlugs === null ? null : new Set([...visibleSlugs].map(slug => glossaryLetterOf.get(slug)));
+        glossarySections.forEach((_, letter) => {
+            const show = letters === null || letters.has(letter);
+            if (show && letters !== null) renderLetter(letter);
+            document.getElementById(`letter-${letter}`).style.display = show ? '' : 'none';
+        });
+    });
+}
+
+glossaryCardsReady.then(() => {
+    const observer = new IntersectionObserver(entries => {
+        entries.forEach(entry => {
+            if (!entry.isIntersecting) return;
+            renderLetter(entry.target.dataset.letter);
+            observer.unobserve(entry.target);
+        });
+    }, {rootMargin: RENDER_MARGIN});
+    document.querySelectorAll('.letter-section').forEach(section => observer.observe(section));
+
+    showDeepLink();
+    window.addEventListener('hashchange', showDeepLink);
+});
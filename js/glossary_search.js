@@ -0,0 +1,123 @@
+// Glossary search (glossary.html)
+// Uses the index written by scripts/create_glossary.py next to this file
+// (glossary_index.json): card IDs in page order plus trigram and category
+// postings. A lookup intersects postings instead of reading every card, and only
+// cards whose visibility changes are touched. Either way a card matches when its
+// title or definition contains the query:
+//   - queries of 3+ characters: cards holding all of the query's trigrams are
+//     checked
+//   - shorter queries: every card's text is checked (too many cards hold them
+//     for postings to help)
+// On a --lazy glossary (glossary_lazy.js) cards not rendered yet are skipped here;
+// the lazy renderer is told what passes the filter and asks glossaryCardShown().
+
+const GLOSSARY_INDEX_URL = new URL("glossary_index.json",
+    document.currentScript ? document.currentScript.src : new URL("js/", document.baseURI)).href;
+const SEARCH_DEBOUNCE_MS = 120;
+const SHORT_QUERY_LENGTH = 2;
+
+let glossaryIndex = null;
+let cardPositions = null; // card ID -> position in glossaryIndex.cards
+let currentCategory = 'all';
+let visibleCards = null; // Set of card positions currently shown (null: all)
+let searchTimer = null;
+
+const glossaryIndexReady = fetch(GLOSSARY_INDEX_URL)
+    .then(response => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        return response.json();
+    })
+    .then(index => {
+        glossaryIndex = index;
+        cardPositions = new Map(index.cards.map((slug, position) => [slug, position]));
+        return index;
+    });
+
+glossaryIndexReady.catch(error => console.error("Glossary search index could not be loaded:", error));
+
+function intersectPostings(lists) {
+    if (lists.some(list => !list)) return [];
+    lists.sort((a, b) => a.length - b.length);
+    let result = lists[0];
+    for (let i = 1; i < lists.length && result.length; i++) {
+        const members = new Set(lists[i]);
+        result = result.filter(position => members.has(position));
+    }
+    return result;
+}
+
+// Card positions matching a query (null: every card)
+function lookupQuery(query) {
+    if (!query) return null;
+    if (query.length <= SHORT_QUERY_LENGTH) {
+        return glossaryIndex.cards.map((_, position) => position)
+            .filter(position => glossaryIndex.text[position].includes(query));
+    }
+
+    const trigrams = new Set();
+    for (let i = 0; i + 3 <= query.length; i++) trigrams.add(query.slice(i, i + 3));
+    return intersectPostings([...trigrams].map(gram => glossaryIndex.trigrams[gram]))
+        .filter(position => glossaryIndex.text[position].includes(query));
+}
+
+function applyFilter() {
+    const query = document.getElementById('searchInput').value.trim().toLowerCase();
+    const queryMatches = lookupQuery(query);
+    const categoryMatches = currentCategory === 'all' ? null : (glossaryIndex.categories[currentCategory] || []);
+
+    let matches;
+    if (queryMatches === null && categoryMatches === null) matches = null;
+    else if (queryMatches === null) matches = categoryMatches;
+    else if (categoryMatches === null) matches = queryMatches;
+    else matches = intersectPostings([queryMatches, categoryMatches]);
+
+    const next = matches === null ? null : new Set(matches);
+    const setCard = (position, show) => {
+        const card = document.getElementById(glossaryIndex.cards[position]);
+        if (card) card.style.display = show ? 'block' : 'none';
+    };
+
+    // Touch only the cards whose visibility changes
+    if (visibleCards === null && next === null) {
+        return;
+    } else if (visibleCards === null) {
+        glossaryIndex.cards.forEach((_, position) => { if (!next.has(position)) setCard(position, false); });
+    } else if (next === null) {
+        glossaryIndex.cards.forEach((_, position) => { if (!visibleCards.has(position)) setCard(position, true); });
+    } else {
+        visibleCards.forEach(position => { if (!next.has(position)) setCard(position, false); });
+        next.forEach(position => { if (!visibleCards.has(position)) setCard(position, true); });
+    }
+    visibleCards = next;
+
+    if (typeof glossaryFilterChanged === 'function') {
+        glossaryFilterChanged(next === null ? null : new Set([...next].map(position => glossaryIndex.cards[position])));
+    }
+}
+
+// Whether a card passes the current search and category filter
+function glossaryCardShown(slug) {
+    return visibleCards === null || visibleCards.has(cardPositions.get(slug));
+}
+
+// Debounced search, called on every input
+function filterTerms() {
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(() => glossaryIndexReady.then(applyFilter), SEARCH_DEBOUNCE_MS);
+}
+
+// Search for specific term (related term links)
+function searchTerm(term) {
+    document.getElementById('searchInput').value = term;
+    clearTimeout(searchTimer);
+    glossaryIndexReady.then(applyFilter);
+    window.scrollTo({top: 0, behavior: 'smooth'});
+}
+
+// Category filter (combined with the current search)
+function filterByCategory(category) {
+    currentCategory = category;
+    const button = window.event && window.event.target;
+    document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.toggle('active', btn === button));
+    glossaryIndexReady.then(applyFilter);
+}
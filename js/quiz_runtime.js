@@ -0,0 +1,370 @@
+// Shared quiz runtime for the weekly quiz pages (Week_N_Quiz.html)
+// Each page is a thin shell generated by scripts/generate_quizzes.py that loads this
+// script with the content-hashed question payload of its week:
+//   <script src="../js/quiz_runtime.js" data-quiz="Week_N_Quiz.<hash>.json"></script>
+// The payload URL is resolved against the page, so it is fetched once per bank version
+// and this file once per course.
+//
+// Payloads are compiled and validated by scripts/quiz_bank.py:
+//   { week, questions: [{type, question, explanation, options + answer (option index) |
+//                        accept (normalized answers), prompt}], by_type: {type: [indices]} }
+//
+// Each attempt is a paper drawn by the seeded, stratified sampler below, the same
+// algorithm as quiz_bank.sample_paper. The seed is shown to the student (and can be
+// set with ?seed=N), so any paper can be rebuilt for marking queries with:
+//   python scripts/quiz_bank.py --week N --seed S --attempt A
+//
+// The cumulative exam (Cumulative_Exam.html) uses the same runtime. Its payload adds
+// week and category to each question, by_week/by_category indices, and declares the
+// strata to sample ("stratify": "by_category"), their topic weights and the paper size.
+
+const QUIZ_PAYLOAD_URL = document.currentScript.dataset.quiz;
+// Icons come from the shared sprite (scripts/icons.py), next to js/ in images/
+const ICON_SPRITE = new URL("../images/icons.svg", document.currentScript.src).href;
+const ICON_COLOR = "#c9984a";
+
+function spriteIcon(name, size = 16) {
+    return `<svg width="${size}" height="${size}" color="${ICON_COLOR}" class="inline-block mr-1"><use href="${ICON_SPRITE}#${name}"></use></svg>`;
+}
+let quizData = null;
+const quizDataReady = fetch(QUIZ_PAYLOAD_URL)
+    .then(response => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        return response.json();
+    })
+    .then(data => {
+        // Accepted typed answers become Sets so grading is a single lookup
+        data.questions.forEach(q => {
+            if (q.accept) q.acceptSet = new Set(q.accept);
+        });
+        quizData = data;
+        return data;
+    });
+
+// Same normalization as quiz_bank.normalize_answer: trimmed, single-spaced, lowercase
+function normalizeAnswer(text) {
+    return String(text).trim().split(/\s+/).join(' ').toLowerCase();
+}
+
+quizDataReady.catch(error => {
+    console.error("Quiz questions could not be loaded:", error);
+    const startBtn = document.querySelector('.start-btn');
+    if (startBtn) {
+        startBtn.disabled = true;
+        startBtn.textContent = 'Quiz unavailable - please reload the page';
+    }
+});
+
+const PAPER_SIZE = 15;
+
+let currentAttempt = 1;
+let maxAttempts = 3;
+let currentQuestion = 0;
+let questions = [];
+let userAnswers = [];
+let score = 0;
+let paperSeed = null;
+let nextPaper = null;
+
+// mulberry32 PRNG: floats in [0, 1) from a 32-bit seed (same stream as quiz_bank.mulberry32)
+function mulberry32(seed) {
+    let state = seed | 0;
+    return function () {
+        state = state + 0x6D2B79F5 | 0;
+        let t = Math.imul(state ^ state >>> 15, 1 | state);
+        t = t + Math.imul(t ^ t >>> 7, 61 | t) ^ t;
+        return ((t ^ t >>> 14) >>> 0) / 4294967296;
+    };
+}
+
+// Split a paper over strata with the Sainte-Lague method, capped by stratum size
+function allocateQuotas(sizes, weights, total) {
+    const keys = Object.keys(sizes).sort();
+    const quotas = {};
+    keys.forEach(key => { quotas[key] = 0; });
+    total = Math.min(total, keys.reduce((sum, key) => sum + sizes[key], 0));
+
+    for (let seat = 0; seat < total; seat++) {
+        let best = null;
+        let bestPriority = 0;
+        for (const key of keys) {
+            if (quotas[key] >= sizes[key] || !((weights[key] || 0) > 0)) continue;
+            const priority = weights[key] / (2 * quotas[key] + 1);
+            if (best === null || priority > bestPriority) {
+                best = key;
+                bestPriority = priority;
+            }
+        }
+        if (best === null) break;
+        quotas[best]++;
+    }
+    return quotas;
+}
+
+// Sparse partial Fisher-Yates shuffle over one stratum, continued across attempts,
+// so retries avoid earlier questions and a draw costs O(count) whatever the pool size
+class StratumSampler {
+    constructor(items) {
+        this.items = items;
+        this.swaps = new Map();
+        this.position = 0;
+    }
+
+    draw(count, rng) {
+        const n = this.items.length;
+        if (n - this.position < count) {
+            this.swaps = new Map();
+            this.position = 0;
+        }
+
+        const drawn = [];
+        for (let k = 0; k < count; k++) {
+            const i = this.position;
+            const j = i + Math.floor(rng() * (n - i));
+            const picked = this.swaps.has(j) ? this.swaps.get(j) : j;
+            this.swaps.set(j, this.swaps.has(i) ? this.swaps.get(i) : i);
+            drawn.push(this.items[picked]);
+            this.position++;
+        }
+        return drawn;
+    }
+}
+
+// Returns a function that draws the paper of each successive attempt
+function createPaperSampler(strata, seed, size, weights) {
+    const rng = mulberry32(seed);
+    const keys = Object.keys(strata).sort();
+    const sizes = {};
+    keys.forEach(key => { sizes[key] = strata[key].length; });
+    const quotas = allocateQuotas(sizes, weights || sizes, size);
+    const samplers = keys.map(key => new StratumSampler(strata[key]));
+
+    return function () {
+        const paper = [];
+        keys.forEach((key, k) => paper.push(...samplers[k].draw(quotas[key], rng)));
+        for (let i = paper.length - 1; i > 0; i--) {
+            const j = Math.floor(rng() * (i + 1));
+            [paper[i], paper[j]] = [paper[j], paper[i]];
+        }
+        return paper;
+    };
+}
+
+// ?seed=N reproduces a paper; otherwise every visit gets a fresh random seed
+function choosePaperSeed() {
+    const requested = new URLSearchParams(window.location.search).get('seed');
+    if (requested !== null && /^\d+$/.test(requested) && Number(requested) <= 0xffffffff) {
+        return Number(requested);
+    }
+    return crypto.getRandomValues(new Uint32Array(1))[0];
+}
+
+function generateQuestions() {
+    if (nextPaper === null) {
+        paperSeed = choosePaperSeed();
+        nextPaper = createPaperSampler(quizData[quizData.stratify || 'by_type'], paperSeed,
+                                       quizData.paper_size || PAPER_SIZE, quizData.weights);
+    }
+    questions = nextPaper().map(index => quizData.questions[index]);
+    userAnswers = new Array(questions.length).fill(null);
+}
+
+function paperLabel() {
+    return `Paper seed ${paperSeed} &middot; attempt ${currentAttempt}`;
+}
+
+async function startQuiz() {
+    await quizDataReady;
+    maxAttempts = parseInt(document.getElementById('attempts').value);
+    generateQuestions();
+
+    document.getElementById('quizSetup').style.display = 'none';
+    document.getElementById('quizContainer').classList.add('active');
+
+    renderQuestions();
+    showQuestion(0);
+}
+
+function renderQuestions() {
+    const area = document.getElementById('questionsArea');
+    area.innerHTML = `<div class="paper-seed">${paperLabel()}</div>`;
+
+    questions.forEach((q, index) => {
+        const qDiv = document.createElement('div');
+        qDiv.className = 'question-card';
+        qDiv.id = `question-${index}`;
+        qDiv.style.display = 'none';
+
+        let typeLabel = '';
+        if (q.type === 'scenario') typeLabel = `${spriteIcon('clipboard')} Scenario`;
+        else if (q.type === 'fill_blank') typeLabel = `${spriteIcon('pencil')} Fill in the Blank`;
+        else if (q.type === 'command') typeLabel = `${spriteIcon('keyboard')} Command Completion`;
+
+        if (q.week !== undefined) typeLabel = `Week ${q.week} &middot; ${typeLabel}`;
+
+        let content = `
+            <div class="question-header">
+                <span class="question-number">Question ${index + 1} of ${questions.length}</span>
+                <span class="question-type">${typeLabel}</span>
+            </div>
+            <div class="question-text">${q.question}</div>
+        `;
+
+        if (q.type === 'scenario') {
+            content += '<div class="options">';
+            q.options.forEach((opt, i) => {
+                content += `
+                    <div class="option" onclick="selectOption(${index}, ${i})">
+                        ${String.fromCharCode(65 + i)}. ${opt}
+                    </div>
+                `;
+            });
+            content += '</div>';
+        } else if (q.type === 'fill_blank') {
+            content += `
+                <input type="text" class="fill-input" id="answer-${index}" 
+                       placeholder="Type your answer..." onchange="saveAnswer(${index}, this.value)">
+            `;
+        } else if (q.type === 'command') {
+            content += `
+                <div class="command-prompt">${q.prompt}</div>
+                <input type="text" class="fill-input" id="answer-${index}" 
+                       placeholder="Complete the command..." onchange="saveAnswer(${index}, this.value)">
+            `;
+        }
+
+        content += `
+            <div class="explanation" id="explanation-${index}">
+                <strong>Explanation:</strong> ${q.explanation}
+            </div>
+        `;
+
+        qDiv.innerHTML = content;
+        area.appendChild(qDiv);
+    });
+}
+
+function showQuestion(index) {
+    // Hide all questions
+    questions.forEach((_, i) => {
+        document.getElementById(`question-${i}`).style.display = 'none';
+    });
+
+    // Show current question
+    document.getElementById(`question-${index}`).style.display = 'block';
+    currentQuestion = index;
+
+    // Update navigation
+    document.getElementById('prevBtn').disabled = index === 0;
+    document.getElementById('nextBtn').style.display = index < questions.length - 1 ? 'block' : 'none';
+    document.getElementById('submitBtn').style.display = index === questions.length - 1 ? 'block' : 'none';
+}
+
+function selectOption(qIndex, optionIndex) {
+    userAnswers[qIndex] = optionIndex;
+
+    // Update UI
+    const options = document.getElementById(`question-${qIndex}`).querySelectorAll('.option');
+    options.forEach((opt, i) => {
+        opt.classList.toggle('selected', i === optionIndex);
+    });
+}
+
+function saveAnswer(qIndex, answer) {
+    userAnswers[qIndex] = answer.trim();
+}
+
+function previousQuestion() {
+    if (currentQuestion > 0) {
+        showQuestion(currentQuestion - 1);
+    }
+}
+
+function nextQuestion() {
+    if (currentQuestion < questions.length - 1) {
+        showQuestion(currentQuestion + 1);
+    }
+}
+
+function submitQuiz() {
+    calculateScore();
+    document.getElementById('quizContainer').classList.remove('active');
+    showResults();
+}
+
+function calculateScore() {
+    score = 0;
+
+    questions.forEach((q, i) => {
+        const userAnswer = userAnswers[i];
+        let isCorrect = false;
+
+        if (q.type === 'scenario') {
+            isCorrect = userAnswer === q.answer;
+        } else {
+            // For fill-in and command, look up the normalized answer
+            isCorrect = userAnswer !== null && q.acceptSet.has(normalizeAnswer(userAnswer));
+        }
+
+        if (isCorrect) score++;
+
+        // Show explanation and mark answer
+        const qCard = document.getElementById(`question-${i}`);
+        if (q.type === 'scenario') {
+            const options = qCard.querySelectorAll('.option');
+            options.forEach((opt, optionIndex) => {
+                if (optionIndex === q.answer) {
+                    opt.classList.add('correct');
+                } else if (optionIndex === userAnswer) {
+                    opt.classList.add('incorrect');
+                }
+            });
+        }
+
+        document.getElementById(`explanation-${i}`).classList.add('show');
+    });
+}
+
+function showResults() {
+    const percentage = Math.round((score / questions.length) * 100);
+    document.getElementById('scoreDisplay').textContent = `${score}/${questions.length}`;
+
+    let grade = '';
+    if (percentage >= 90) grade = `${spriteIcon('star', 24)} Excellent!`;
+    else if (percentage >= 80) grade = `${spriteIcon('sparkles', 24)} Great Job!`;
+    else if (percentage >= 70) grade = '✓ Passed';
+    else grade = `${spriteIcon('book', 24)} Keep Studying`;
+
+    document.getElementById('gradeDisplay').innerHTML = `${percentage}% - ${grade}`;
+
+    const attemptsLeft = maxAttempts - currentAttempt;
+    let attemptInfo = `<div class="attempts-left">`;
+    attemptInfo += `<strong>Attempt ${currentAttempt} of ${maxAttempts}</strong><br>`;
+    attemptInfo += `<span class="paper-seed">${paperLabel()}</span><br>`;
+    if (percentage < 70 && attemptsLeft > 0) {
+        attemptInfo += `You have ${attemptsLeft} attempt(s) remaining. Click Retry to try again with new questions.`;
+        document.getElementById('retryBtn').style.display = 'block';
+    } else if (attemptsLeft === 0 && percentage < 70) {
+        attemptInfo += `No attempts remaining. Please review the material and try again later.`;
+        document.getElementById('retryBtn').style.display = 'none';
+    } else {
+        attemptInfo += `Congratulations! You passed the quiz.`;
+        document.getElementById('retryBtn').style.display = 'none';
+    }
+    attemptInfo += `</div>`;
+
+    document.getElementById('attemptsInfo').innerHTML = attemptInfo;
+    document.getElementById('results').classList.add('show');
+}
+
+function retryQuiz() {
+    if (currentAttempt < maxAttempts) {
+        currentAttempt++;
+        document.getElementById('results').classList.remove('show');
+        generateQuestions();
+        renderQuestions();
+        currentQuestion = 0;
+        showQuestion(0);
+        document.getElementById('quizContainer').classList.add('active');
+    }
+}
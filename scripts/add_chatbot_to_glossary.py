@@ -7,200 +7,19 @@ Enhances the glossary with an interactive AI assistant sidebar
 from pathlib import Path
 import re
 
+from output_writer import write_if_changed
+from vut_theme import STYLESHEET_HREF, stylesheet_link, write_stylesheet
+
 def add_chatbot_to_glossary(glossary_path):
     """Add AI chatbot sidebar to the glossary HTML"""
     
     with open(glossary_path, 'r', encoding='utf-8') as f:
         html_content = f.read()
     
-    # Find the insertion point - after the header styles
-    style_insertion = html_content.find('        @media (max-width: 768px) {')
-    
-    chatbot_styles = """
-        /* AI Chat Assistant Styles */
-        .chat-container {
-            position: fixed;
-            bottom: 100px;
-            right: 30px;
-            width: 350px;
-            max-height: 600px;
-            background: linear-gradient(135deg, #1e3a5f 0%, #142a46 100%);
-            border-radius: 15px;
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.4);
-            border: 2px solid #c9984a;
-            display: flex;
-            flex-direction: column;
-            z-index: 1000;
-            transition: all 0.3s;
-        }
-        
-        .chat-container.minimized {
-            max-height: 60px;
-        }
-        
-        .chat-header {
-            background: #c9984a;
-            color: #1e3a5f;
-            padding: 15px;
-            border-radius: 13px 13px 0 0;
-            font-weight: bold;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            cursor: pointer;
-        }
-        
-        .chat-header h3 {
-            margin: 0;
-            font-size: 1.1em;
-        }
-        
-        .chat-toggle {
-            background: none;
-            border: none;
-            color: #1e3a5f;
-            font-size: 1.2em;
-            cursor: pointer;
-            padding: 0 5px;
-        }
-        
-        .chat-messages {
-            flex: 1;
-            overflow-y: auto;
-            padding: 15px;
-            display: flex;
-            flex-direction: column;
-            gap: 10px;
-            max-height: 400px;
-        }
-        
-        .chat-message {
-            padding: 10px 12px;
-            border-radius: 10px;
-            max-width: 85%;
-            word-wrap: break-word;
-        }
-        
-        .chat-message.user {
-            background: rgba(201, 152, 74, 0.3);
-            align-self: flex-end;
-            border: 1px solid #c9984a;
-            color: #ffffff;
-        }
-        
-        .chat-message.bot {
-            background: rgba(30, 58, 95, 0.8);
-            align-self: flex-start;
-            border: 1px solid rgba(201, 152, 74, 0.5);
-            color: #ffffff;
-        }
-        
-        .chat-message.bot strong {
-            color: #c9984a;
-        }
-        
-        .chat-input-container {
-            padding: 15px;
-            border-top: 1px solid rgba(201, 152, 74, 0.3);
-        }
-        
-        .chat-input {
-            width: 100%;
-            padding: 10px;
-            border: 2px solid #c9984a;
-            border-radius: 8px;
-            background: rgba(255, 255, 255, 0.1);
-            color: #ffffff;
-            font-size: 0.9em;
-        }
-        
-        .chat-input::placeholder {
-            color: #c8c8c8;
-        }
-        
-        .chat-send-btn {
-            width: 100%;
-            margin-top: 10px;
-            padding: 10px;
-            background: #c9984a;
-            color: #1e3a5f;
-            border: none;
-            border-radius: 8px;
-            font-weight: bold;
-            cursor: pointer;
-            transition: all 0.3s;
-        }
-        
-        .chat-send-btn:hover {
-            background: #ffffff;
-            transform: scale(1.02);
-        }
-        
-        .chat-suggestions {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 5px;
-            padding: 10px;
-            border-top: 1px solid rgba(201, 152, 74, 0.2);
-        }
-        
-        .suggestion-btn {
-            padding: 6px 12px;
-            background: rgba(201, 152, 74, 0.2);
-            border: 1px solid #c9984a;
-            border-radius: 15px;
-            color: #c9984a;
-            font-size: 0.85em;
-            cursor: pointer;
-            transition: all 0.3s;
-        }
-        
-        .suggestion-btn:hover {
-            background: #c9984a;
-            color: #1e3a5f;
-        }
-        
-        .typing-indicator {
-            display: none;
-            align-self: flex-start;
-            padding: 10px;
-        }
-        
-        .typing-indicator.active {
-            display: block;
-        }
-        
-        .typing-dot {
-            display: inline-block;
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            background: #c9984a;
-            margin: 0 2px;
-            animation: typing 1.4s infinite;
-        }
-        
-        .typing-dot:nth-child(2) {
-            animation-delay: 0.2s;
-        }
-        
-        .typing-dot:nth-child(3) {
-            animation-delay: 0.4s;
-        }
-        
-        @keyframes typing {
-            0%, 60%, 100% {
-                transform: translateY(0);
-            }
-            30% {
-                transform: translateY(-10px);
-            }
-        }
-        
-"""
-    
-    # Insert chatbot styles before media query
-    html_content = html_content[:style_insertion] + chatbot_styles + html_content[style_insertion:]
+    # Chat styles come from the shared theme stylesheet
+    if STYLESHEET_HREF not in html_content:
+        head_close = html_content.find('</head>')
+        html_content = html_content[:head_close] + f"    {stylesheet_link()}\n" + html_content[head_close:]
     
     # Add chatbot HTML before closing body tag
     chatbot_html = """
@@ -369,8 +188,7 @@ def add_chatbot_to_glossary(glossary_path):
     html_content = html_content[:body_close] + chatbot_html + html_content[body_close:]
     
     # Write back
-    with open(glossary_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    write_if_changed(glossary_path, html_content)
     
     print(f"✅ Added AI chatbot to glossary")
 
@@ -384,6 +202,7 @@ def main():
     print("=" * 70)
     print()
     
+    write_stylesheet()
     add_chatbot_to_glossary(glossary_path)
     
     print()
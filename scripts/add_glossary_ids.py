@@ -5,26 +5,17 @@ Parses glossary.html and adds id attributes to term-card elements
 matching the term title. This enables deep linking (e.g., glossary.html#Term-Name).
 """
 
-from bs4 import BeautifulSoup
 from pathlib import Path
 
-def add_ids_to_glossary():
-    base_dir = Path(__file__).parent.parent
-    glossary_path = base_dir / "glossary.html"
-    
-    if not glossary_path.exists():
-        print(f"❌ File not found: {glossary_path}")
-        return
+from glossary_store import glossary_terms
+from html_parsing import make_soup
+from output_writer import summary, write_if_changed
+import tracing
 
-    print(f"Processing: {glossary_path.name}")
-    
-    with open(glossary_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        
-    soup = BeautifulSoup(content, 'html.parser')
-    
-    # Find all term cards
+def apply_glossary_ids(soup):
+    """Give every term card without an id the slug of its term; returns how many were added"""
     term_cards = soup.find_all('div', class_='term-card')
+    slugs = {term: entry['slug'] for term, entry in glossary_terms().items()}
     count = 0
     
     for card in term_cards:
@@ -32,20 +23,43 @@ def add_ids_to_glossary():
         title_elem = card.find('div', class_='term-title')
         if title_elem:
             term_text = title_elem.get_text().strip()
-            # Generate ID: Replace spaces with dashes, generic sanitization
-            # The tooltip script uses: term.replace(" ", "-")
-            term_id = term_text.replace(" ", "-")
+            # Use the slug from the glossary store (the same one tooltips link to),
+            # falling back to the store's rule for cards not in the store
+            term_id = slugs.get(term_text, term_text.replace(" ", "-"))
             
             # Add id to the card if not present
             if not card.get('id'):
                 card['id'] = term_id
                 count += 1
+    return count
+
+def add_ids_to_glossary():
+    base_dir = Path(__file__).parent.parent
+    glossary_path = base_dir / "glossary.html"
+    
+    if not glossary_path.exists():
+        print(f"❌ File not found: {glossary_path}")
+        return
+
+    print(f"Processing: {glossary_path.name}")
+    
+    with tracing.span("read", file=glossary_path) as span:
+        with open(glossary_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        span.set(bytes_in=len(content))
+        
+    soup = make_soup(content)
+    with tracing.span("transform", "glossary_ids", file=glossary_path):
+        count = apply_glossary_ids(soup)
                 
     # Write back
-    with open(glossary_path, 'w', encoding='utf-8') as f:
-        f.write(str(soup))
+    with tracing.span("serialize", file=glossary_path) as span:
+        content = str(soup)
+        span.set(bytes_out=len(content))
+    write_if_changed(glossary_path, content)
         
     print(f"✅ Added IDs to {count} glossary terms")
+    print(summary())
 
 if __name__ == "__main__":
     add_ids_to_glossary()
@@ -3,12 +3,19 @@
 Add Navigation Buttons to Student Notes
 Adds "Previous Chapter" and "Next Chapter" buttons to the bottom of each student notes file.
 Includes deduplication to prevent repeated addition of navigation bars.
+Arrow and home icons reference the shared sprite (icons.py).
 """
 
-from bs4 import BeautifulSoup
 from pathlib import Path
 import re
 
+from bs4 import NavigableString
+
+from html_parsing import make_fragment, make_soup
+from icons import icon, write_sprite
+from output_writer import summary, write_if_changed
+import tracing
+
 # Define the ordered list of weeks and their folder names
 COURSE_SEQUENCE = [
     {"week": 1, "folder": "Week 1 - Introduction to Virtualization", "file": "Week_1_Student_Notes.html", "title": "Week 1: Introduction"},
@@ -35,7 +42,7 @@ def create_nav_html(prev_item, next_item):
         path = f"../{prev_item['folder']}/{prev_item['file']}"
         html += f"""
         <a href="{path}" class="flex items-center text-blue-600 hover:text-blue-800 dark:text-blue-400 dark:hover:text-blue-300 transition-colors no-underline">
-            <svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M15 19l-7-7 7-7"></path></svg>
+            {icon("chevron-left", 20, "w-5 h-5 mr-2", prefix="../")}
             <span>Previous: {prev_item['title']}</span>
         </a>
         """
@@ -43,9 +50,9 @@ def create_nav_html(prev_item, next_item):
         html += '<div></div>' # Spacer
 
     # Index Button (Center)
-    html += """
+    html += f"""
     <a href="../index.html" class="flex items-center font-semibold text-gray-700 hover:text-blue-600 dark:text-gray-300 dark:hover:text-blue-400 transition-colors no-underline">
-        <svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M3 12l2-2m0 0l7-7 7 7M5 10v10a1 1 0 001 1h3m10-11l2 2m-2-2v10a1 1 0 01-1 1h-3m-6 0a1 1 0 001-1v-4a1 1 0 011-1h2a1 1 0 011 1v4a1 1 0 001 1m-6 0h6"></path></svg>
+        {icon("home", 20, "w-5 h-5 mr-2", prefix="../")}
         Course Index
     </a>
     """
@@ -56,7 +63,7 @@ def create_nav_html(prev_item, next_item):
         html += f"""
         <a href="{path}" class="flex items-center text-blue-600 hover:text-blue-800 dark:text-blue-400 dark:hover:text-blue-300 transition-colors no-underline">
             <span>Next: {next_item['title']}</span>
-            <svg class="w-5 h-5 ml-2" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 5l7 7-7 7"></path></svg>
+            {icon("chevron-right", 20, "w-5 h-5 ml-2", prefix="../")}
         </a>
         """
     else:
@@ -65,12 +72,46 @@ def create_nav_html(prev_item, next_item):
     html += '</div>'
     return html
 
+def find_neighbours(file_name):
+    """Return the (previous, next) course items around a notes file name"""
+    for i, item in enumerate(COURSE_SEQUENCE):
+        if item['file'] == file_name:
+            prev_item = COURSE_SEQUENCE[i-1] if i > 0 else None
+            next_item = COURSE_SEQUENCE[i+1] if i < len(COURSE_SEQUENCE) - 1 else None
+            return prev_item, next_item
+    return None, None
+
+def apply_navigation(soup, prev_item, next_item):
+    """Replace the chapter navigation at the end of the article (modified in place)"""
+    # Find article
+    article = soup.find('article')
+    if not article:
+        return False
+        
+    # Remove existing navigation if present (avoid duplicates)
+    existing_nav = article.find('div', class_='chapter-navigation')
+    if existing_nav:
+        existing_nav.decompose()
+    
+    # Drop the whitespace left at the end, so rebuilding the nav gives the same page
+    while article.contents and type(article.contents[-1]) is NavigableString and not article.contents[-1].strip():
+        article.contents[-1].extract()
+    
+    # Generate new nav
+    nav_html = create_nav_html(prev_item, next_item)
+    nav_soup = make_fragment(nav_html)
+    
+    # Append to end of article
+    article.append(nav_soup)
+    return True
+
 def main():
     base_dir = Path(__file__).parent.parent
     print("=" * 70)
     print("Adding Chapter Navigation")
     print("=" * 70)
     
+    write_sprite()
     for i, item in enumerate(COURSE_SEQUENCE):
         prev_item = COURSE_SEQUENCE[i-1] if i > 0 else None
         next_item = COURSE_SEQUENCE[i+1] if i < len(COURSE_SEQUENCE) - 1 else None
@@ -83,33 +124,25 @@ def main():
             
         print(f"Processing: {item['file']}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        soup = BeautifulSoup(content, 'html.parser')
-        
-        # Find article
-        article = soup.find('article')
-        if not article:
-            print("  ⚠️ No article tag found")
-            continue
+        with tracing.span("read", file=file_path) as span:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            span.set(bytes_in=len(content))
             
-        # Remove existing navigation if present (avoid duplicates)
-        existing_nav = article.find('div', class_='chapter-navigation')
-        if existing_nav:
-            existing_nav.decompose()
-        
-        # Generate new nav
-        nav_html = create_nav_html(prev_item, next_item)
-        nav_soup = BeautifulSoup(nav_html, 'html.parser')
+        soup = make_soup(content)
         
-        # Append to end of article
-        article.append(nav_soup)
+        with tracing.span("transform", "navigation", file=file_path):
+            if not apply_navigation(soup, prev_item, next_item):
+                print("  ⚠️ No article tag found")
+                continue
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(str(soup))
+        with tracing.span("serialize", file=file_path) as span:
+            content = str(soup)
+            span.set(bytes_out=len(content))
+        write_if_changed(file_path, content)
             
     print("✅ Navigation added to all files")
+    print(summary())
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Benchmark Corpus Generator
+Builds a synthetic copy of the course, scaled to a multiple of its current size,
+for the pipeline benchmark (benchmark.py). The corpus is a self-contained course
+tree: the scripts, theme and runtime assets are copied from this repository,
+so every generator runs on it unchanged, and the course content is replaced by
+deterministic synthetic content.
+
+At scale N (the current course is about N = 1) the corpus has the same 12 weeks,
+each with:
+- Week_X_Student_Notes.html: 8 * N numbered h2 chapters of h3 subsections with
+  paragraphs mentioning glossary terms, lists, code blocks, tables and images
+- Week_X_Lab.html: a lab page of 4 * N tasks
+and, course-wide:
+- glossary_data.json: the glossary's terms and tooltips, N times over
+- quiz_questions_3_12.py: every week's quiz bank, N times over
+
+    python scripts/bench_corpus.py /tmp/corpus --scale 10
+"""
+
+from pathlib import Path
+import argparse
+import json
+import random
+import shutil
+
+from add_navigation import COURSE_SEQUENCE
+from generate_quizzes import QUIZ_QUESTIONS
+from glossary_store import GLOSSARY_PATH, normalize
+
+SCRIPTS_DIR = Path(__file__).parent
+REPO_DIR = SCRIPTS_DIR.parent
+# Copied as they are; everything the generators read or write besides the content
+COPIED_PATHS = ["css", "js", "images", "ops3_logo.png"]
+# Generated in the corpus by the pipeline being measured
+SKIPPED_ASSETS = ["context", "glossary_index.json", "glossary_cards.json"]
+
+CHAPTERS_PER_WEEK = 8
+SUBSECTIONS_PER_CHAPTER = 3
+PARAGRAPHS_PER_SUBSECTION = 4
+LAB_TASKS_PER_WEEK = 4
+
+FILLER = (
+    "The administrator configures the host before any workload is placed on it.",
+    "Each change is verified from the command line and recorded in the lab log.",
+    "Resources are shared between tenants, so limits are applied per project.",
+    "Monitoring shows the effect of the change within a few seconds.",
+    "The same steps apply to every node in the cluster.",
+    "Students compare the result with the expected output in the checkpoint.",
+)
+COMMANDS = (
+    "qm create {n} --name vm{n} --memory 2048 --net0 virtio,bridge=vmbr0",
+    "pct create {n} local:vztmpl/debian-12-standard.tar.zst --hostname ct{n}",
+    "openstack server create --flavor m1.small --image cirros vm-{n}",
+    "ip link add veth{n} type veth peer name veth{n}-br",
+    "zfs create tank/vm-{n}-disk-0",
+)
+
+
+def variant(name, copy):
+    """Name of the copy-th synthetic copy of a term or question (the original for copy 0)"""
+    return name if copy == 0 else f"{name} {copy + 1}"
+
+
+def scaled_glossary(scale):
+    """The glossary store with every term and tooltip repeated scale times"""
+    with open(GLOSSARY_PATH, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    terms = []
+    tooltips = []
+    for copy in range(scale):
+        for entry in data['terms']:
+            scaled = dict(entry, term=variant(entry['term'], copy))
+            if 'related' in entry:
+                scaled['related'] = [variant(item['term'], copy) for item in entry['related']]
+            terms.append(scaled)
+        for entry in data['tooltips']:
+            tooltips.append(dict(entry, term=variant(entry['term'], copy)))
+    data['terms'] = terms
+    data['tooltips'] = tooltips
+    return normalize(data)
+
+
+def scaled_quiz_banks(scale):
+    """Every week's quiz bank with each question repeated scale times (unique texts)"""
+    banks = {}
+    for week, bank in QUIZ_QUESTIONS.items():
+        banks[week] = {
+            qtype: [dict(entry, question=f"{entry['question']} (variant {copy + 1})" if copy else entry['question'])
+                    for copy in range(scale) for entry in entries]
+            for qtype, entries in bank.items()
+        }
+    return banks
+
+
+def paragraph(rng, terms):
+    """A paragraph of filler sentences mentioning a few glossary terms"""
+    sentences = []
+    for term in rng.sample(terms, 3):
+        sentences.append(f"A {term} is part of the design discussed here.")
+        sentences.append(rng.choice(FILLER))
+    return f"<p>{' '.join(sentences)}</p>"
+
+
+def notes_page(week, title, scale, rng, terms):
+    """Synthetic Week_X_Student_Notes.html"""
+    body = []
+    number = 0
+    for chapter in range(1, CHAPTERS_PER_WEEK * scale + 1):
+        body.append(f'<h2>{chapter}. {rng.choice(terms)} in Practice</h2>')
+        body.append(paragraph(rng, terms))
+        for sub in range(1, SUBSECTIONS_PER_CHAPTER + 1):
+            number += 1
+            body.append(f'<h3>{chapter}.{sub} Working with {rng.choice(terms)}</h3>')
+            body.extend(paragraph(rng, terms) for _ in range(PARAGRAPHS_PER_SUBSECTION))
+            body.append("<ul>" + "".join(f"<li>{term}: {rng.choice(FILLER)}</li>" for term in rng.sample(terms, 4)) + "</ul>")
+            if sub % 2:
+                command = rng.choice(COMMANDS).format(n=100 + number)
+                body.append(f'<pre><code class="language-bash"># Step {number}\n{command}\n</code></pre>')
+        body.append('<table><thead><tr><th>Term</th><th>Role</th></tr></thead><tbody>'
+                    + "".join(f"<tr><td>{term}</td><td>{rng.choice(FILLER)}</td></tr>" for term in rng.sample(terms, 4))
+                    + '</tbody></table>')
+        if chapter % 2:
+            body.append(f'<img alt="Diagram {chapter}" src="images/diagram_{chapter}.png"/>')
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8"/>
+<meta content="width=device-width, initial-scale=1" name="viewport"/>
+<title>Week {week}: {title} - Student Notes</title>
+<link href="../css/vut_theme.css" rel="stylesheet"/>
+</head>
+<body>
+<main class="container mx-auto">
+<article class="prose lg:prose-lg">
+<div class="flex items-stretch"><div class="flex-1 flex"><h1>{title}</h1></div></div>
+<h2>Welcome to Week {week}!</h2>
+{paragraph(rng, terms)}
+{chr(10).join(body)}
+</article>
+</main>
+</body>
+</html>
+"""
+
+
+def lab_page(week, title, scale, rng, terms):
+    """Synthetic Week_X_Lab.html"""
+    tasks = []
+    for task in range(1, LAB_TASKS_PER_WEEK * scale + 1):
+        command = rng.choice(COMMANDS).format(n=task)
+        tasks.append(f"<h2>Task {task}: {rng.choice(terms)}</h2>\n{paragraph(rng, terms)}\n"
+                     f"<pre><code>{command}</code></pre>")
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8"/>
+<title>Week {week}: {title} - Lab</title>
+</head>
+<body>
+<main class="container mx-auto">
+<h1>{title} Lab</h1>
+{chr(10).join(tasks)}
+</main>
+</body>
+</html>
+"""
+
+
+def build_corpus(target_dir, scale, seed=0):
+    """Write a corpus at the given scale into target_dir (replacing it); returns its statistics"""
+    target_dir = Path(target_dir)
+    if target_dir.resolve() in (REPO_DIR.resolve(), *REPO_DIR.resolve().parents):
+        raise ValueError(f"Refusing to replace {target_dir}: it holds the course itself")
+    if target_dir.exists():
+        shutil.rmtree(target_dir)
+    target_dir.mkdir(parents=True)
+    rng = random.Random(seed)
+
+    shutil.copytree(SCRIPTS_DIR, target_dir / "scripts",
+                    ignore=shutil.ignore_patterns("__pycache__", "*.bak", "*.ps1"))
+    for name in COPIED_PATHS:
+        source = REPO_DIR / name
+        if source.is_dir():
+            shutil.copytree(source, target_dir / name, ignore=shutil.ignore_patterns(*SKIPPED_ASSETS))
+        elif source.exists():
+            shutil.copy2(source, target_dir / name)
+
+    glossary = scaled_glossary(scale)
+    with open(target_dir / "scripts" / GLOSSARY_PATH.name, 'w', encoding='utf-8') as f:
+        json.dump(glossary, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+    banks = scaled_quiz_banks(scale)
+    with open(target_dir / "scripts" / "quiz_questions_3_12.py", 'w', encoding='utf-8') as f:
+        f.write(f"# Synthetic quiz banks for the benchmark corpus (scale {scale}), all weeks\n\n")
+        f.write(f"WEEKS_3_12_QUESTIONS = {banks!r}\n")
+
+    terms = [entry['term'] for entry in glossary['tooltips']]
+    notes_bytes = 0
+    for item in COURSE_SEQUENCE:
+        week_dir = target_dir / item['folder']
+        week_dir.mkdir()
+        title = item['folder'].split(" - ", 1)[-1]
+        notes = notes_page(item['week'], title, scale, rng, terms)
+        (week_dir / item['file']).write_text(notes, encoding='utf-8')
+        (week_dir / f"Week_{item['week']}_Lab.html").write_text(lab_page(item['week'], title, scale, rng, terms), encoding='utf-8')
+        notes_bytes += len(notes.encode('utf-8'))
+
+    return {
+        "scale": scale,
+        "weeks": len(COURSE_SEQUENCE),
+        "notes_bytes": notes_bytes,
+        "glossary_terms": len(glossary['terms']),
+        "tooltips": len(glossary['tooltips']),
+        "quiz_questions": sum(len(entries) for bank in banks.values() for entries in bank.values()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a synthetic, scaled copy of the course for benchmarking.")
+    parser.add_argument("target", help="Directory to build the corpus in (replaced if it exists)")
+    parser.add_argument("--scale", type=int, default=1, help="Size relative to the current course (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic content (default: 0)")
+    args = parser.parse_args()
+
+    stats = build_corpus(args.target, args.scale, args.seed)
+    print(f"✅ Corpus at {args.scale}x in {args.target}: {stats['notes_bytes'] // 1024} KB of notes, "
+          f"{stats['glossary_terms']} glossary terms, {stats['quiz_questions']} quiz questions")
+
+
+if __name__ == "__main__":
+    main()
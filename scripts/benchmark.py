@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark
+Runs the course generators over synthetic corpora of 1x, 10x and 100x the
+current course (bench_corpus.py) and records, per generator and scale:
+
+- wall_seconds: wall time of the generator process
+- peak_rss_kb:  peak resident memory of the process (None where the platform
+                does not report it, e.g. Windows)
+- output_bytes: size of the files the generator created or changed
+
+A step that fails also keeps the last lines of its stderr (stderr_tail), which
+are printed with its result.
+
+Each scale gets a fresh corpus, so every generator does a full (uncached) build.
+Results are written as JSON together with the commit they were measured on;
+pass an earlier results file with --compare to print the change per step. The
+"growth" column divides a step's time at each scale by its time at the previous
+scale, so anything growing faster than the corpus stands out.
+
+    python scripts/benchmark.py
+    python scripts/benchmark.py --scales 1,10 --output before.json
+    python scripts/benchmark.py --compare before.json
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_corpus import build_corpus
+from html_parsing import parser_name
+
+DEFAULT_SCALES = (1, 10, 100)
+DEFAULT_OUTPUT = "bench_results.json"
+# Lines of a failed step's stderr kept in the results
+ERROR_TAIL_LINES = 20
+
+# (name, script, arguments) in build order: the PowerPoint step reads the slides
+BENCHMARK_STEPS = [
+    ("add_glossary_tooltips", "add_glossary_tooltips.py", []),
+    ("create_glossary", "create_glossary.py", []),
+    ("convert_notes_to_slides", "convert_notes_to_slides.py", []),
+    ("convert_html_to_pptx", "convert_html_to_pptx.py", []),
+    ("generate_quizzes", "generate_quizzes.py", []),
+    ("generate_course_context", "generate_course_context.py", []),
+]
+# Steps that need an optional package
+STEP_REQUIREMENTS = {"convert_html_to_pptx": "pptx"}
+# Bookkeeping files that are not generator output
+IGNORED_OUTPUTS = {".build_cache.json", ".build_cache"}
+
+
+def snapshot(corpus_dir):
+    """(size, mtime) of every file in the corpus"""
+    files = {}
+    for path in Path(corpus_dir).rglob("*"):
+        relative = path.relative_to(corpus_dir)
+        if relative.parts[0] in IGNORED_OUTPUTS or "__pycache__" in relative.parts or not path.is_file():
+            continue
+        stat = path.stat()
+        files[relative] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+def run_process(command, cwd, timeout, stderr=subprocess.DEVNULL):
+    """Run a command, stderr going to the given file; returns (exit code, wall seconds, peak RSS in KB or None)"""
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=cwd, stdout=subprocess.DEVNULL, stderr=stderr)
+    if not hasattr(os, "wait4"):
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        return process.returncode, time.perf_counter() - start, None
+
+    # wait4 reports the child's resource usage; poll it so the timeout still applies
+    while True:
+        pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+        if pid:
+            break
+        if timeout and time.perf_counter() - start > timeout:
+            process.kill()
+            pid, status, usage = os.wait4(process.pid, 0)
+            break
+        time.sleep(0.005)
+    elapsed = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is in KB on Linux and in bytes on macOS
+    peak = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return process.returncode, elapsed, peak
+
+
+def run_step(corpus_dir, script, arguments, timeout):
+    """Run one generator in the corpus and measure it"""
+    before = snapshot(corpus_dir)
+    command = [sys.executable, str(Path(corpus_dir) / "scripts" / script), *arguments]
+    # A file rather than a pipe: nothing reads stderr while the step runs
+    with tempfile.TemporaryFile() as log:
+        code, elapsed, peak = run_process(command, corpus_dir, timeout, stderr=log)
+        log.seek(0)
+        errors = log.read().decode('utf-8', errors='replace')
+    after = snapshot(corpus_dir)
+    output_bytes = sum(size for path, (size, mtime) in after.items() if before.get(path) != (size, mtime))
+    result = {
+        "status": "ok" if code == 0 else f"exit {code}",
+        "wall_seconds": round(elapsed, 3),
+        "peak_rss_kb": peak,
+        "output_bytes": output_bytes,
+    }
+    if code != 0:
+        result["stderr_tail"] = "\n".join(errors.rstrip().splitlines()[-ERROR_TAIL_LINES:])
+    return result
+
+
+def run_scale(scale, work_dir, steps, timeout):
+    """Build a corpus at one scale and run every step over it"""
+    corpus_dir = Path(work_dir) / f"corpus_{scale}x"
+    print(f"Scale {scale}x: building corpus...")
+    corpus = build_corpus(corpus_dir, scale)
+    print(f"  {corpus['notes_bytes'] // 1024} KB of notes, {corpus['glossary_terms']} glossary terms, "
+          f"{corpus['quiz_questions']} quiz questions")
+
+    results = {}
+    for name, script, arguments in steps:
+        requirement = STEP_REQUIREMENTS.get(name)
+        if requirement and importlib.util.find_spec(requirement) is None:
+            results[name] = {"status": f"skipped ({requirement} not installed)"}
+            print(f"  ⏭️  {name}: {requirement} not installed")
+            continue
+        result = run_step(corpus_dir, script, arguments, timeout)
+        results[name] = result
+        mark = "✓" if result["status"] == "ok" else "❌"
+        rss = f"{result['peak_rss_kb'] // 1024} MB" if result["peak_rss_kb"] else "n/a"
+        print(f"  {mark} {name}: {result['wall_seconds']:.2f}s, peak {rss}, "
+              f"{result['output_bytes'] // 1024} KB written ({result['status']})")
+        if "stderr_tail" in result:
+            for line in result["stderr_tail"].splitlines():
+                print(f"      {line}")
+    return {"corpus": corpus, "steps": results}
+
+
+def git_commit(base_dir):
+    """Commit the benchmark ran on, or None outside a git checkout"""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=base_dir,
+                                capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_growth(scales, runs):
+    """Time per step at each scale, divided by its time at the previous scale"""
+    print()
+    print(f"{'step':<26}" + "".join(f"{str(scale) + 'x':>12}" for scale in scales) + "   growth")
+    for name, _, _ in BENCHMARK_STEPS:
+        times = [runs[str(scale)]["steps"].get(name, {}).get("wall_seconds") for scale in scales]
+        growth = [f"{later / earlier:.1f}x" if earlier and later else "-"
+                  for earlier, later in zip(times, times[1:])]
+        cells = "".join(f"{t:>11.2f}s" if t is not None else f"{'-':>12}" for t in times)
+        print(f"{name:<26}{cells}   {' '.join(growth)}")
+
+
+def print_comparison(previous, current):
+    """Change in wall time and peak memory per step against an earlier results file"""
+    print()
+    print(f"Compared with {previous.get('commit') or 'previous run'}:")
+    for scale, run in current["runs"].items():
+        before = previous.get("runs", {}).get(scale)
+        if not before:
+            continue
+        for name, result in run["steps"].items():
+            old = before["steps"].get(name, {})
+            if "wall_seconds" not in result or "wall_seconds" not in old:
+                continue
+            change = (result["wall_seconds"] / old["wall_seconds"] - 1) * 100 if old["wall_seconds"] else 0
+            line = f"  {scale}x {name}: {old['wall_seconds']:.2f}s -> {result['wall_seconds']:.2f}s ({change:+.0f}%)"
+            if result.get("peak_rss_kb") and old.get("peak_rss_kb"):
+                line += f", peak {old['peak_rss_kb'] // 1024} -> {result['peak_rss_kb'] // 1024} MB"
+            print(line)
+
+
+def main():
+    base_dir = Path(__file__).parent.parent
+    step_names = [name for name, _, _ in BENCHMARK_STEPS]
+
+    parser = argparse.ArgumentParser(description="Benchmark the course generators on scaled synthetic corpora.")
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)),
+                        help=f"Comma separated corpus scales (default: {','.join(map(str, DEFAULT_SCALES))})")
+    parser.add_argument("--steps", help=f"Comma separated steps to run (default: all of {','.join(step_names)})")
+    parser.add_argument("--output", default=str(base_dir / DEFAULT_OUTPUT), help="Results JSON file")
+    parser.add_argument("--compare", help="Earlier results JSON file to compare with")
+    parser.add_argument("--timeout", type=float, default=1800, help="Seconds before a step is stopped (default: 1800)")
+    parser.add_argument("--keep", help="Build the corpora in this directory and keep them")
+    args = parser.parse_args()
+
+    scales = [int(scale) for scale in args.scales.split(",") if scale.strip()]
+    steps = BENCHMARK_STEPS
+    if args.steps:
+        selected = [name.strip() for name in args.steps.split(",") if name.strip()]
+        unknown = [name for name in selected if name not in step_names]
+        if unknown:
+            parser.error(f"Unknown step(s): {', '.join(unknown)}. Available: {', '.join(step_names)}")
+        steps = [step for step in BENCHMARK_STEPS if step[0] in selected]
+
+    print("=" * 70)
+    print("Pipeline Benchmark")
+    print("=" * 70)
+    print()
+
+    runs = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = Path(args.keep) if args.keep else Path(temp_dir)
+        for scale in scales:
+            runs[str(scale)] = run_scale(scale, work_dir, steps, args.timeout)
+            print()
+
+    results = {
+        "commit": git_commit(base_dir),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "html_parser": parser_name(),
+        "runs": runs,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
+
+    print_growth(scales, runs)
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            print_comparison(json.load(f), results)
+
+    print()
+    print(f"✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
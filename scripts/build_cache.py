@@ -0,0 +1,116 @@
+"""
+Incremental Build Cache
+Records content hashes of the inputs behind every generated file so the generators
+can skip outputs that are still current.
+
+The manifest (.build_cache.json in the repository root) maps each output path to
+the hashes of its inputs and of the output itself. An output is rebuilt when any
+input hash changed, when it was edited or deleted after the last build, or when
+the generator is run with --force.
+
+Inputs are given as a list of:
+- Path objects, hashed by file content (a missing file hashes as None)
+- (label, value) tuples, hashed from the JSON form of the value, for in-memory
+  sources such as a quiz question bank
+"""
+
+from pathlib import Path
+import hashlib
+import json
+
+MANIFEST_NAME = ".build_cache.json"
+
+
+def hash_bytes(data):
+    """Return the SHA-256 hex digest of some bytes"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path):
+    """Return the content hash of a file, or None if it does not exist"""
+    try:
+        with open(path, 'rb') as f:
+            return hash_bytes(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def hash_data(value):
+    """Return a stable hash of any JSON-serializable value"""
+    return hash_bytes(json.dumps(value, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+
+
+class BuildCache:
+    """Manifest of input hashes per generated output"""
+
+    def __init__(self, base_dir, force=False):
+        self.base_dir = Path(base_dir)
+        self.manifest_path = self.base_dir / MANIFEST_NAME
+        self.force = force
+        self.dirty = False
+        self._file_hashes = {}
+
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+
+    def _key(self, path):
+        """Manifest key for a path: POSIX path relative to the repository root"""
+        path = Path(path)
+        try:
+            return path.resolve().relative_to(self.base_dir.resolve()).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+    def _hash_file(self, path):
+        """Hash a file once per run unless it changed on disk in between"""
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        if key not in self._file_hashes:
+            self._file_hashes[key] = hash_file(path)
+        return self._file_hashes[key]
+
+    def fingerprint(self, inputs):
+        """Map every input to its current hash"""
+        hashes = {}
+        for item in inputs:
+            if isinstance(item, tuple):
+                label, value = item
+                hashes[label] = hash_data(value)
+            else:
+                hashes[self._key(item)] = self._hash_file(item)
+        return hashes
+
+    def is_current(self, output_path, inputs):
+        """True if the output exists unchanged and was built from these exact inputs"""
+        if self.force:
+            return False
+        entry = self.entries.get(self._key(output_path))
+        if not entry:
+            return False
+        if entry.get('inputs') != self.fingerprint(inputs):
+            return False
+        return entry.get('output') is not None and entry.get('output') == self._hash_file(output_path)
+
+    def record(self, output_path, inputs):
+        """Remember the inputs a freshly built output was generated from"""
+        self.entries[self._key(output_path)] = {
+            'inputs': self.fingerprint(inputs),
+            'output': self._hash_file(output_path),
+        }
+        self.dirty = True
+
+    def save(self):
+        """Write the manifest back if anything was recorded"""
+        if not self.dirty:
+            return
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+            f.write('\n')
+        self.dirty = False
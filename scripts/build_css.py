@@ -0,0 +1,736 @@
+#!/usr/bin/env python3
+"""
+Static Tailwind Build
+Replaces the in-browser Tailwind compiler (cdn.tailwindcss.com?plugins=typography
+plus an inline tailwind.config) with one static stylesheet built from the classes
+the pages actually use.
+
+The stage:
+- scans the class attributes of every page that uses Tailwind, and the markup
+  built by the scripts in js/
+- resolves each class against the subset of Tailwind the course uses: spacing,
+  sizing, layout, colors (with /opacity and [var(--x)] values), type, borders,
+  effects and transitions, with the hover:, group-hover:, dark: (class
+  strategy), sm:/md:/lg: and ! variants
+- writes preflight, the prose component (typography plugin defaults merged with
+  the course's tailwind.config) and the resolved utilities to
+  css/tailwind.<hash>.css, removing older builds
+- replaces the CDN script and tailwind.config in each page with a link to the
+  stylesheet (or updates the link on later runs)
+- reports classes that are neither Tailwind utilities it knows nor defined by
+  any page or css/ stylesheet, so typos and unsupported utilities show up.
+  Hooks for scripts and code highlighting (HOOK_CLASSES, Pygments token
+  classes, language-*) are not reported.
+
+    python scripts/build_css.py            # build and relink the pages
+    python scripts/build_css.py --check    # only report unresolved classes,
+                                           # exit status 1 if there are any
+"""
+
+from pathlib import Path
+import argparse
+import os
+import re
+import sys
+
+from build_cache import hash_bytes
+from output_writer import summary, write_if_changed
+
+CDN_SCRIPT = re.compile(r'<script src="https://cdn\.tailwindcss\.com[^"]*"></script>')
+TAILWIND_CONFIG = re.compile(r'(?:\r?\n)?[ \t]*<script>\s*tailwind\.config\s*=.*?</script>', re.S)
+# Either attribute order: the notes pipeline re-serialises pages with BeautifulSoup,
+# which writes href before rel and closes the tag with "/>"
+STYLESHEET_LINK = re.compile(r'(<link (?:rel="stylesheet" )?href=")[^"]*css/tailwind\.[0-9a-f]{10}\.css("(?: rel="stylesheet")?/?>)')
+CLASS_ATTRIBUTE = re.compile(r'''\bclass(?:Name)?\s*=\s*(?:"([^"]*)"|'([^']*)'|`([^`]*)`)''')
+CLASS_LIST_CALL = re.compile(r'classList\.(?:add|remove|toggle)\(([^)]*)\)')
+TEMPLATE_EXPRESSION = re.compile(r'\$\{[^}]*\}')
+STYLE_BLOCK = re.compile(r'<style[^>]*>(.*?)</style>', re.S)
+CSS_CLASS = re.compile(r'\.([A-Za-z_][\w-]*)')
+
+# Classes that select elements for scripts or mark page structure, with no style of their own
+HOOK_CLASSES = {"chapter-navigation", "letter-section", "option-btn", "input-group"}
+# Pygments token classes inside highlighted code blocks, e.g. nt, s-Atom, l-Scalar-Plain
+PYGMENTS_TOKEN = re.compile(r'[a-z]{1,3}(?:-[A-Z][A-Za-z]*)*')
+# Code block language markers read by the highlighter, e.g. language-bash
+LANGUAGE_CLASS = re.compile(r'language-[\w+-]+')
+# Scripts in js/ that no page loads (the quiz pages use quiz_runtime.js)
+UNLOADED_SCRIPTS = {"quiz_app.js"}
+
+FONT_SANS = "Inter, sans-serif"
+FONT_MONO = ('ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", '
+             '"Courier New", monospace')
+
+BREAKPOINTS = {"sm": "640px", "md": "768px", "lg": "1024px"}
+
+PALETTE = {
+    "gray": ["#f9fafb", "#f3f4f6", "#e5e7eb", "#d1d5db", "#9ca3af",
+             "#6b7280", "#4b5563", "#374151", "#1f2937", "#111827"],
+    "slate": ["#f8fafc", "#f1f5f9", "#e2e8f0", "#cbd5e1", "#94a3b8",
+              "#64748b", "#475569", "#334155", "#1e293b", "#0f172a"],
+    "blue": ["#eff6ff", "#dbeafe", "#bfdbfe", "#93c5fd", "#60a5fa",
+             "#3b82f6", "#2563eb", "#1d4ed8", "#1e40af", "#1e3a8a"],
+    "sky": ["#f0f9ff", "#e0f2fe", "#bae6fd", "#7dd3fc", "#38bdf8",
+            "#0ea5e9", "#0284c7", "#0369a1", "#075985", "#0c4a6e"],
+    "green": ["#f0fdf4", "#dcfce7", "#bbf7d0", "#86efac", "#4ade80",
+              "#22c55e", "#16a34a", "#15803d", "#166534", "#14532d"],
+    "yellow": ["#fefce8", "#fef9c3", "#fef08a", "#fde047", "#facc15",
+               "#eab308", "#ca8a04", "#a16207", "#854d0e", "#713f12"],
+    "red": ["#fef2f2", "#fee2e2", "#fecaca", "#fca5a5", "#f87171",
+            "#ef4444", "#dc2626", "#b91c1c", "#991b1b", "#7f1d1d"],
+}
+SHADES = ["50", "100", "200", "300", "400", "500", "600", "700", "800", "900"]
+COLORS = {f"{name}-{shade}": value
+          for name, values in PALETTE.items() for shade, value in zip(SHADES, values)}
+# tailwind.config theme.extend.colors
+COLORS.update({"white": "#ffffff", "black": "#000000", "primary": "#002F6E",
+               "secondary": "#6c757d", "codebg": "var(--bg-code)"})
+KEYWORD_COLORS = {"current": "currentColor", "transparent": "transparent", "inherit": "inherit"}
+
+FONT_SIZES = {
+    "xs": ("0.75rem", "1rem"), "sm": ("0.875rem", "1.25rem"), "base": ("1rem", "1.5rem"),
+    "lg": ("1.125rem", "1.75rem"), "xl": ("1.25rem", "1.75rem"), "2xl": ("1.5rem", "2rem"),
+    "3xl": ("1.875rem", "2.25rem"), "4xl": ("2.25rem", "2.5rem"), "5xl": ("3rem", "1"),
+}
+MAX_WIDTHS = {
+    "none": "none", "xs": "20rem", "sm": "24rem", "md": "28rem", "lg": "32rem", "xl": "36rem",
+    "2xl": "42rem", "3xl": "48rem", "4xl": "56rem", "5xl": "64rem", "6xl": "72rem",
+    "7xl": "80rem", "full": "100%", "prose": "65ch",
+}
+RADII = {"": "0.25rem", "none": "0px", "sm": "0.125rem", "md": "0.375rem", "lg": "0.5rem",
+         "xl": "0.75rem", "2xl": "1rem", "full": "9999px"}
+SHADOWS = {
+    "sm": "0 1px 2px 0 rgb(0 0 0 / 0.05)",
+    "": "0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)",
+    "md": "0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)",
+    "lg": "0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)",
+    "xl": "0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)",
+    "none": "0 0 #0000",
+}
+BLURS = {"sm": "4px", "": "8px", "md": "12px", "lg": "16px", "xl": "24px"}
+EASING = "cubic-bezier(0.4, 0, 0.2, 1)"
+TRANSITIONS = {
+    "": "color, background-color, border-color, text-decoration-color, fill, stroke, "
+        "opacity, box-shadow, transform, filter, backdrop-filter",
+    "all": "all",
+    "colors": "color, background-color, border-color, text-decoration-color, fill, stroke",
+    "opacity": "opacity",
+    "shadow": "box-shadow",
+    "transform": "transform",
+}
+TRANSFORM = "translate(var(--tw-translate-x), var(--tw-translate-y))"
+
+PREFLIGHT = f"""*, ::before, ::after {{ box-sizing: border-box; border-width: 0; border-style: solid; border-color: #e5e7eb; --tw-translate-x: 0; --tw-translate-y: 0; }}
+::before, ::after {{ --tw-content: ''; }}
+html, :host {{ line-height: 1.5; -webkit-text-size-adjust: 100%; -moz-tab-size: 4; tab-size: 4; font-family: {FONT_SANS}; -webkit-tap-highlight-color: transparent; }}
+body {{ margin: 0; line-height: inherit; }}
+hr {{ height: 0; color: inherit; border-top-width: 1px; }}
+abbr:where([title]) {{ text-decoration: underline dotted; }}
+h1, h2, h3, h4, h5, h6 {{ font-size: inherit; font-weight: inherit; }}
+a {{ color: inherit; text-decoration: inherit; }}
+b, strong {{ font-weight: bolder; }}
+code, kbd, samp, pre {{ font-family: {FONT_MONO}; font-size: 1em; }}
+small {{ font-size: 80%; }}
+sub, sup {{ font-size: 75%; line-height: 0; position: relative; vertical-align: baseline; }}
+sub {{ bottom: -0.25em; }}
+sup {{ top: -0.5em; }}
+table {{ text-indent: 0; border-color: inherit; border-collapse: collapse; }}
+button, input, optgroup, select, textarea {{ font-family: inherit; font-size: 100%; font-weight: inherit; line-height: inherit; letter-spacing: inherit; color: inherit; margin: 0; padding: 0; }}
+button, select {{ text-transform: none; }}
+button, input:where([type='button']), input:where([type='reset']), input:where([type='submit']) {{ -webkit-appearance: button; background-color: transparent; background-image: none; }}
+:-moz-focusring {{ outline: auto; }}
+:-moz-ui-invalid {{ box-shadow: none; }}
+progress {{ vertical-align: baseline; }}
+::-webkit-inner-spin-button, ::-webkit-outer-spin-button {{ height: auto; }}
+[type='search'] {{ -webkit-appearance: textfield; outline-offset: -2px; }}
+::-webkit-search-decoration {{ -webkit-appearance: none; }}
+::-webkit-file-upload-button {{ -webkit-appearance: button; font: inherit; }}
+summary {{ display: list-item; }}
+blockquote, dl, dd, h1, h2, h3, h4, h5, h6, hr, figure, p, pre {{ margin: 0; }}
+fieldset {{ margin: 0; padding: 0; }}
+legend {{ padding: 0; }}
+ol, ul, menu {{ list-style: none; margin: 0; padding: 0; }}
+dialog {{ padding: 0; }}
+textarea {{ resize: vertical; }}
+input::placeholder, textarea::placeholder {{ opacity: 1; color: #9ca3af; }}
+button, [role="button"] {{ cursor: pointer; }}
+:disabled {{ cursor: default; }}
+img, svg, video, canvas, audio, iframe, embed, object {{ display: block; vertical-align: middle; }}
+img, video {{ max-width: 100%; height: auto; }}
+[hidden] {{ display: none; }}
+"""
+
+# Typography plugin (prose) defaults: (selector inside .prose, declarations).
+# "" is the .prose element itself; selectors starting with ">" are direct children.
+PROSE_DEFAULT = [
+    ("", {"color": "var(--tw-prose-body)", "max-width": "65ch", "font-size": "1rem", "line-height": "1.75",
+          "--tw-prose-body": "#374151", "--tw-prose-headings": "#111827", "--tw-prose-lead": "#4b5563",
+          "--tw-prose-links": "#111827", "--tw-prose-bold": "#111827", "--tw-prose-counters": "#6b7280",
+          "--tw-prose-bullets": "#d1d5db", "--tw-prose-hr": "#e5e7eb", "--tw-prose-quotes": "#111827",
+          "--tw-prose-quote-borders": "#e5e7eb", "--tw-prose-captions": "#6b7280",
+          "--tw-prose-code": "#111827", "--tw-prose-pre-code": "#e5e7eb", "--tw-prose-pre-bg": "#1f2937",
+          "--tw-prose-th-borders": "#d1d5db", "--tw-prose-td-borders": "#e5e7eb"}),
+    ("p", {"margin-top": "1.25em", "margin-bottom": "1.25em"}),
+    ("a", {"color": "var(--tw-prose-links)", "text-decoration": "underline", "font-weight": "500"}),
+    ("strong", {"color": "var(--tw-prose-bold)", "font-weight": "600"}),
+    ("a strong, blockquote strong, thead th strong", {"color": "inherit"}),
+    ("ol", {"list-style-type": "decimal", "margin-top": "1.25em", "margin-bottom": "1.25em",
+            "padding-left": "1.625em"}),
+    ("ul", {"list-style-type": "disc", "margin-top": "1.25em", "margin-bottom": "1.25em",
+            "padding-left": "1.625em"}),
+    ("ol > li::marker", {"font-weight": "400", "color": "var(--tw-prose-counters)"}),
+    ("ul > li::marker", {"color": "var(--tw-prose-bullets)"}),
+    ("li", {"margin-top": "0.5em", "margin-bottom": "0.5em"}),
+    ("ol > li, ul > li", {"padding-left": "0.375em"}),
+    ("ul ul, ul ol, ol ul, ol ol", {"margin-top": "0.75em", "margin-bottom": "0.75em"}),
+    ("dt", {"color": "var(--tw-prose-headings)", "font-weight": "600", "margin-top": "1.25em"}),
+    ("dd", {"margin-top": "0.5em", "padding-left": "1.625em"}),
+    ("hr", {"border-color": "var(--tw-prose-hr)", "border-top-width": "1px",
+            "margin-top": "3em", "margin-bottom": "3em"}),
+    ("blockquote", {"font-weight": "500", "font-style": "italic", "color": "var(--tw-prose-quotes)",
+                    "border-left-width": "0.25rem", "border-left-color": "var(--tw-prose-quote-borders)",
+                    "quotes": '"\\201C""\\201D""\\2018""\\2019"', "margin-top": "1.6em",
+                    "margin-bottom": "1.6em", "padding-left": "1em"}),
+    ("blockquote p:first-of-type::before", {"content": "open-quote"}),
+    ("blockquote p:last-of-type::after", {"content": "close-quote"}),
+    ("h1", {"color": "var(--tw-prose-headings)", "font-weight": "800", "font-size": "2.25em",
+            "margin-top": "0", "margin-bottom": "0.8888889em", "line-height": "1.1111111"}),
+    ("h2", {"color": "var(--tw-prose-headings)", "font-weight": "700", "font-size": "1.5em",
+            "margin-top": "2em", "margin-bottom": "1em", "line-height": "1.3333333"}),
+    ("h3", {"color": "var(--tw-prose-headings)", "font-weight": "600", "font-size": "1.25em",
+            "margin-top": "1.6em", "margin-bottom": "0.6em", "line-height": "1.6"}),
+    ("h4", {"color": "var(--tw-prose-headings)", "font-weight": "600", "margin-top": "1.5em",
+            "margin-bottom": "0.5em", "line-height": "1.5"}),
+    ("h1 strong", {"font-weight": "900", "color": "inherit"}),
+    ("h2 strong", {"font-weight": "800", "color": "inherit"}),
+    ("h3 strong, h4 strong", {"font-weight": "700", "color": "inherit"}),
+    ("img, video, figure", {"margin-top": "2em", "margin-bottom": "2em"}),
+    ("figure > *", {"margin-top": "0", "margin-bottom": "0"}),
+    ("figcaption", {"color": "var(--tw-prose-captions)", "font-size": "0.875em", "line-height": "1.4285714",
+                    "margin-top": "0.8571429em"}),
+    ("code", {"color": "var(--tw-prose-code)", "font-weight": "600", "font-size": "0.875em"}),
+    ("code::before", {"content": '"`"'}),
+    ("code::after", {"content": '"`"'}),
+    ("a code, h1 code, h2 code, h3 code, h4 code, blockquote code, thead th code", {"color": "inherit"}),
+    ("pre", {"color": "var(--tw-prose-pre-code)", "background-color": "var(--tw-prose-pre-bg)",
+             "overflow-x": "auto", "font-weight": "400", "font-size": "0.875em", "line-height": "1.7142857",
+             "margin-top": "1.7142857em", "margin-bottom": "1.7142857em", "border-radius": "0.375rem",
+             "padding": "0.8571429em 1.1428571em"}),
+    ("pre code", {"background-color": "transparent", "border-width": "0", "border-radius": "0",
+                  "padding": "0", "font-weight": "inherit", "color": "inherit", "font-size": "inherit",
+                  "font-family": "inherit", "line-height": "inherit"}),
+    ("pre code::before, pre code::after", {"content": "none"}),
+    ("table", {"width": "100%", "table-layout": "auto", "text-align": "left", "margin-top": "2em",
+               "margin-bottom": "2em", "font-size": "0.875em", "line-height": "1.7142857"}),
+    ("thead", {"border-bottom-width": "1px", "border-bottom-color": "var(--tw-prose-th-borders)"}),
+    ("thead th", {"color": "var(--tw-prose-headings)", "font-weight": "600", "vertical-align": "bottom",
+                  "padding-right": "0.5714286em", "padding-bottom": "0.5714286em",
+                  "padding-left": "0.5714286em"}),
+    ("thead th:first-child", {"padding-left": "0"}),
+    ("thead th:last-child", {"padding-right": "0"}),
+    ("tbody tr", {"border-bottom-width": "1px", "border-bottom-color": "var(--tw-prose-td-borders)"}),
+    ("tbody tr:last-child", {"border-bottom-width": "0"}),
+    ("tbody td", {"vertical-align": "baseline"}),
+    ("tbody td, tfoot td", {"padding": "0.5714286em"}),
+    ("tbody td:first-child, tfoot td:first-child", {"padding-left": "0"}),
+    ("tbody td:last-child, tfoot td:last-child", {"padding-right": "0"}),
+    ("hr + *, h2 + *, h3 + *, h4 + *", {"margin-top": "0"}),
+    ("> :first-child", {"margin-top": "0"}),
+    ("> :last-child", {"margin-bottom": "0"}),
+]
+
+# theme.extend.typography.DEFAULT.css from the course's tailwind.config, applied
+# over the defaults (for a key given twice in the config the last one wins)
+PROSE_THEME = [
+    ("", {"max-width": "100%", "font-family": FONT_SANS, "color": "var(--text-body)",
+          "--tw-prose-body": "var(--text-body)", "--tw-prose-headings": "var(--text-headings)",
+          "--tw-prose-links": "var(--text-link)", "--tw-prose-bold": "var(--text-headings)",
+          "--tw-prose-counters": "var(--text-body)", "--tw-prose-bullets": "var(--text-body)",
+          "--tw-prose-hr": "var(--border-color)", "--tw-prose-quotes": "var(--text-body)",
+          "--tw-prose-code": "var(--text-code)", "--tw-prose-pre-code": "var(--text-pre)",
+          "--tw-prose-pre-bg": "var(--bg-pre)"}),
+    ("img", {"display": "block", "margin-left": "auto", "margin-right": "auto", "max-height": "500px",
+             "width": "auto", "height": "auto", "border-radius": "0.5rem",
+             "box-shadow": "0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)"}),
+    ("a", {"color": "var(--text-link)"}),
+    ("a:hover", {"opacity": "0.8"}),
+    ("code", {"color": "var(--text-code)", "background-color": "var(--bg-code)", "padding": "0.2rem 0.4rem",
+              "border-radius": "0.25rem", "font-weight": "600", "border": "1px solid var(--border-code)"}),
+    ("code::before", {"content": '""'}),
+    ("code::after", {"content": '""'}),
+    ("pre", {"background-color": "var(--bg-pre) !important", "color": "var(--text-pre)", "padding": "1rem",
+             "border-radius": "0.5rem", "border": "1px solid var(--border-pre)"}),
+    ("blockquote", {"border-left-color": "#002F6E", "border-left-width": "4px",
+                    "background-color": "var(--bg-note)", "padding": "1rem", "color": "var(--text-body)",
+                    "font-size": "0.9rem", "font-style": "italic", "quotes": "none",
+                    "border-radius": "0 0.5rem 0.5rem 0"}),
+    ("blockquote p:first-of-type::before", {"content": "none"}),
+    ("blockquote p:last-of-type::after", {"content": "none"}),
+    ("table", {"width": "100%", "margin-top": "2em", "margin-bottom": "2em", "border-collapse": "collapse",
+               "font-size": "0.9rem"}),
+    ("tbody tr:hover", {"background-color": "#f9fafb"}),
+    (".task-list-item", {"list-style-type": "none"}),
+    ('.task-list-item input[type="checkbox"]', {"margin-right": "0.5rem"}),
+    ("thead", {"border-bottom-width": "2px", "border-bottom-color": "var(--border-color)"}),
+    ("thead th", {"color": "var(--text-headings)", "font-weight": "600", "vertical-align": "bottom",
+                  "padding-right": "0.75em", "padding-bottom": "0.75em", "padding-left": "0.75em",
+                  "text-align": "left"}),
+    ("tbody tr", {"border-bottom-width": "1px", "border-bottom-color": "var(--border-color)"}),
+    ("tbody tr:last-child", {"border-bottom-width": "0"}),
+    ("tbody td", {"vertical-align": "top", "padding": "0.75em"}),
+]
+
+# prose-lg size modifier
+PROSE_LG = [
+    ("", {"font-size": "1.125rem", "line-height": "1.7777778"}),
+    ("p", {"margin-top": "1.3333333em", "margin-bottom": "1.3333333em"}),
+    ("blockquote", {"margin-top": "1.6666667em", "margin-bottom": "1.6666667em", "padding-left": "1em"}),
+    ("h1", {"font-size": "2.6666667em", "margin-top": "0", "margin-bottom": "0.8333333em", "line-height": "1"}),
+    ("h2", {"font-size": "1.6666667em", "margin-top": "1.8666667em", "margin-bottom": "1.0666667em",
+            "line-height": "1.3333333"}),
+    ("h3", {"font-size": "1.3333333em", "margin-top": "1.6666667em", "margin-bottom": "0.6666667em",
+            "line-height": "1.5"}),
+    ("h4", {"margin-top": "1.7777778em", "margin-bottom": "0.4444444em", "line-height": "1.5555556"}),
+    ("img, video, figure", {"margin-top": "1.7777778em", "margin-bottom": "1.7777778em"}),
+    ("figure > *", {"margin-top": "0", "margin-bottom": "0"}),
+    ("code", {"font-size": "0.8888889em"}),
+    ("pre", {"font-size": "0.8888889em", "line-height": "1.75", "margin-top": "2em", "margin-bottom": "2em",
+             "border-radius": "0.375rem", "padding": "1em 1.5em"}),
+    ("ol, ul", {"margin-top": "1.3333333em", "margin-bottom": "1.3333333em", "padding-left": "1.5555556em"}),
+    ("li", {"margin-top": "0.6666667em", "margin-bottom": "0.6666667em"}),
+    ("ol > li, ul > li", {"padding-left": "0.4444444em"}),
+    ("hr", {"margin-top": "3.1111111em", "margin-bottom": "3.1111111em"}),
+    ("hr + *, h2 + *, h3 + *, h4 + *", {"margin-top": "0"}),
+    ("table", {"font-size": "0.8888889em", "line-height": "1.5"}),
+    ("thead th", {"padding-right": "0.75em", "padding-bottom": "0.75em", "padding-left": "0.75em"}),
+    ("tbody td, tfoot td", {"padding": "0.75em"}),
+    ("> :first-child", {"margin-top": "0"}),
+    ("> :last-child", {"margin-bottom": "0"}),
+]
+
+PROSE_SELECTOR_PART = re.compile(r'^(?P<element>[^:]*?)(?P<pseudo>(?::[\w-]+(?:\([^)]*\))?)*(?:::[\w-]+)?)$')
+
+STATIC_UTILITIES = {
+    "fixed": {"position": "fixed"}, "absolute": {"position": "absolute"},
+    "relative": {"position": "relative"}, "sticky": {"position": "sticky"},
+    "block": {"display": "block"}, "inline-block": {"display": "inline-block"},
+    "inline": {"display": "inline"}, "flex": {"display": "flex"}, "inline-flex": {"display": "inline-flex"},
+    "grid": {"display": "grid"}, "hidden": {"display": "none"},
+    "invisible": {"visibility": "hidden"}, "visible": {"visibility": "visible"},
+    "flex-1": {"flex": "1 1 0%"}, "flex-auto": {"flex": "1 1 auto"}, "flex-none": {"flex": "none"},
+    "flex-shrink-0": {"flex-shrink": "0"}, "shrink-0": {"flex-shrink": "0"},
+    "transform": {"transform": TRANSFORM},
+    "cursor-pointer": {"cursor": "pointer"}, "cursor-not-allowed": {"cursor": "not-allowed"},
+    "flex-row": {"flex-direction": "row"}, "flex-col": {"flex-direction": "column"},
+    "flex-wrap": {"flex-wrap": "wrap"},
+    "items-start": {"align-items": "flex-start"}, "items-end": {"align-items": "flex-end"},
+    "items-center": {"align-items": "center"}, "items-stretch": {"align-items": "stretch"},
+    "justify-start": {"justify-content": "flex-start"}, "justify-end": {"justify-content": "flex-end"},
+    "justify-center": {"justify-content": "center"}, "justify-between": {"justify-content": "space-between"},
+    "overflow-hidden": {"overflow": "hidden"}, "overflow-auto": {"overflow": "auto"},
+    "overflow-x-auto": {"overflow-x": "auto"},
+    "object-contain": {"object-fit": "contain"}, "object-cover": {"object-fit": "cover"},
+    "text-left": {"text-align": "left"}, "text-center": {"text-align": "center"},
+    "text-right": {"text-align": "right"},
+    "font-sans": {"font-family": FONT_SANS}, "font-mono": {"font-family": FONT_MONO},
+    "font-light": {"font-weight": "300"}, "font-normal": {"font-weight": "400"},
+    "font-medium": {"font-weight": "500"}, "font-semibold": {"font-weight": "600"},
+    "font-bold": {"font-weight": "700"}, "font-extrabold": {"font-weight": "800"},
+    "uppercase": {"text-transform": "uppercase"}, "italic": {"font-style": "italic"},
+    "leading-none": {"line-height": "1"}, "leading-tight": {"line-height": "1.25"},
+    "leading-snug": {"line-height": "1.375"}, "leading-normal": {"line-height": "1.5"},
+    "leading-relaxed": {"line-height": "1.625"},
+    "tracking-tight": {"letter-spacing": "-0.025em"}, "tracking-wide": {"letter-spacing": "0.025em"},
+    "tracking-wider": {"letter-spacing": "0.05em"},
+    "underline": {"text-decoration-line": "underline"}, "no-underline": {"text-decoration-line": "none"},
+    "fill-current": {"fill": "currentColor"},
+    "grayscale": {"filter": "grayscale(100%)"},
+    "ease-in": {"transition-timing-function": "cubic-bezier(0.4, 0, 1, 1)"},
+    "ease-out": {"transition-timing-function": "cubic-bezier(0, 0, 0.2, 1)"},
+    "ease-in-out": {"transition-timing-function": EASING},
+    # Variant marker only (group-hover:)
+    "group": {},
+}
+
+SIDES = {"": ("",), "x": ("-left", "-right"), "y": ("-top", "-bottom"),
+         "t": ("-top",), "b": ("-bottom",), "l": ("-left",), "r": ("-right",)}
+
+
+def spacing(value):
+    """Spacing scale value: 4 -> 1rem, 0.5 -> 0.125rem, px -> 1px"""
+    if value == "px":
+        return "1px"
+    if value == "0":
+        return "0px"
+    if not re.fullmatch(r"\d+(\.5)?", value):
+        return None
+    return f"{float(value) / 4:g}rem"
+
+
+def size(value):
+    """Width/height value: spacing scale plus full, screen, auto and fractions"""
+    keywords = {"full": "100%", "auto": "auto", "screen": "100vh", "min": "min-content",
+                "max": "max-content", "fit": "fit-content"}
+    if value in keywords:
+        return keywords[value]
+    fraction = re.fullmatch(r"(\d+)/(\d+)", value)
+    if fraction:
+        return f"{int(fraction.group(1)) / int(fraction.group(2)) * 100:g}%"
+    return spacing(value)
+
+
+def color(value):
+    """Color utility value: palette-shade, theme color, keyword or [arbitrary], with optional /opacity"""
+    base, _, opacity = value.partition("/")
+    if base.startswith("[") and base.endswith("]"):
+        resolved = base[1:-1].replace("_", " ")
+    else:
+        resolved = COLORS.get(base) or KEYWORD_COLORS.get(base)
+    if resolved is None or (opacity and not opacity.isdigit()):
+        return None
+    if not opacity:
+        return resolved
+    if resolved.startswith("#") and len(resolved) == 7:
+        red, green, blue = (int(resolved[i:i + 2], 16) for i in (1, 3, 5))
+        return f"rgb({red} {green} {blue} / {int(opacity) / 100:g})"
+    return f"color-mix(in srgb, {resolved} {opacity}%, transparent)"
+
+
+def resolve_utility(name):
+    """Return (rank, declarations) for a Tailwind utility without variants, or None.
+
+    The rank follows Tailwind's plugin order so conflicting utilities cascade
+    the same way they did with the CDN build.
+    """
+    if name in STATIC_UTILITIES:
+        return PLUGIN_ORDER.index("static"), STATIC_UTILITIES[name]
+
+    for plugin, pattern, resolve in PLUGINS:
+        match = pattern.fullmatch(name)
+        if match:
+            declarations = resolve(*match.groups())
+            if declarations:
+                return PLUGIN_ORDER.index(plugin), declarations
+    return None
+
+
+def _box(prop):
+    def resolve(side, value):
+        negative = value.startswith("-")
+        if prop == "margin" and value == "auto":
+            amount = "auto"
+        else:
+            amount = spacing(value.lstrip("-"))
+        if amount is None or (negative and prop != "margin"):
+            return None
+        if negative:
+            amount = f"-{amount}"
+        return {f"{prop}{suffix}": amount for suffix in SIDES[side]}
+    return resolve
+
+
+def _inset(side, value):
+    amount = size(value)
+    return {side: amount} if amount else None
+
+
+def _border_width(side, width):
+    width = f"{width or 1}px"
+    return {f"border{suffix}-width": width for suffix in SIDES[side or ""]}
+
+
+def _font_size(value):
+    if value not in FONT_SIZES:
+        return None
+    font_size, line_height = FONT_SIZES[value]
+    return {"font-size": font_size, "line-height": line_height}
+
+
+def _text_color(value):
+    resolved = color(value)
+    return {"color": resolved} if resolved else None
+
+
+def _space(axis, value):
+    amount = spacing(value)
+    if amount is None:
+        return None
+    side = "left" if axis == "x" else "top"
+    return {f"margin-{side}": amount}
+
+
+def _transition(kind):
+    if kind not in TRANSITIONS:
+        return None
+    return {"transition-property": TRANSITIONS[kind], "transition-timing-function": EASING,
+            "transition-duration": "150ms"}
+
+
+PLUGINS = [
+    ("inset", re.compile(r"(top|right|bottom|left)-(.+)"), _inset),
+    ("z-index", re.compile(r"z-(\d+)"), lambda value: {"z-index": value}),
+    ("margin", re.compile(r"m([xytblr]?)-(-?[\w.]+)"), _box("margin")),
+    ("height", re.compile(r"h-(.+)"), lambda value: {"height": size(value)} if size(value) else None),
+    ("width", re.compile(r"w-(.+)"), lambda value: {"width": size(value)} if size(value) else None),
+    ("max-width", re.compile(r"max-w-(.+)"),
+     lambda value: {"max-width": MAX_WIDTHS[value]} if value in MAX_WIDTHS else None),
+    ("translate", re.compile(r"translate-([xy])-(.+)"),
+     lambda axis, value: {f"--tw-translate-{axis}": spacing(value), "transform": TRANSFORM}
+     if spacing(value) else None),
+    ("grid-cols", re.compile(r"grid-cols-(\d+)"),
+     lambda count: {"grid-template-columns": f"repeat({count}, minmax(0, 1fr))"}),
+    ("gap", re.compile(r"gap-([\w.]+)"), lambda value: {"gap": spacing(value)} if spacing(value) else None),
+    ("space", re.compile(r"space-([xy])-([\w.]+)"), _space),
+    ("border-radius", re.compile(r"rounded(?:-(\w+))?"),
+     lambda value: {"border-radius": RADII[value or ""]} if (value or "") in RADII else None),
+    ("border-width", re.compile(r"border(?:-([xytblr]))?(?:-(\d+))?"), _border_width),
+    ("border-color", re.compile(r"border-(.+)"),
+     lambda value: {"border-color": color(value)} if color(value) else None),
+    ("background-color", re.compile(r"bg-(.+)"),
+     lambda value: {"background-color": color(value)} if color(value) else None),
+    ("padding", re.compile(r"p([xytblr]?)-([\w.]+)"), _box("padding")),
+    ("font-size", re.compile(r"text-(\w+)"), _font_size),
+    ("text-color", re.compile(r"text-(.+)"), _text_color),
+    ("opacity", re.compile(r"opacity-(\d+)"), lambda value: {"opacity": f"{int(value) / 100:g}"}),
+    ("box-shadow", re.compile(r"shadow(?:-(\w+))?"),
+     lambda value: {"box-shadow": SHADOWS[value or ""]} if (value or "") in SHADOWS else None),
+    ("backdrop-blur", re.compile(r"backdrop-blur(?:-(\w+))?"),
+     lambda value: {"backdrop-filter": f"blur({BLURS[value or '']})"} if (value or "") in BLURS else None),
+    ("transition", re.compile(r"transition(?:-(\w+))?"), lambda kind: _transition(kind or "")),
+    ("duration", re.compile(r"duration-(\d+)"), lambda value: {"transition-duration": f"{value}ms"}),
+]
+
+# Utility ranks: static utilities sit with display/flex, the rest follow Tailwind's plugin order
+PLUGIN_ORDER = ["inset", "z-index", "margin", "static", "height", "width", "max-width", "translate",
+                "grid-cols", "gap", "space", "border-radius", "border-width", "border-color",
+                "background-color", "padding", "font-size", "text-color", "opacity", "box-shadow",
+                "backdrop-blur", "transition", "duration"]
+
+# Variant order inside each media block
+PSEUDO_VARIANTS = {"group-hover": 1, "hover": 2}
+DARK_RANK = 3
+
+
+def escape_class(name):
+    """Class name as a CSS selector identifier"""
+    return re.sub(r"([^A-Za-z0-9_-])", r"\\\1", name)
+
+
+def split_variants(name):
+    """'dark:hover:bg-[var(--x)]' -> (['dark', 'hover'], 'bg-[var(--x)]'), ignoring ':' inside []"""
+    parts, depth, current = [], 0, ""
+    for char in name:
+        depth += char == "["
+        depth -= char == "]"
+        if char == ":" and depth == 0:
+            parts.append(current)
+            current = ""
+        else:
+            current += char
+    return parts, current
+
+
+def declarations_css(declarations, important=False):
+    suffix = " !important" if important else ""
+    return "; ".join(f"{prop}: {value}{'' if value.endswith('!important') else suffix}"
+                     for prop, value in declarations.items())
+
+
+def prose_rules(scope, rules):
+    """Render prose rules under a scope selector (typography plugin's zero-specificity :where form)"""
+    css = []
+    for selector, declarations in rules:
+        selectors = []
+        for part in (selector.split(", ") if selector else [""]):
+            if not part:
+                selectors.append(scope)
+            elif part.startswith(">"):
+                selectors.append(f"{scope} > :where({part[1:].strip()})")
+            else:
+                match = PROSE_SELECTOR_PART.match(part)
+                selectors.append(f"{scope} :where({match.group('element')}){match.group('pseudo')}")
+        css.append(f"{', '.join(selectors)} {{ {declarations_css(declarations)}; }}")
+    return "\n".join(css)
+
+
+def class_rule(name):
+    """Resolve a class with its variants: (media, variant rank, utility rank, css) or None"""
+    variants, utility = split_variants(name)
+    important = utility.startswith("!")
+    utility = utility.lstrip("!")
+
+    media = None
+    pseudo = None
+    dark = False
+    for variant in variants:
+        if variant in BREAKPOINTS and media is None:
+            media = variant
+        elif variant == "dark" and not dark:
+            dark = True
+        elif variant in PSEUDO_VARIANTS and pseudo is None:
+            pseudo = variant
+        else:
+            return None
+
+    if utility in ("prose", "prose-lg"):
+        if pseudo or dark or important:
+            return None
+        scope = "." + escape_class(name)
+        rules = PROSE_LG if utility == "prose-lg" else PROSE_DEFAULT + PROSE_THEME
+        return media, -1, -1, prose_rules(scope, rules)
+
+    resolved = resolve_utility(utility)
+    if resolved is None:
+        return None
+    rank, declarations = resolved
+    if not declarations:
+        return media, 0, rank, ""
+
+    selector = "." + escape_class(name)
+    if pseudo == "hover":
+        selector += ":hover"
+    elif pseudo == "group-hover":
+        selector = ".group:hover " + selector
+    if dark:
+        selector = ".dark " + selector
+    if utility.startswith("space-"):
+        selector += " > :not([hidden]) ~ :not([hidden])"
+
+    variant_rank = DARK_RANK if dark else PSEUDO_VARIANTS.get(pseudo, 0)
+    return media, variant_rank, rank, f"{selector} {{ {declarations_css(declarations, important)}; }}"
+
+
+def build_stylesheet(classes):
+    """Return (css, unresolved classes) for a set of class names"""
+    rules = []
+    unresolved = set()
+    for name in sorted(classes):
+        rule = class_rule(name)
+        if rule is None:
+            unresolved.add(name)
+        elif rule[3]:
+            rules.append((name, rule))
+
+    media_order = [None] + list(BREAKPOINTS)
+    # Components (prose) come before every utility, media variants included
+    layers = [[entry for entry in rules if entry[1][2] == -1], [entry for entry in rules if entry[1][2] != -1]]
+
+    css = ["/* Generated by scripts/build_css.py - do not edit */", PREFLIGHT]
+    for layer in layers:
+        for media in media_order:
+            block = sorted((rule for rule in layer if rule[1][0] == media),
+                           key=lambda entry: (entry[1][1], entry[1][2], entry[0]))
+            if not block:
+                continue
+            body = "\n".join(rule[3] for _, rule in block)
+            if media is None:
+                css.append(body)
+            else:
+                indented = "\n".join("    " + line for line in body.splitlines())
+                css.append(f"@media (min-width: {BREAKPOINTS[media]}) {{\n{indented}\n}}")
+    return "\n".join(css) + "\n", unresolved
+
+
+def page_classes(text):
+    """Class names used in class attributes, className assignments and classList calls"""
+    classes = set()
+    for match in CLASS_ATTRIBUTE.finditer(text):
+        value = next(group for group in match.groups() if group is not None)
+        value = TEMPLATE_EXPRESSION.sub(" ", value)
+        classes.update(token for token in value.split() if "{" not in token and "}" not in token)
+    for match in CLASS_LIST_CALL.finditer(text):
+        classes.update(re.findall(r'''["']([^"'\s]+)["']''', match.group(1)))
+    return classes
+
+
+def defined_classes(text, is_css=False):
+    """Class names defined by a stylesheet or by the <style> blocks of a page"""
+    source = text if is_css else " ".join(STYLE_BLOCK.findall(text))
+    return set(CSS_CLASS.findall(source))
+
+
+def find_pages(base_dir):
+    """HTML pages using the Tailwind CDN or an earlier build of the stylesheet"""
+    pages = []
+    for path in sorted(base_dir.rglob("*.html")):
+        if ".build_cache" in path.parts:
+            continue
+        text = path.read_text(encoding="utf-8")
+        if CDN_SCRIPT.search(text) or STYLESHEET_LINK.search(text):
+            pages.append(path)
+    return pages
+
+
+def link_stylesheet(path, stylesheet):
+    """Point a page at the stylesheet instead of the CDN compiler; returns True if it changed"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+    href = Path(os.path.relpath(stylesheet, path.parent)).as_posix()
+    link = f'<link rel="stylesheet" href="{href}">'
+    updated = CDN_SCRIPT.sub(lambda match: link, text, count=1)
+    updated = TAILWIND_CONFIG.sub("", updated)
+    updated = STYLESHEET_LINK.sub(lambda match: match.group(1) + href + match.group(2), updated)
+    return write_if_changed(path, updated, newline='')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the static Tailwind stylesheet and link it from the pages.")
+    parser.add_argument("--check", action="store_true", help="Only report unresolved classes")
+    args = parser.parse_args()
+
+    base_dir = Path(__file__).parent.parent
+    css_dir = base_dir / "css"
+
+    print("=" * 70)
+    print("Building Static Tailwind Stylesheet")
+    print("=" * 70)
+    print()
+
+    pages = find_pages(base_dir)
+    sources = pages + sorted(path for path in (base_dir / "js").glob("*.js") if path.name not in UNLOADED_SCRIPTS)
+    used, defined = set(), set()
+    for path in sources:
+        text = path.read_text(encoding="utf-8")
+        used |= page_classes(text)
+        defined |= defined_classes(text)
+    for path in sorted(base_dir.rglob("*.html")) + sorted(css_dir.glob("*.css")):
+        if path.name.startswith("tailwind."):
+            continue
+        defined |= defined_classes(path.read_text(encoding="utf-8"), is_css=path.suffix == ".css")
+
+    # Classes the prose component styles itself, e.g. .task-list-item
+    defined |= set(CSS_CLASS.findall(" ".join(selector for selector, _ in PROSE_DEFAULT + PROSE_THEME)))
+
+    css, unresolved = build_stylesheet(used)
+    print(f"📄 {len(pages)} pages, {len(sources) - len(pages)} scripts scanned: "
+          f"{len(used)} classes, {len(used) - len(unresolved)} Tailwind utilities")
+    unresolved = {name for name in unresolved - defined - HOOK_CLASSES
+                  if not PYGMENTS_TOKEN.fullmatch(name) and not LANGUAGE_CLASS.fullmatch(name)}
+
+    if unresolved:
+        print(f"⚠️  {len(unresolved)} classes are neither Tailwind utilities nor defined in a stylesheet:")
+        for name in sorted(unresolved):
+            print(f"   - {name}")
+
+    if args.check:
+        if unresolved:
+            sys.exit(1)
+        print("✅ Every class resolves")
+        return
+
+    stylesheet = css_dir / f"tailwind.{hash_bytes(css.encode('utf-8'))[:10]}.css"
+    write_if_changed(stylesheet, css)
+    for stale in css_dir.glob("tailwind.*.css"):
+        if stale != stylesheet:
+            stale.unlink()
+
+    relinked = sum(link_stylesheet(page, stylesheet) for page in pages)
+
+    print()
+    print("=" * 70)
+    print(f"✅ {stylesheet.relative_to(base_dir)} ({len(css) // 1024} KB), {relinked} pages relinked")
+    print(summary())
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Check Parser Backends
+Runs the generators' parsing steps over the real course pages once per HTML
+parser backend (html_parsing.py) and compares the results with html.parser,
+the reference:
+
+- slides:       Week_X_Slides.html generated from each notes model (bytes)
+- pptx:         text parse_html_slides() takes from each slide deck
+                (skipped without python-pptx)
+- context:      course context sections of each notes model
+- glossary ids: term card ids of glossary.html after add_glossary_ids
+- pipeline:     notes after the default notes pipeline stages (bytes)
+
+A result is "identical", "equivalent" or "different". Markup that is not
+identical is equivalent when both versions give the same tree (tags,
+attributes, text and nesting) once parsed the way a browser would, with lxml's
+error recovery: html.parser keeps an <a> nested in an <a>, lxml closes the
+outer one first, as browsers do. Exits with status 1 if anything is different.
+
+    python scripts/check_parser_backends.py
+"""
+
+from pathlib import Path
+import os
+import sys
+import tempfile
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from add_glossary_ids import apply_glossary_ids
+from convert_notes_to_slides import generate_slides_html
+from generate_course_context import get_week_number, split_sections
+from html_parsing import FALLBACK_PARSER, FAST_PARSER, PARSER_ENV, PARSERS, is_available, make_soup
+from notes_model import parse_notes
+from notes_pipeline import DEFAULT_STAGES, find_notes_files, run_stages
+
+try:
+    from convert_html_to_pptx import parse_html_slides
+except ImportError:
+    parse_html_slides = None
+
+IDENTICAL = "identical"
+EQUIVALENT = "equivalent"
+DIFFERENT = "different"
+
+
+def markup_signature(html):
+    """Tags (with attributes and depth) and non-blank text of a page, as a browser-like parser sees it"""
+    signature = []
+    for node in BeautifulSoup(html, FAST_PARSER).descendants:
+        depth = sum(1 for _ in node.parents)
+        if isinstance(node, Tag):
+            attributes = tuple(sorted((key, " ".join(value) if isinstance(value, list) else value)
+                                      for key, value in node.attrs.items()))
+            signature.append((depth, node.name, attributes))
+        elif type(node) is NavigableString and node.strip():
+            signature.append((depth, " ".join(node.split())))
+    return signature
+
+
+def compare(reference, result):
+    """Outcome of comparing one backend's result with the reference"""
+    if result == reference:
+        return IDENTICAL
+    if isinstance(reference, str) and markup_signature(reference) == markup_signature(result):
+        return EQUIVALENT
+    return DIFFERENT
+
+
+def build_slides(notes_html, week_num, output_dir):
+    """Slides HTML of one week, generated into a scratch folder"""
+    notes = parse_notes(notes_html)
+    output_path = Path(output_dir) / f"Week_{week_num}_Slides.html"
+    generate_slides_html(notes.title, week_num, notes.objectives, notes.sections, output_path)
+    return output_path.read_text(encoding='utf-8')
+
+
+def collect_results(base_dir, output_dir):
+    """Everything the checks compare, for the backend currently selected"""
+    results = {}
+    for notes_path in find_notes_files(base_dir):
+        week_num = get_week_number(notes_path.name)
+        html = notes_path.read_text(encoding='utf-8')
+        results[("slides", notes_path.name)] = build_slides(html, week_num, output_dir)
+        results[("context", notes_path.name)] = split_sections(parse_notes(html), week_num)
+        results[("pipeline", notes_path.name)] = str(run_stages(html, notes_path, DEFAULT_STAGES))
+
+    if parse_html_slides is not None:
+        for slides_path in sorted(base_dir.glob("Week */Week_*_Slides.html")):
+            results[("pptx", slides_path.name)] = parse_html_slides(slides_path)
+
+    glossary_path = base_dir / "glossary.html"
+    if glossary_path.exists():
+        soup = make_soup(glossary_path.read_text(encoding='utf-8'))
+        apply_glossary_ids(soup)
+        results[("glossary ids", glossary_path.name)] = [card.get('id') for card in soup.find_all('div', class_='term-card')]
+    return results
+
+
+def main():
+    base_dir = Path(__file__).parent.parent
+    backends = [parser for parser in PARSERS if parser != FALLBACK_PARSER and is_available(parser)]
+
+    print("=" * 70)
+    print("Checking HTML Parser Backends")
+    print("=" * 70)
+    if not backends:
+        print(f"⚠️  Only {FALLBACK_PARSER} is installed, nothing to compare (pip install lxml)")
+        return
+    if parse_html_slides is None:
+        print("⚠️  python-pptx is not installed, pptx check skipped")
+    print()
+
+    previous = os.environ.get(PARSER_ENV)
+    results = {}
+    try:
+        with tempfile.TemporaryDirectory() as output_dir:
+            for parser in [FALLBACK_PARSER] + backends:
+                os.environ[PARSER_ENV] = parser
+                results[parser] = collect_results(base_dir, output_dir)
+    finally:
+        if previous is None:
+            os.environ.pop(PARSER_ENV, None)
+        else:
+            os.environ[PARSER_ENV] = previous
+
+    different = 0
+    reference = results[FALLBACK_PARSER]
+    for parser in backends:
+        outcomes = {key: compare(value, results[parser].get(key)) for key, value in reference.items()}
+        print(f"{parser} vs {FALLBACK_PARSER}:")
+        for check in dict.fromkeys(check for check, _ in outcomes):
+            counts = {outcome: sum(1 for (name, _), result in outcomes.items() if name == check and result == outcome)
+                      for outcome in (IDENTICAL, EQUIVALENT, DIFFERENT)}
+            summary = ", ".join(f"{count} {outcome}" for outcome, count in counts.items() if count)
+            print(f"  {'❌' if counts[DIFFERENT] else '✓'} {check}: {summary}")
+            for (name, page), result in outcomes.items():
+                if name == check and result == DIFFERENT:
+                    print(f"      different: {page}")
+            different += counts[DIFFERENT]
+        print()
+
+    if different:
+        print(f"❌ {different} result(s) depend on the parser backend")
+        sys.exit(1)
+    print("✅ All backends produce the same results")
+
+
+if __name__ == "__main__":
+    main()
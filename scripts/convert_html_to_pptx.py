@@ -4,26 +4,36 @@ Convert HTML Slides to PowerPoint Presentations
 Extracts content from HTML slides and creates .pptx files with custom VUT styling
 """
 
-from bs4 import BeautifulSoup
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+import argparse
+import io
 import re
 import os
+import zipfile
 from pathlib import Path
 
+from build_cache import BuildCache
+from html_parsing import make_soup, parser_name
+from notes_model import load_notes
+from output_writer import summary, write_if_changed
+import tracing
+from vut_theme import rgb
+from week_pool import run_weeks
 
-from pathlib import Path
 
+# VUT Official Brand Color Palette (defined once in vut_theme.py)
+VUT_NAVY = RGBColor(*rgb("navy"))              # Main background navy
+VUT_NAVY_DARK = RGBColor(*rgb("navy-dark"))    # Darker navy for contrast
+VUT_GOLD = RGBColor(*rgb("gold"))              # Official VUT gold
+VUT_CHARCOAL = RGBColor(*rgb("charcoal"))      # Dark gray accents
+WHITE = RGBColor(*rgb("white"))                # Text and logo
+VUT_LIGHT_GRAY = RGBColor(*rgb("light-gray"))  # Light gray for secondary text
 
-# VUT Official Brand Color Palette (from VUT slide template)
-VUT_NAVY = RGBColor(30, 58, 95)              # #1e3a5f - Main background navy
-VUT_NAVY_DARK = RGBColor(20, 42, 70)         # #142a46 - Darker navy for contrast
-VUT_GOLD = RGBColor(201, 152, 74)            # #c9984a - Official VUT gold
-VUT_CHARCOAL = RGBColor(61, 61, 61)          # #3d3d3d - Dark gray accents
-WHITE = RGBColor(255, 255, 255)              # #ffffff - Text and logo
-VUT_LIGHT_GRAY = RGBColor(200, 200, 200)     # #c8c8c8 - Light gray for secondary text
+# Timestamp given to every part of a saved presentation (the earliest a zip can hold)
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
 
 
 def set_slide_background(slide, color):
@@ -256,10 +266,12 @@ def add_code_slide(prs, title, code_text, logo_path=None):
 
 def parse_html_slides(html_path):
     """Parse HTML slides and extract content"""
-    with open(html_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+    with tracing.span("read", file=html_path) as span:
+        with open(html_path, 'r', encoding='utf-8') as f:
+            html_content = f.read()
+        span.set(bytes_in=len(html_content))
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = make_soup(html_content)
     
     # Extract week number and title from first slide
     title_slide = soup.find('div', class_='title-slide')
@@ -271,32 +283,11 @@ def parse_html_slides(html_path):
         week_num = '1'
         title = 'Presentation'
     
-    # Try to find and extract learning objectives from student notes
+    # Learning objectives come from the student notes in the same directory
     objectives = []
-    # Look for student notes file in the same directory
     student_notes_path = html_path.parent / f"Week_{week_num}_Student_Notes.html"
     if student_notes_path.exists():
-        with open(student_notes_path, 'r', encoding='utf-8') as f:
-            notes_content = f.read()
-        notes_soup = BeautifulSoup(notes_content, 'html.parser')
-        
-        # Look for learning objectives section
-        for header in notes_soup.find_all(['h2', 'h3']):
-            text = header.get_text().lower()
-            if any(keyword in text for keyword in ['learning objective', 'objectives', 'learning outcome', 'what you will learn', 'goals']):
-                # Get the next sibling content
-                next_elem = header.find_next_sibling()
-                if next_elem and next_elem.name == 'ul':
-                    for li in next_elem.find_all('li', recursive=False):
-                        obj_text = li.get_text().strip()
-                        if obj_text and len(obj_text) < 300:
-                            objectives.append(obj_text)
-                elif next_elem and next_elem.name == 'ol':
-                    for li in next_elem.find_all('li', recursive=False):
-                        obj_text = li.get_text().strip()
-                        if obj_text and len(obj_text) < 300:
-                            objectives.append(obj_text)
-                break
+        objectives = [text for text in load_notes(student_notes_path).objectives if len(text) < 300]
     
     # If no objectives found, create generic ones from main headings
     if not objectives:
@@ -381,6 +372,31 @@ def create_powerpoint(html_path, output_path, logo_path=None):
     """Create PowerPoint presentation from HTML slides"""
     week_num, title, objectives, slides_data = parse_html_slides(html_path)
     
+    with tracing.span("transform", "pptx", file=output_path):
+        prs = build_presentation(week_num, title, objectives, slides_data, logo_path)
+    
+    # Save presentation (left untouched if the deck did not change)
+    write_if_changed(output_path, presentation_bytes(prs))
+    return len(prs.slides)
+
+
+def presentation_bytes(prs):
+    """The saved .pptx, with fixed part timestamps so an unchanged deck gives the same bytes"""
+    with tracing.span("serialize", "pptx") as span:
+        saved = io.BytesIO()
+        prs.save(saved)
+        output = io.BytesIO()
+        with zipfile.ZipFile(saved) as source, zipfile.ZipFile(output, 'w') as target:
+            for info in source.infolist():
+                part = zipfile.ZipInfo(info.filename, date_time=ZIP_EPOCH)
+                part.compress_type = info.compress_type
+                target.writestr(part, source.read(info.filename))
+        span.set(bytes_out=output.tell())
+    return output.getvalue()
+
+
+def build_presentation(week_num, title, objectives, slides_data, logo_path=None):
+    """Presentation with the title, objectives, content and summary slides"""
     # Create presentation
     prs = Presentation()
     prs.slide_width = Inches(10)
@@ -420,9 +436,23 @@ def create_powerpoint(html_path, output_path, logo_path=None):
     # Add summary slide
     add_section_slide(prs, "Summary", logo_path)
     
-    # Save presentation
-    prs.save(output_path)
-    return len(prs.slides)
+    return prs
+
+
+def week_inputs(week_dir, week_num, logo_path):
+    """Files a week's PowerPoint is generated from (used by the build cache)"""
+    return [
+        week_dir / f"Week_{week_num}_Slides.html",
+        # Learning objectives are read from the student notes
+        week_dir / f"Week_{week_num}_Student_Notes.html",
+        logo_path,
+        Path(__file__),
+        Path(__file__).parent / "notes_model.py",
+        Path(__file__).parent / "vut_theme.py",
+        # Slides and notes are parsed with the selected backend
+        Path(__file__).parent / "html_parsing.py",
+        ("parser", parser_name()),
+    ]
 
 
 def process_week(week_dir, week_num, logo_path):
@@ -445,7 +475,13 @@ def process_week(week_dir, week_num, logo_path):
 
 def main():
     """Main function to process all weeks"""
+    parser = argparse.ArgumentParser(description="Convert HTML slides to PowerPoint presentations.")
+    parser.add_argument("--force", action="store_true", help="Rebuild every week even if its PowerPoint is up to date")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Number of weeks to build in parallel (default: 1)")
+    args = parser.parse_args()
+    
     base_dir = Path(__file__).parent.parent
+    cache = BuildCache(base_dir, force=args.force)
     logo_path = base_dir / "ops3_logo.png"
     
     print("=" * 70)
@@ -474,18 +510,40 @@ def main():
         ("Week 12 - Final Project and Review", 12),
     ]
     
+    # Weeks whose PowerPoint is stale get built (in parallel with --jobs), the rest are skipped
+    pending = []
+    for week_name, week_num in weeks:
+        week_dir = base_dir / week_name
+        if week_dir.exists() and not cache.is_current(week_dir / f"Week_{week_num}_Slides.pptx", week_inputs(week_dir, week_num, logo_path)):
+            pending.append((week_dir, week_num, logo_path))
+    results = run_weeks(process_week, pending, args.jobs)
+    
+    # Report in course order as results arrive
     success_count = 0
     for week_name, week_num in weeks:
         week_dir = base_dir / week_name
-        if week_dir.exists():
-            if process_week(week_dir, week_num, logo_path):
-                success_count += 1
-        else:
+        if not week_dir.exists():
             print(f"⚠️  Week {week_num}: Directory not found: {week_name}")
+            continue
+        if (week_dir, week_num, logo_path) not in pending:
+            print(f"⏭️  Week {week_num}: Up to date -> Week_{week_num}_Slides.pptx")
+            success_count += 1
+            continue
+        
+        built, output, error = next(results)
+        print(output, end='')
+        if error:
+            print(f"❌ Week {week_num}: Error creating PowerPoint\n{error}")
+        elif built:
+            cache.record(week_dir / f"Week_{week_num}_Slides.pptx", week_inputs(week_dir, week_num, logo_path))
+            success_count += 1
+    
+    cache.save()
     
     print()
     print("=" * 70)
     print(f"✅ Successfully created {success_count}/{len(weeks)} PowerPoint presentations")
+    print(summary())
     print("=" * 70)
 
 
@@ -2,86 +2,47 @@
 """
 Deep Clean corrupted glossary artifacts from HTML files.
 Targeting specific corruption where definitions leaked into text.
+
+With --stream the clean-up runs as one tag-aware streaming pass (html_stream.py):
+tooltip spans are dropped and glossary-term links unwrapped as elements, and the
+text replacements only touch text nodes, so unrelated links keep their </a>.
 """
 
 from pathlib import Path
+import argparse
 import re
 
-# Definitions to strip from text
-GLOSSARY_DEFINITIONS = [
-    "The creation of virtual versions of physical computing resources",
-    "Software that creates and manages virtual machines",
-    "A bare-metal hypervisor that runs directly on hardware",
-    "A hosted hypervisor that runs on a host OS",
-    "A software-based emulation of a physical computer",
-    "Virtual Machine - A software-based emulation of a physical computer",
-    "The operating system running inside a virtual machine",
-    "The primary OS running on physical hardware",
-    "Kernel-based Virtual Machine - A Type 1 hypervisor",
-    "Quick Emulator - Works with KVM for virtualization",
-    "Open-source virtualization platform combining KVM and LXC",
-    "Virtual CPU - Portion of physical CPU allocated to a VM",
-    "A file that appears as a physical disk to a VM",
-    "QEMU Copy-On-Write disk image format",
-    "Point-in-time copy of VM state for rollback",
-    "Moving a running VM between hosts without downtime",
-    "Pre-configured VM image for quick deployment",
-    "An exact copy of a virtual machine",
-    "Software-defined network for VM communication",
-    "Network device connecting network segments",
-    "Virtual LAN - Logical network segmentation",
-    "Network Address Translation - Maps private to public IPs",
-    "Software-Defined Networking - Software-based network control",
-    "Dynamic Host Configuration Protocol - Assigns IP addresses",
-    "Domain Name System - Translates domain names to IPs",
-    "Collection of storage resources for VMs",
-    "Advanced file system with volume management",
-    "Logical Volume Manager - Flexible disk management",
-    "Network File System - Remote file access protocol",
-    "Internet SCSI - Block storage over IP networks",
-    "Distributed storage system for object/block/file storage",
-    "Lightweight package with application code and dependencies",
-    "Platform for developing and running containers",
-    "Template for creating Docker containers",
-    "Instructions for building a Docker image",
-    "Linux Containers - OS-level virtualization",
-    "Container orchestration platform",
-    "Smallest deployable unit in Kubernetes",
-    "System design for minimal downtime (99.9%+ uptime)",
-    "High Availability - System design for minimal downtime",
-    "Group of servers working together",
-    "Minimum nodes needed for cluster to function",
-    "Cluster engine for group communication",
-    "Automatic transfer to backup on failure",
-    "Safety mechanism to isolate failed cluster nodes",
-    "Computing services delivered over the internet",
-    "Infrastructure as a Service - Virtualized computing resources",
-    "Platform as a Service - Development platform",
-    "Software as a Service - Software over the internet",
-    "OpenStack compute service for VMs",
-    "OpenStack networking service",
-    "OpenStack block storage service",
-    "OpenStack image service",
-    "OpenStack identity/authentication service",
-    "OpenStack web dashboard",
-    "Single instance serving multiple customers",
-    "Grouping of users and resources (also called Project)",
-    "VM template defining vCPUs, RAM, and disk",
-    "Application Programming Interface",
-    "RESTful web services using HTTP methods",
-    "JavaScript Object Notation - Data format",
-    "Command Line Interface",
-    "Automation tool for configuration management",
-    "Managing infrastructure through code",
-    "Infrastructure as Code",
-    "Automated coordination of systems",
-    # Specific artifacts seen in logs
-    " - A Hypervisor\"", 
-    " - Hypervisor\"", 
-    "\" Hypervisor\"",
-    "state for rollback", # Duplicate artifact
+from glossary_store import cleanup_strings
+from html_stream import DROP, UNWRAP, TagRule, rewrite_file, rewrite_html
+from output_writer import summary, write_if_changed
+from scrubber import Scrubber
+
+# Leftovers of earlier broken runs, replaced in this order
+TEXT_ARTIFACTS = [
+    (' - "', ''),
+    ('""', ''),
+    ('for virtualization for virtualization', 'for virtualization'),
+    ('  ', ' '),  # Double spaces
+    # Clean up specific recursive mess
+    ('QEMU for virtualization', 'QEMU'),
+    ('QEMU - for virtualization', 'QEMU'),
 ]
 
+_definition_scrubber = None
+
+STREAM_RULES = [
+    TagRule("span", DROP, class_name="glossary-tooltip"),
+    TagRule("a", UNWRAP, class_name="glossary-term"),
+]
+
+def get_definition_scrubber():
+    """Scrubber for every tooltip definition and known artifact, compiled on first use"""
+    global _definition_scrubber
+    if _definition_scrubber is None:
+        # Tooltip definitions and known artifacts come from the glossary store
+        _definition_scrubber = Scrubber(cleanup_strings())
+    return _definition_scrubber
+
 def deep_clean(content):
     # 1. Strip Tooltip Spans (Aggressive Loop to handle nesting)
     # Remove <span class="glossary-tooltip">...</span>
@@ -97,9 +58,8 @@ def deep_clean(content):
     # Let's simple remove the definition strings first!
     # If "QEMU<span...>Definition</span>", and we remove "Definition", we get "QEMU<span...></span>".
     
-    for definition in GLOSSARY_DEFINITIONS:
-        # Remove literal definition string
-        content = content.replace(definition, "")
+    # Remove every literal definition string in one pass
+    content = get_definition_scrubber()(content)
     
     # Now remove the empty/broken tags
     content = content.replace('<span class="glossary-tooltip"></span>', '')
@@ -120,18 +80,33 @@ def deep_clean(content):
     # Using the regex above covers valid wrappers.
     
     # Clean up lingering artifacts
-    content = content.replace(' - "', '')
-    content = content.replace('""', '')
-    content = content.replace('for virtualization for virtualization', 'for virtualization')
-    content = content.replace('  ', ' ') # Double spaces
-    
-    # Clean up specific recursive mess
-    content = content.replace('QEMU for virtualization', 'QEMU')
-    content = content.replace('QEMU - for virtualization', 'QEMU')
+    for old, new in TEXT_ARTIFACTS:
+        content = content.replace(old, new)
     
     return content
 
+def deep_clean_twice(content):
+    """Run the deep clean with a second pass for artifacts exposed by the first"""
+    return deep_clean(deep_clean(content))
+
+def clean_text_node(text):
+    """Text part of the streaming clean: leaked definitions and artifacts, twice like deep_clean_twice"""
+    for _ in range(2):
+        text = get_definition_scrubber()(text)
+        text = text.replace('class="glossary-term">', '')
+        for old, new in TEXT_ARTIFACTS:
+            text = text.replace(old, new)
+    return text
+
+def deep_clean_stream(content):
+    """Streaming variant: drop tooltip spans, unwrap glossary links, clean text nodes"""
+    return rewrite_html(content, STREAM_RULES, clean_text_node)
+
 def main():
+    parser = argparse.ArgumentParser(description="Strip leaked glossary markup and definitions from the notes.")
+    parser.add_argument("--stream", action="store_true", help="Clean in a single tag-aware streaming pass")
+    args = parser.parse_args()
+
     base_dir = Path(__file__).parent.parent
     print("=" * 70)
     print("Deep Cleaning Glossary Artifacts")
@@ -143,19 +118,20 @@ def main():
             notes_files = list(week_dir.glob("*Student_Notes.html"))
             for html_file in notes_files:
                 print(f"Cleaning: {html_file.name}")
+                if args.stream:
+                    rewrite_file(html_file, STREAM_RULES, clean_text_node)
+                    processed += 1
+                    continue
                 with open(html_file, 'r', encoding='utf-8') as f:
                     content = f.read()
                 
-                cleaned = deep_clean(content)
-                
-                # Double pass
-                cleaned = deep_clean(cleaned)
+                cleaned = deep_clean_twice(content)
                 
-                with open(html_file, 'w', encoding='utf-8') as f:
-                    f.write(cleaned)
+                write_if_changed(html_file, cleaned)
                 processed += 1
                 
     print(f"✅ Deep Cleaned {processed} files")
+    print(summary())
 
 if __name__ == "__main__":
     main()
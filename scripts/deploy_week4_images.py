@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 """
 Deploy Week 4 Images
-Moves generated images from artifacts folder to the Week 4 images directory.
+Moves generated images from artifacts folder to the Week 4 images directory,
+then runs the image optimization stage (optimize_images.py) on them.
 """
 
 import shutil
 from pathlib import Path
 import os
 
+from build_cache import BuildCache
+from optimize_images import optimize_images
+
 def deploy_images():
     # Source: Startup artifact dir (need to find it based on known paths or assume current working dir)
     # Since script runs in CWD, we look for the known artifact path structure or accept args.
@@ -48,5 +52,10 @@ def deploy_images():
         
     print("✅ Deployment Complete")
 
+    # Recompress the new images, build their responsive variants and update the pages
+    week_dir = target_dir.parent
+    base_dir = week_dir.parent
+    optimize_images(base_dir, BuildCache(base_dir), [week_dir])
+
 if __name__ == "__main__":
     deploy_images()
@@ -1,6 +1,8 @@
 import glob
 import os
 
+from output_writer import write_if_changed
+
 def fix_quiz_files():
     # Find all Week_X_Quiz.html files
     quiz_files = glob.glob("Week */Week_*_Quiz.html")
@@ -16,8 +18,7 @@ def fix_quiz_files():
             
             if target_line_part in content:
                 new_content = content.replace(target_line_part, replacement_line_part)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
+                write_if_changed(file_path, new_content)
                 print(f"✅ Fixed: {file_path}")
             else:
                 if replacement_line_part in content:
@@ -1,15 +1,66 @@
 #!/usr/bin/env python3
 """
 Generate Course Context
-Scrapes all Week_X_Student_Notes.html files, strips HTML tags, and compiles them
-into a single JavaScript file (js/course_context.js) for the AI Chatbot.
+Reads all Week_X_Student_Notes.html files (notes_model.py) and compiles them into a sectioned,
+pre-indexed context for the AI Chatbot in js/context/:
+
+- manifest.json:     tokenizer settings, BM25 statistics and section metadata
+                     (id, week, title, size)
+- index_NN.json:     one shard of the inverted index (term -> [[chunk id, term
+                     frequency]]) with the idf of its terms; a term lives in
+                     shard fnv1a(term) % INDEX_SHARDS
+- week_N.json:       the text of every section of week N, keyed by chunk id
+
+The tutor fetches the manifest on the first question, then only the index
+shards of the question's terms, ranks sections with a few dictionary lookups,
+and finally fetches the weeks holding the sections it selected. Every file is
+cached after its first fetch, so pages carry no course text until the chat is
+used.
+
+Sections are ranked with BM25. Everything except the question-dependent part
+is computed here: the inverse document frequency of every term ("idf") and the
+length norm of every section (k1 * (1 - b + b * length / avgdl)), so per term
+the runtime only evaluates idf * tf * (k1 + 1) / (tf + norm).
 """
 
-import os
 import re
 import json
+import argparse
+import math
+from collections import Counter
 from pathlib import Path
-from bs4 import BeautifulSoup
+
+from build_cache import BuildCache
+from html_parsing import parser_name
+from notes_model import load_notes
+from output_writer import summary, write_if_changed
+import tracing
+
+# Tokenizer settings, published in the bundle so ai_chat.js splits questions
+# exactly the way the index was built
+TOKEN_PATTERN = r"[a-z0-9]+"
+MIN_TOKEN_LENGTH = 3
+STOPWORDS = sorted({
+    "about", "above", "after", "again", "all", "also", "and", "any", "are", "because",
+    "been", "before", "being", "between", "both", "but", "can", "could", "did", "does",
+    "doing", "down", "during", "each", "explain", "few", "for", "from", "further", "had",
+    "has", "have", "having", "her", "here", "hers", "him", "his", "how", "into", "its",
+    "itself", "just", "more", "most", "not", "now", "off", "once", "only", "other",
+    "our", "ours", "out", "over", "own", "same", "she", "should", "some", "such", "than",
+    "that", "the", "their", "theirs", "them", "then", "there", "these", "they", "this",
+    "those", "through", "too", "under", "until", "use", "used", "using", "very", "was",
+    "were", "what", "when", "where", "which", "while", "who", "whom", "why", "will",
+    "with", "would", "you", "your", "yours",
+})
+_STOPWORD_SET = set(STOPWORDS)
+
+# Number of inverted index shards (the hash must match ai_chat.js)
+INDEX_SHARDS = 16
+
+# BM25 parameters (standard defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
 
 def clean_text(text):
     """Deep clean text to save tokens."""
@@ -22,9 +73,77 @@ def get_week_number(filename):
     match = re.search(r'Week_(\d+)_', filename)
     return int(match.group(1)) if match else 999
 
-def generate_context():
+def tokenize(text):
+    """Split text into index terms (lowercase, no short words or stopwords)."""
+    return [token for token in re.findall(TOKEN_PATTERN, text.lower())
+            if len(token) >= MIN_TOKEN_LENGTH and token not in _STOPWORD_SET]
+
+def split_sections(document, week_num):
+    """Split one week's notes model into chunks at h2/h3 boundaries.
+
+    Returns a list of {"week", "title", "text"} dicts; text before the first
+    heading becomes the week's introduction chunk.
+    """
+    sections = []
+
+    def add(title, text):
+        if text:
+            sections.append({"week": week_num, "title": title, "text": text})
+
+    add(f"Week {week_num} Introduction", document.intro)
+    for section in document.sections:
+        h2_title = clean_text(section.title)
+        add(h2_title, section.text)
+        for subsection in section.subsections:
+            heading = clean_text(subsection.title)
+            add(f"{h2_title} > {heading}" if h2_title else heading, subsection.text)
+    return sections
+
+def index_shard(term):
+    """Shard of a term: 32-bit FNV-1a hash of the term modulo INDEX_SHARDS."""
+    h = 0x811c9dc5
+    for char in term:
+        h ^= ord(char)
+        h = (h * 0x01000193) & 0xffffffff
+    return h % INDEX_SHARDS
+
+def build_index(chunks):
+    """Build the inverted index: term -> [[chunk id, term frequency], ...].
+
+    Also stores each chunk's token count as chunk["length"].
+    """
+    index = {}
+    for chunk in chunks:
+        tokens = tokenize(chunk["text"])
+        chunk["length"] = len(tokens)
+        for term, tf in Counter(tokens).items():
+            index.setdefault(term, []).append([chunk["id"], tf])
+    return dict(sorted(index.items()))
+
+def bm25_statistics(chunks, index, k1=BM25_K1, b=BM25_B):
+    """Precompute BM25 idf per term and the length norm per chunk.
+
+    Sets chunk["norm"] and returns (idf, params) for the bundle.
+    """
+    doc_count = len(chunks)
+    avgdl = sum(chunk["length"] for chunk in chunks) / doc_count if doc_count else 0.0
+
+    for chunk in chunks:
+        ratio = chunk["length"] / avgdl if avgdl else 1.0
+        chunk["norm"] = round(k1 * (1 - b + b * ratio), 4)
+
+    # Lucene's idf variant, which stays positive for terms found in most sections
+    idf = {term: round(math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5)), 4)
+           for term, postings in index.items()}
+
+    params = {"k1": k1, "b": b, "avgdl": round(avgdl, 2), "doc_count": doc_count}
+    return idf, params
+
+def generate_context(force=False):
     base_dir = Path(__file__).parent.parent
-    js_output_path = base_dir / "js" / "course_context.js"
+    context_dir = base_dir / "js" / "context"
+    manifest_path = context_dir / "manifest.json"
+    cache = BuildCache(base_dir, force=force)
     
     print(f"Scanning for Student Notes in {base_dir}...")
     
@@ -33,62 +152,99 @@ def generate_context():
     # Sort by week number
     note_files.sort(key=lambda p: get_week_number(p.name))
     
-    all_content = []
+    inputs = note_files + [Path(__file__), Path(__file__).parent / "notes_model.py",
+                           Path(__file__).parent / "html_parsing.py", ("parser", parser_name())]
+    outputs = ([manifest_path]
+               + [context_dir / f"index_{shard:02d}.json" for shard in range(INDEX_SHARDS)]
+               + [context_dir / f"week_{get_week_number(p.name)}.json" for p in note_files])
+    if all(cache.is_current(path, inputs) for path in outputs):
+        print(f"⏭️  Context up to date: {context_dir}")
+        return
+    
+    chunks = []
     
     for note_file in note_files:
         print(f"Processing {note_file.name}...")
         
         try:
-            with open(note_file, 'r', encoding='utf-8') as f:
-                soup = BeautifulSoup(f.read(), 'html.parser')
-                
-            # Extract main content (skip nav, header, footer if possible)
-            # Assuming main content is in <article> or just body
-            article = soup.find('article')
-            if not article:
-                article = soup.body
-            
-            if article:
-                # Remove scripts and styles
-                for script in article(["script", "style"]):
-                    script.decompose()
-                
-                # Get text
-                text_content = article.get_text(separator=' ')
-                cleaned_text = clean_text(text_content)
-                
-                week_num = get_week_number(note_file.name)
-                all_content.append(f"--- WEEK {week_num} NOTES ---\n{cleaned_text}")
+            # Sections of the parsed notes (scripts, chapter bar and glossary
+            # tooltip text are not part of the model)
+            week_num = get_week_number(note_file.name)
+            for section in split_sections(load_notes(note_file), week_num):
+                chunks.append({"id": len(chunks), **section})
                 
         except Exception as e:
             print(f"Error processing {note_file.name}: {e}")
 
-    # Combine all
-    full_context = "\n\n".join(all_content)
-    token_est = len(full_context) / 4
-    print(f"Total compiled characters: {len(full_context)}")
-    print(f"Estimated tokens: {int(token_est)}")
-    
-    # Escape for JS string
-    # We use json.dumps to safely escape the string
-    json_str = json.dumps(full_context)
-    
-    js_content = f"""// AUTO-GENERATED BY scripts/generate_course_context.py
-// DO NOT EDIT MANUALLY
-// Generated on: {os.popen('date').read().strip() if os.name != 'nt' else 'Now'}
+    with tracing.span("transform", "index", chunks=len(chunks)):
+        index = build_index(chunks)
+        idf, bm25 = bm25_statistics(chunks, index)
 
-const COURSE_CONTEXT = {json_str};
+    weeks = sorted({chunk["week"] for chunk in chunks})
+    manifest = {
+        "tokenizer": {
+            "pattern": TOKEN_PATTERN,
+            "min_length": MIN_TOKEN_LENGTH,
+            "stopwords": STOPWORDS,
+        },
+        "bm25": bm25,
+        "index_shards": INDEX_SHARDS,
+        "weeks": {str(week): f"week_{week}.json" for week in weeks},
+        "chunks": [
+            {
+                "id": chunk["id"],
+                "week": chunk["week"],
+                "title": chunk["title"],
+                "chars": len(chunk["text"]),
+                "length": chunk["length"],
+                "norm": chunk["norm"],
+            }
+            for chunk in chunks
+        ],
+    }
 
-if (typeof module !== 'undefined') module.exports = COURSE_CONTEXT;
-"""
+    total_chars = sum(len(chunk["text"]) for chunk in chunks)
+    print(f"Total compiled characters: {total_chars} in {len(chunks)} sections")
+    print(f"Indexed terms: {len(index)}")
+    print(f"Estimated tokens: {int(total_chars / 4)}")
 
-    # Ensure js dir exists
-    js_output_path.parent.mkdir(exist_ok=True)
-    
-    with open(js_output_path, 'w', encoding='utf-8') as f:
-        f.write(js_content)
-        
-    print(f"✅ Context generated at {js_output_path}")
+    context_dir.mkdir(parents=True, exist_ok=True)
+
+    write_if_changed(manifest_path, json.dumps(manifest, separators=(',', ':')))
+
+    shards = [{"index": {}, "idf": {}} for _ in range(INDEX_SHARDS)]
+    for term, postings in index.items():
+        shard = shards[index_shard(term)]
+        shard["index"][term] = postings
+        shard["idf"][term] = idf[term]
+    with tracing.span("serialize", "index_shards", shards=INDEX_SHARDS):
+        shard_json = [json.dumps(shard, separators=(',', ':')) for shard in shards]
+    for number, content in enumerate(shard_json):
+        write_if_changed(context_dir / f"index_{number:02d}.json", content)
+
+    for week in weeks:
+        week_path = context_dir / f"week_{week}.json"
+        week_data = {
+            "week": week,
+            "chunks": {str(chunk["id"]): chunk["text"] for chunk in chunks if chunk["week"] == week},
+        }
+        write_if_changed(week_path, json.dumps(week_data, separators=(',', ':')))
+
+    # Drop files left over from removed weeks or an older shard count
+    expected = {path.name for path in outputs}
+    for stale in context_dir.glob("*.json"):
+        if stale.name not in expected:
+            stale.unlink()
+
+    for path in outputs:
+        cache.record(path, inputs)
+    cache.save()
+
+    print(f"✅ Context generated in {context_dir} ({manifest_path.stat().st_size // 1024} KB manifest, {INDEX_SHARDS} index shards, {len(weeks)} week files)")
+    print(summary())
 
 if __name__ == "__main__":
-    generate_context()
+    parser = argparse.ArgumentParser(description="Compile the student notes into the AI tutor course context.")
+    parser.add_argument("--force", action="store_true", help="Regenerate even if the context is up to date")
+    args = parser.parse_args()
+    generate_context(force=args.force)
@@ -4,11 +4,19 @@ Generate Interactive Quizzes for OPS3 Course
 Creates VUT-themed quizzes with dynamic question generation
 """
 
+from functools import lru_cache
 from pathlib import Path
+import argparse
 import json
-import random
 import sys
 
+from build_cache import BuildCache, hash_bytes
+from quiz_bank import QuizBankError, compile_banks, compile_exam
+from icons import icon, write_sprite
+from output_writer import summary, write_if_changed
+from vut_theme import PALETTE, stylesheet_link, write_stylesheet
+import tracing
+
 # Import questions for weeks 3-12
 try:
     from quiz_questions_3_12 import WEEKS_3_12_QUESTIONS
@@ -124,299 +132,114 @@ QUIZ_QUESTIONS = {
 # Merge with weeks 3-12 questions
 QUIZ_QUESTIONS.update(WEEKS_3_12_QUESTIONS)
 
+# Cumulative exam (Week 12 folder): paper size and relative weight of each
+# glossary category when drawing questions from all weeks
+EXAM_PAPER_SIZE = 40
+EXAM_TOPIC_WEIGHTS = {
+    "Virtualization": 3,
+    "Virtual Machines": 2,
+    "Networking": 2,
+    "Storage": 2,
+    "Containers": 2,
+    "High Availability": 2,
+    "Cloud": 3,
+    "Automation": 2,
+}
+EXAM_WEEK = 12
+EXAM_STEM = "Cumulative_Exam"
+
+def payload_name(stem, payload):
+    """Content-hashed file name of a question payload, e.g. Week_3_Quiz.<hash>.json"""
+    digest = hash_bytes(payload.encode('utf-8'))[:10]
+    return f"{stem}.{digest}.json"
+
+@lru_cache(maxsize=None)
+def compiled_banks():
+    """Validate and compile every week's question bank once (raises QuizBankError)"""
+    with tracing.span("transform", "compile_banks"):
+        return compile_banks(QUIZ_QUESTIONS)
+
+def build_quiz_payload(week_num):
+    """Serialize a week's compiled question bank; returns None if the week has no questions"""
+    payload = compiled_banks().get(week_num)
+    if not payload or not payload["questions"]:
+        return None
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+
+def build_exam_payload():
+    """Serialize the cumulative exam merged from every week's compiled bank"""
+    banks = compiled_banks()
+    with tracing.span("transform", "compile_exam"):
+        payload = compile_exam(banks, EXAM_PAPER_SIZE, EXAM_TOPIC_WEIGHTS)
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+
+def write_payload(directory, stem, payload):
+    """Write a content-hashed payload and remove older versions of it; returns its file name"""
+    payload_file = payload_name(stem, payload)
+    write_if_changed(directory / payload_file, payload)
+    for stale in directory.glob(f"{stem}.*.json"):
+        if stale.name != payload_file:
+            stale.unlink()
+    return payload_file
+
 def generate_quiz_html(week_num, output_path):
-    """Generate interactive quiz HTML for a specific week"""
+    """Write a week's question payload and the thin quiz page that loads it.
     
-    questions = QUIZ_QUESTIONS.get(week_num, {})
-    if not questions:
+    The page links the shared css/vut_theme.css, css/quiz.css and
+    js/quiz_runtime.js; the questions go to Week_N_Quiz.<hash>.json next to
+    it, and payloads of older versions of the bank are removed.
+    """
+    output_path = Path(output_path)
+    payload = build_quiz_payload(week_num)
+    if payload is None:
         print(f"⚠️  No questions defined for Week {week_num}")
         return False
     
-    html = f"""<!DOCTYPE html>
+    payload_file = write_payload(output_path.parent, f"Week_{week_num}_Quiz", payload)
+    format_items = [
+        "15 randomized questions per attempt",
+        "Mix of scenarios, fill-in-blanks, and commands",
+        "New questions generated each retry",
+        "Passing score: 70%",
+    ]
+    write_if_changed(output_path, render_quiz_page(f"Week {week_num} Quiz", payload_file, format_items))
+    
+    return True
+
+def generate_exam_html(output_path):
+    """Write the cumulative exam payload and its page (same shell and runtime as the weekly quizzes)"""
+    output_path = Path(output_path)
+    payload_file = write_payload(output_path.parent, EXAM_STEM, build_exam_payload())
+    format_items = [
+        f"{EXAM_PAPER_SIZE} questions drawn from all weeks' quizzes",
+        "Topics weighted across the whole course",
+        "New questions generated each retry",
+        "Passing score: 70%",
+    ]
+    write_if_changed(output_path, render_quiz_page("Cumulative Exam", payload_file, format_items))
+
+def render_quiz_page(heading, payload_file, format_items):
+    """Thin quiz page: setup, question and results markup around the shared runtime"""
+    format_list = "\n".join(f"                    <li>{item}</li>" for item in format_items)
+    return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Week {week_num} Quiz - OPS3</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #1e3a5f 0%, #142a46 100%);
-            color: #ffffff;
-            line-height: 1.6;
-            padding: 20px;
-            min-height: 100vh;
-        }}
-        
-        .container {{
-            max-width: 900px;
-            margin: 0 auto;
-        }}
-        
-        header {{
-            text-align: center;
-            padding: 40px 20px;
-            background: rgba(30, 58, 95, 0.6);
-            border-radius: 15px;
-            margin-bottom: 30px;
-        }}
-        
-        header h1 {{
-            font-size: 2.5em;
-            color: #c9984a;
-            margin-bottom: 10px;
-        }}
-        
-        .quiz-setup {{
-            background: rgba(30, 58, 95, 0.6);
-            padding: 30px;
-            border-radius: 15px;
-            margin-bottom: 30px;
-            border: 2px solid #c9984a;
-        }}
-        
-        .quiz-setup label {{
-            display: block;
-            font-size: 1.2em;
-            color: #c9984a;
-            margin-bottom: 10px;
-        }}
-        
-        .quiz-setup select {{
-            width: 100%;
-            padding: 12px;
-            font-size: 1.1em;
-            border: 2px solid #c9984a;
-            border-radius: 8px;
-            background: rgba(255, 255, 255, 0.1);
-            color: #ffffff;
-            margin-bottom: 20px;
-        }}
-        
-        .start-btn {{
-            width: 100%;
-            padding: 15px;
-            background: #c9984a;
-            color: #1e3a5f;
-            border: none;
-            border-radius: 10px;
-            font-size: 1.2em;
-            font-weight: bold;
-            cursor: pointer;
-            transition: all 0.3s;
-        }}
-        
-        .start-btn:hover {{
-            background: #ffffff;
-            transform: scale(1.02);
-        }}
-        
-        .quiz-container {{
-            display: none;
-        }}
-        
-        .quiz-container.active {{
-            display: block;
-        }}
-        
-        .question-card {{
-            background: rgba(30, 58, 95, 0.6);
-            padding: 30px;
-            border-radius: 15px;
-            margin-bottom: 25px;
-            border-left: 5px solid #c9984a;
-        }}
-        
-        .question-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-        }}
-        
-        .question-number {{
-            background: #c9984a;
-            color: #1e3a5f;
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-weight: bold;
-        }}
-        
-        .question-type {{
-            background: rgba(201, 152, 74, 0.3);
-            padding: 6px 12px;
-            border-radius: 15px;
-            font-size: 0.9em;
-            color: #c9984a;
-        }}
-        
-        .question-text {{
-            font-size: 1.2em;
-            margin-bottom: 20px;
-            line-height: 1.6;
-        }}
-        
-        .command-prompt {{
-            background: #0f0f0f;
-            padding: 15px;
-            border-radius: 8px;
-            border-left: 4px solid #c9984a;
-            font-family: 'Courier New', monospace;
-            margin: 15px 0;
-            color: #a8dadc;
-        }}
-        
-        .options {{
-            display: flex;
-            flex-direction: column;
-            gap: 12px;
-        }}
-        
-        .option {{
-            padding: 15px 20px;
-            background: rgba(255, 255, 255, 0.05);
-            border: 2px solid rgba(201, 152, 74, 0.3);
-            border-radius: 10px;
-            cursor: pointer;
-            transition: all 0.3s;
-        }}
-        
-        .option:hover {{
-            background: rgba(201, 152, 74, 0.2);
-            border-color: #c9984a;
-            transform: translateX(5px);
-        }}
-        
-        .option.selected {{
-            background: rgba(201, 152, 74, 0.3);
-            border-color: #c9984a;
-        }}
-        
-        .option.correct {{
-            background: rgba(76, 175, 80, 0.3);
-            border-color: #4caf50;
-        }}
-        
-        .option.incorrect {{
-            background: rgba(244, 67, 54, 0.3);
-            border-color: #f44336;
-        }}
-        
-        .fill-input {{
-            width: 100%;
-            padding: 12px;
-            font-size: 1.1em;
-            border: 2px solid #c9984a;
-            border-radius: 8px;
-            background: rgba(255, 255, 255, 0.1);
-            color: #ffffff;
-            font-family: 'Courier New', monospace;
-        }}
-        
-        .explanation {{
-            margin-top: 15px;
-            padding: 15px;
-            background: rgba(201, 152, 74, 0.1);
-            border-left: 4px solid #c9984a;
-            border-radius: 5px;
-            display: none;
-        }}
-        
-        .explanation.show {{
-            display: block;
-        }}
-        
-        .explanation strong {{
-            color: #c9984a;
-        }}
-        
-        .navigation {{
-            display: flex;
-            justify-content: space-between;
-            margin-top: 30px;
-        }}
-        
-        .nav-btn {{
-            padding: 12px 30px;
-            background: rgba(201, 152, 74, 0.3);
-            color: #c9984a;
-            border: 2px solid #c9984a;
-            border-radius: 10px;
-            font-size: 1.1em;
-            cursor: pointer;
-            transition: all 0.3s;
-        }}
-        
-        .nav-btn:hover {{
-            background: #c9984a;
-            color: #1e3a5f;
-        }}
-        
-        .nav-btn:disabled {{
-            opacity: 0.3;
-            cursor: not-allowed;
-        }}
-        
-        .results {{
-            background: rgba(30, 58, 95, 0.6);
-            padding: 40px;
-            border-radius: 15px;
-            border: 3px solid #c9984a;
-            text-align: center;
-            display: none;
-        }}
-        
-        .results.show {{
-            display: block;
-        }}
-        
-        .score {{
-            font-size: 4em;
-            color: #c9984a;
-            font-weight: bold;
-            margin: 20px 0;
-        }}
-        
-        .grade {{
-            font-size: 2em;
-            margin: 20px 0;
-        }}
-        
-        .attempts-left {{
-            background: rgba(201, 152, 74, 0.2);
-            padding: 15px;
-            border-radius: 10px;
-            margin-top: 20px;
-            font-size: 1.1em;
-        }}
-        
-        @media (max-width: 768px) {{
-            header h1 {{
-                font-size: 2em;
-            }}
-            
-            .question-text {{
-                font-size: 1.1em;
-            }}
-        }}
-    </style>
+    <title>{heading} - OPS3</title>
+    {stylesheet_link("../")}
+    <link rel="stylesheet" href="../css/quiz.css">
 </head>
 <body>
     <div class="container">
         <header>
-            <h1>📝 Week {week_num} Quiz</h1>
+            <h1>{icon("file-text", 24, "inline-block mr-2", PALETTE["gold"], "../")} {heading}</h1>
             <p>OPS3 - Virtualization and Cloud Infrastructure</p>
         </header>
         
         <!-- Quiz Setup -->
         <div class="quiz-setup" id="quizSetup">
-            <h2 style="color: #c9984a; margin-bottom: 20px;">Quiz Settings</h2>
+            <h2 style="color: var(--vut-gold); margin-bottom: 20px;">Quiz Settings</h2>
             <label for="attempts">Select Maximum Attempts:</label>
             <select id="attempts">
                 <option value="1">1 Attempt</option>
@@ -424,17 +247,14 @@ def generate_quiz_html(week_num, output_path):
                 <option value="3" selected>3 Attempts (Recommended)</option>
             </select>
             
-            <div style="background: rgba(201, 152, 74, 0.1); padding: 15px; border-radius: 8px; margin-bottom: 20px;">
-                <p><strong style="color: #c9984a;">Quiz Format:</strong></p>
+            <div style="background: rgba(var(--vut-gold-rgb), 0.1); padding: 15px; border-radius: 8px; margin-bottom: 20px;">
+                <p><strong style="color: var(--vut-gold);">Quiz Format:</strong></p>
                 <ul style="margin-left: 20px; margin-top: 10px;">
-                    <li>15 randomized questions per attempt</li>
-                    <li>Mix of scenarios, fill-in-blanks, and commands</li>
-                    <li>New questions generated each retry</li>
-                    <li>Passing score: 70%</li>
+{format_list}
                 </ul>
             </div>
             
-            <button class="start-btn" onclick="startQuiz()">🚀 Start Quiz</button>
+            <button class="start-btn" onclick="startQuiz()">{icon("rocket", 20, "inline-block mr-2", PALETTE["gold"], "../")} Start Quiz</button>
         </div>
         
         <!-- Quiz Questions -->
@@ -450,316 +270,106 @@ def generate_quiz_html(week_num, output_path):
         
         <!-- Results -->
         <div class="results" id="results">
-            <h2 style="color: #c9984a;">Quiz Results</h2>
+            <h2 style="color: var(--vut-gold);">Quiz Results</h2>
             <div class="score" id="scoreDisplay"></div>
             <div class="grade" id="gradeDisplay"></div>
             <div id="attemptsInfo"></div>
-            <button class="start-btn" onclick="retryQuiz()" id="retryBtn" style="margin-top: 20px;">🔄 Retry Quiz</button>
+            <button class="start-btn" onclick="retryQuiz()" id="retryBtn" style="margin-top: 20px;">{icon("refresh", 20, "inline-block mr-2", PALETTE["blue"], "../")} Retry Quiz</button>
             <a href="../index.html" class="nav-btn" style="display: inline-block; margin-top: 20px; text-decoration: none;">← Back to Course</a>
         </div>
     </div>
     
-    <script>
-        // Quiz data will be embedded here
-        const quizData = {json.dumps(questions, indent=12)};
-        
-        let currentAttempt = 1;
-        let maxAttempts = 3;
-        let currentQuestion = 0;
-        let questions = [];
-        let userAnswers = [];
-        let score = 0;
-        
-        function generateQuestions() {{
-            questions = [];
-            userAnswers = [];
-            
-            // Get all questions and shuffle
-            let allQuestions = [];
-            
-            // Add scenario questions
-            if (quizData.scenario) {{
-                quizData.scenario.forEach(q => {{
-                    allQuestions.push({{...q, type: 'scenario'}});
-                }});
-            }}
-            
-            // Add fill-in-blank questions
-            if (quizData.fill_blank) {{
-                quizData.fill_blank.forEach(q => {{
-                    allQuestions.push({{...q, type: 'fill_blank'}});
-                }});
-            }}
-            
-            // Add command completion questions
-            if (quizData.command) {{
-                quizData.command.forEach(q => {{
-                    allQuestions.push({{...q, type: 'command'}});
-                }});
-            }}
-            
-            // Shuffle and select 15 questions
-            allQuestions = shuffleArray(allQuestions);
-            questions = allQuestions.slice(0, 15);
-            
-            // Initialize answers array
-            userAnswers = new Array(questions.length).fill(null);
-        }}
-        
-        function shuffleArray(array) {{
-            for (let i = array.length - 1; i > 0; i--) {{
-                const j = Math.floor(Math.random() * (i + 1));
-                [array[i], array[j]] = [array[j], array[i]];
-            }}
-            return array;
-        }}
-        
-        function startQuiz() {{
-            maxAttempts = parseInt(document.getElementById('attempts').value);
-            generateQuestions();
-            
-            document.getElementById('quizSetup').style.display = 'none';
-            document.getElementById('quizContainer').classList.add('active');
-            
-            renderQuestions();
-            showQuestion(0);
-        }}
-        
-        function renderQuestions() {{
-            const area = document.getElementById('questionsArea');
-            area.innerHTML = '';
-            
-            questions.forEach((q, index) => {{
-                const qDiv = document.createElement('div');
-                qDiv.className = 'question-card';
-                qDiv.id = `question-${{index}}`;
-                qDiv.style.display = 'none';
-                
-                let typeLabel = '';
-                if (q.type === 'scenario') typeLabel = '📋 Scenario';
-                else if (q.type === 'fill_blank') typeLabel = '✏️ Fill in the Blank';
-                else if (q.type === 'command') typeLabel = '⌨️ Command Completion';
-                
-                let content = `
-                    <div class="question-header">
-                        <span class="question-number">Question ${{index + 1}} of ${{questions.length}}</span>
-                        <span class="question-type">${{typeLabel}}</span>
-                    </div>
-                    <div class="question-text">${{q.question}}</div>
-                `;
-                
-                if (q.type === 'scenario') {{
-                    content += '<div class="options">';
-                    q.options.forEach((opt, i) => {{
-                        content += `
-                            <div class="option" onclick="selectOption(${{index}}, '${{opt}}')">
-                                ${{String.fromCharCode(65 + i)}}. ${{opt}}
-                            </div>
-                        `;
-                    }});
-                    content += '</div>';
-                }} else if (q.type === 'fill_blank') {{
-                    content += `
-                        <input type="text" class="fill-input" id="answer-${{index}}" 
-                               placeholder="Type your answer..." onchange="saveAnswer(${{index}}, this.value)">
-                    `;
-                }} else if (q.type === 'command') {{
-                    content += `
-                        <div class="command-prompt">${{q.prompt}}</div>
-                        <input type="text" class="fill-input" id="answer-${{index}}" 
-                               placeholder="Complete the command..." onchange="saveAnswer(${{index}}, this.value)">
-                    `;
-                }}
-                
-                content += `
-                    <div class="explanation" id="explanation-${{index}}">
-                        <strong>Explanation:</strong> ${{q.explanation}}
-                    </div>
-                `;
-                
-                qDiv.innerHTML = content;
-                area.appendChild(qDiv);
-            }});
-        }}
-        
-        function showQuestion(index) {{
-            // Hide all questions
-            questions.forEach((_, i) => {{
-                document.getElementById(`question-${{i}}`).style.display = 'none';
-            }});
-            
-            // Show current question
-            document.getElementById(`question-${{index}}`).style.display = 'block';
-            currentQuestion = index;
-            
-            // Update navigation
-            document.getElementById('prevBtn').disabled = index === 0;
-            document.getElementById('nextBtn').style.display = index < questions.length - 1 ? 'block' : 'none';
-            document.getElementById('submitBtn').style.display = index === questions.length - 1 ? 'block' : 'none';
-        }}
-        
-        function selectOption(qIndex, answer) {{
-            userAnswers[qIndex] = answer;
-            
-            // Update UI
-            const options = document.getElementById(`question-${{qIndex}}`).querySelectorAll('.option');
-            options.forEach(opt => {{
-                opt.classList.remove('selected');
-                if (opt.textContent.includes(answer)) {{
-                    opt.classList.add('selected');
-                }}
-            }});
-        }}
-        
-        function saveAnswer(qIndex, answer) {{
-            userAnswers[qIndex] = answer.trim();
-        }}
-        
-        function previousQuestion() {{
-            if (currentQuestion > 0) {{
-                showQuestion(currentQuestion - 1);
-            }}
-        }}
-        
-        function nextQuestion() {{
-            if (currentQuestion < questions.length - 1) {{
-                showQuestion(currentQuestion + 1);
-            }}
-        }}
-        
-        function submitQuiz() {{
-            calculateScore();
-            document.getElementById('quizContainer').classList.remove('active');
-            showResults();
-        }}
-        
-        function calculateScore() {{
-            score = 0;
-            
-            questions.forEach((q, i) => {{
-                const userAnswer = userAnswers[i];
-                let isCorrect = false;
-                
-                if (q.type === 'scenario') {{
-                    isCorrect = userAnswer === q.answer;
-                }} else {{
-                    // For fill-in and command, check against answer and alternatives
-                    const validAnswers = [q.answer];
-                    if (q.alternatives) {{
-                        validAnswers.push(...q.alternatives);
-                    }}
-                    isCorrect = validAnswers.some(ans => 
-                        ans.toLowerCase() === (userAnswer || '').toLowerCase()
-                    );
-                }}
-                
-                if (isCorrect) score++;
-                
-                // Show explanation and mark answer
-                const qCard = document.getElementById(`question-${{i}}`);
-                if (q.type === 'scenario') {{
-                    const options = qCard.querySelectorAll('.option');
-                    options.forEach(opt => {{
-                        if (opt.textContent.includes(q.answer)) {{
-                            opt.classList.add('correct');
-                        }} else if (opt.textContent.includes(userAnswer) && !isCorrect) {{
-                            opt.classList.add('incorrect');
-                        }}
-                    }});
-                }}
-                
-                document.getElementById(`explanation-${{i}}`).classList.add('show');
-            }});
-        }}
-        
-        function showResults() {{
-            const percentage = Math.round((score / questions.length) * 100);
-            document.getElementById('scoreDisplay').textContent = `${{score}}/${{questions.length}}`;
-            
-            let grade = '';
-            if (percentage >= 90) grade = '🌟 Excellent!';
-            else if (percentage >= 80) grade = '✨ Great Job!';
-            else if (percentage >= 70) grade = '✓ Passed';
-            else grade = '📚 Keep Studying';
-            
-            document.getElementById('gradeDisplay').textContent = `${{percentage}}% - ${{grade}}`;
-            
-            const attemptsLeft = maxAttempts - currentAttempt;
-            let attemptInfo = `<div class="attempts-left">`;
-            attemptInfo += `<strong>Attempt ${{currentAttempt}} of ${{maxAttempts}}</strong><br>`;
-            if (percentage < 70 && attemptsLeft > 0) {{
-                attemptInfo += `You have ${{attemptsLeft}} attempt(s) remaining. Click Retry to try again with new questions.`;
-                document.getElementById('retryBtn').style.display = 'block';
-            }} else if (attemptsLeft === 0 && percentage < 70) {{
-                attemptInfo += `No attempts remaining. Please review the material and try again later.`;
-                document.getElementById('retryBtn').style.display = 'none';
-            }} else {{
-                attemptInfo += `Congratulations! You passed the quiz.`;
-                document.getElementById('retryBtn').style.display = 'none';
-            }}
-            attemptInfo += `</div>`;
-            
-            document.getElementById('attemptsInfo').innerHTML = attemptInfo;
-            document.getElementById('results').classList.add('show');
-        }}
-        
-        function retryQuiz() {{
-            if (currentAttempt < maxAttempts) {{
-                currentAttempt++;
-                document.getElementById('results').classList.remove('show');
-                generateQuestions();
-                renderQuestions();
-                currentQuestion = 0;
-                showQuestion(0);
-                document.getElementById('quizContainer').classList.add('active');
-            }}
-        }}
-    </script>
+    <script src="../js/quiz_runtime.js" data-quiz="{payload_file}"></script>
 </body>
 </html>
 """
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
-    
-    return True
 
 def main():
     """Generate quizzes for all weeks"""
+    parser = argparse.ArgumentParser(description="Generate the weekly interactive quizzes.")
+    parser.add_argument("--force", action="store_true", help="Rebuild every quiz even if it is up to date")
+    args = parser.parse_args()
+    
     base_dir = Path(__file__).parent.parent
+    cache = BuildCache(base_dir, force=args.force)
     
     print("=" * 70)
     print("Generating Interactive Quizzes")
     print("=" * 70)
     print()
     
+    # Malformed banks fail the build before anything is written
+    try:
+        compiled_banks()
+    except QuizBankError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    
+    write_stylesheet()
+    write_sprite()
+    # The page shells embed icon references and palette colors
+    shell_inputs = [Path(__file__).parent / "icons.py", Path(__file__).parent / "vut_theme.py"]
+    
+    week_folders = {
+        1: "Week 1 - Introduction to Virtualization",
+        2: "Week 2 - Virtual Machines",
+        3: "Week 3 - Virtual Networking and Linux Networking Fundamentals",
+        4: "Week 4 - Storage and Backup",
+        5: "Week 5 - Containers and Resource Management",
+        6: "Week 6 - Proxmox Cluster and High Availability",
+        7: "Week 7 - Transition to Cloud Computing Concepts",
+        8: "Week 8 - Cloud Foundation",
+        9: "Week 9 - Compute Operations",
+        10: "Week 10 - Storage and Persistence",
+        11: "Week 11 - Automation and Cloud API",
+        12: "Week 12 - Final Project and Review"
+    }
+    
     created = 0
     for week in range(1, 13):
-        week_folders = {
-            1: "Week 1 - Introduction to Virtualization",
-            2: "Week 2 - Virtual Machines",
-            3: "Week 3 - Virtual Networking and Linux Networking Fundamentals",
-            4: "Week 4 - Storage and Backup",
-            5: "Week 5 - Containers and Resource Management",
-            6: "Week 6 - Proxmox Cluster and High Availability",
-            7: "Week 7 - Transition to Cloud Computing Concepts",
-            8: "Week 8 - Cloud Foundation",
-            9: "Week 9 - Compute Operations",
-            10: "Week 10 - Storage and Persistence",
-            11: "Week 11 - Automation and Cloud API",
-            12: "Week 12 - Final Project and Review"
-        }
         
         week_dir = base_dir / week_folders[week]
         if week_dir.exists():
             output_file = week_dir / f"Week_{week}_Quiz.html"
+            inputs = [(f"quiz_bank_week_{week}", QUIZ_QUESTIONS.get(week, {})),
+                      Path(__file__), Path(__file__).parent / "quiz_bank.py", *shell_inputs]
+            payload = build_quiz_payload(week)
+            outputs = [output_file]
+            if payload is not None:
+                outputs.append(week_dir / payload_name(f"Week_{week}_Quiz", payload))
+            if all(cache.is_current(path, inputs) for path in outputs):
+                print(f"⏭️  Week {week}: Quiz up to date")
+                continue
             if generate_quiz_html(week, output_file):
+                for path in outputs:
+                    cache.record(path, inputs)
                 print(f"✅ Week {week}: Created quiz")
                 created += 1
     
+    # Cumulative exam over every week's bank, in the final week's folder
+    exam_dir = base_dir / week_folders[EXAM_WEEK]
+    if exam_dir.exists():
+        exam_file = exam_dir / f"{EXAM_STEM}.html"
+        inputs = [("quiz_banks", QUIZ_QUESTIONS), ("exam_topic_weights", EXAM_TOPIC_WEIGHTS),
+                  ("exam_paper_size", EXAM_PAPER_SIZE), Path(__file__),
+                  Path(__file__).parent / "quiz_bank.py", Path(__file__).parent / "glossary_data.json",
+                  *shell_inputs]
+        outputs = [exam_file, exam_dir / payload_name(EXAM_STEM, build_exam_payload())]
+        if all(cache.is_current(path, inputs) for path in outputs):
+            print("⏭️  Cumulative exam up to date")
+        else:
+            generate_exam_html(exam_file)
+            for path in outputs:
+                cache.record(path, inputs)
+            print("✅ Cumulative exam: Created exam")
+            created += 1
+    
+    cache.save()
+    
     print()
     print("=" * 70)
     print(f"✅ Created {created} interactive quizzes")
+    print(summary())
     print("=" * 70)
 
 if __name__ == "__main__":
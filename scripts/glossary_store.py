@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Glossary Store
+Single source of truth for the course glossary, shared by the glossary page
+(create_glossary.py), the notes tooltips (add_glossary_tooltips.py) and the
+corruption clean-up (deep_clean.py).
+
+The data lives in glossary_data.json next to this file:
+- "terms":     full glossary entries (term, slug, definition, category, week,
+               related) in glossary page order
+- "tooltips":  short tooltip definitions for the terms matched in the notes,
+               each with the slug of the glossary card it links to
+- "match_order": tooltip terms, longest first
+- "cleanup_artifacts": extra leaked strings deep_clean removes
+
+Slugs, related links and match order are derived data. After editing terms or
+tooltips run this script to recompute them:
+
+    python scripts/glossary_store.py
+"""
+
+from functools import lru_cache
+from pathlib import Path
+import json
+
+from output_writer import write_if_changed
+
+GLOSSARY_PATH = Path(__file__).parent / "glossary_data.json"
+
+
+def make_slug(term):
+    """Glossary card ID used for deep links (glossary.html#Term-Name)"""
+    return term.replace(" ", "-")
+
+
+@lru_cache(maxsize=None)
+def load_glossary(path=GLOSSARY_PATH):
+    """Load the glossary store once per process"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def glossary_terms(path=GLOSSARY_PATH):
+    """Full glossary entries keyed by term, in glossary page order"""
+    return {entry['term']: entry for entry in load_glossary(path)['terms']}
+
+
+def tooltip_entries(path=GLOSSARY_PATH):
+    """Tooltip entries (term, definition, slug) ordered longest term first"""
+    data = load_glossary(path)
+    by_term = {entry['term']: entry for entry in data['tooltips']}
+    return [by_term[term] for term in data['match_order']]
+
+
+def cleanup_strings(path=GLOSSARY_PATH):
+    """Strings deep_clean strips from corrupted notes: every tooltip definition plus known artifacts"""
+    data = load_glossary(path)
+    return [entry['definition'] for entry in data['tooltips']] + data['cleanup_artifacts']
+
+
+def resolve_card(name, card_terms):
+    """Find the glossary card a short name refers to, e.g. 'VM' -> 'Virtual Machine (VM)'"""
+    if name in card_terms:
+        return name
+    for term in card_terms:
+        if term.startswith(name + " (") or term.endswith("(" + name + ")"):
+            return term
+    for term in card_terms:
+        if term.startswith(name + " "):
+            return term
+    return None
+
+
+def normalize(data):
+    """Recompute all derived fields (slugs, links, match order) in place"""
+    data['terms'].sort(key=lambda entry: entry['term'])
+    card_terms = [entry['term'] for entry in data['terms']]
+
+    for entry in data['terms']:
+        entry['slug'] = make_slug(entry['term'])
+        if 'related' in entry:
+            related = []
+            for item in entry['related']:
+                name = item['term'] if isinstance(item, dict) else item
+                card = resolve_card(name, card_terms)
+                related.append({'term': name, 'slug': make_slug(card) if card else None})
+            entry['related'] = related
+
+    for entry in data['tooltips']:
+        card = resolve_card(entry['term'], card_terms)
+        entry['slug'] = make_slug(card or entry['term'])
+
+    data['match_order'] = sorted((entry['term'] for entry in data['tooltips']), key=len, reverse=True)
+    return data
+
+
+def main():
+    with open(GLOSSARY_PATH, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    normalize(data)
+
+    write_if_changed(GLOSSARY_PATH, json.dumps(data, indent=2, ensure_ascii=False) + '\n')
+
+    print(f"✅ Normalized {len(data['terms'])} glossary terms and {len(data['tooltips'])} tooltips")
+    print(f"   Output: {GLOSSARY_PATH}")
+
+
+if __name__ == "__main__":
+    main()
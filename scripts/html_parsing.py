@@ -0,0 +1,65 @@
+"""
+HTML Parser Backend
+Every script builds its BeautifulSoup trees through make_soup(), which uses the
+fastest tree builder installed:
+
+- lxml (C, pip install lxml) when it can be imported
+- html.parser (pure Python, always available) otherwise
+
+Set OPS3_HTML_PARSER=lxml or OPS3_HTML_PARSER=html.parser to pick one
+explicitly, e.g. to reproduce a build made without lxml.
+
+The backends agree on well-formed markup. Where the notes are malformed (an
+<a> inside an <a>, text before <!DOCTYPE>) lxml repairs the tree the way a
+browser would, while html.parser keeps the source shape. check_parser_backends.py
+compares what the generators produce with each backend.
+
+Small snippets that are inserted into another tree go through make_fragment(),
+which always uses html.parser: lxml would wrap them in <html><body>.
+"""
+
+from functools import lru_cache
+import importlib.util
+import os
+
+from bs4 import BeautifulSoup
+
+import tracing
+
+PARSER_ENV = "OPS3_HTML_PARSER"
+FAST_PARSER = "lxml"
+FALLBACK_PARSER = "html.parser"
+PARSERS = (FAST_PARSER, FALLBACK_PARSER)
+
+
+@lru_cache(maxsize=None)
+def is_available(parser):
+    """True if the tree builder can be used in this environment"""
+    if parser == FALLBACK_PARSER:
+        return True
+    return importlib.util.find_spec(parser) is not None
+
+
+def parser_name():
+    """Tree builder to use: the OPS3_HTML_PARSER override, else lxml if installed"""
+    requested = os.environ.get(PARSER_ENV, "").strip()
+    if requested:
+        if requested not in PARSERS:
+            raise ValueError(f"{PARSER_ENV}={requested}: expected one of {', '.join(PARSERS)}")
+        if not is_available(requested):
+            raise ValueError(f"{PARSER_ENV}={requested}: {requested} is not installed")
+        return requested
+    return FAST_PARSER if is_available(FAST_PARSER) else FALLBACK_PARSER
+
+
+def make_soup(markup):
+    """Parse a whole HTML document with the selected backend"""
+    parser = parser_name()
+    tracing.count("parses")
+    with tracing.span("parse", parser, bytes_in=len(markup) if isinstance(markup, str) else 0):
+        return BeautifulSoup(markup, parser)
+
+
+def make_fragment(markup):
+    """Parse an HTML snippet meant to be appended to another tree"""
+    return BeautifulSoup(markup, FALLBACK_PARSER)
@@ -0,0 +1,201 @@
+"""
+Streaming HTML Rewriter
+Single-pass, tag-aware alternative to chains of str.replace/re.sub over whole
+notes files (the --stream mode of remove_emojis.py, spot_repair.py,
+deep_clean.py and repair_html.py, and of the notes pipeline).
+
+The document is tokenized with html.parser and written back event by event:
+- markup is copied through verbatim (start tags from the source text), except
+  for elements matched by a TagRule, which are dropped together with their
+  content (DROP) or lose only their own tags (UNWRAP)
+- every run of text between two tags, outside <script> and <style>, is passed
+  once through the text edit function
+
+Input is fed in blocks and output is written as it is produced, so the cost is
+linear in file size and memory is bounded by the longest run of text.
+"""
+
+from html.parser import HTMLParser
+from pathlib import Path
+import filecmp
+import io
+import os
+
+DROP = "drop"
+UNWRAP = "unwrap"
+
+VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+})
+RAW_TEXT_ELEMENTS = frozenset({"script", "style"})
+
+
+class TagRule:
+    """Match elements by tag name and, optionally, a class they carry"""
+
+    def __init__(self, tag, action, class_name=None):
+        if action not in (DROP, UNWRAP):
+            raise ValueError(f"Unknown tag rule action: {action}")
+        self.tag = tag
+        self.action = action
+        self.class_name = class_name
+
+    def matches(self, tag, attrs):
+        if tag != self.tag:
+            return False
+        if self.class_name is None:
+            return True
+        classes = (dict(attrs).get("class") or "").split()
+        return self.class_name in classes
+
+
+class StreamRewriter(HTMLParser):
+    """HTMLParser that writes the document back out with tag rules and text edits applied"""
+
+    def __init__(self, write, rules=(), text_edit=None):
+        super().__init__(convert_charrefs=False)
+        self._write = write
+        self.rules = list(rules)
+        self.text_edit = text_edit
+        self._text = []
+        self._stack = []  # (tag, action) of open elements
+        self._dropping = 0
+        self._raw_text = False
+
+    def _action(self, tag, attrs):
+        for rule in self.rules:
+            if rule.matches(tag, attrs):
+                return rule.action
+        return None
+
+    def _flush_text(self):
+        if not self._text:
+            return
+        text = "".join(self._text)
+        self._text = []
+        if self._dropping:
+            return
+        if self.text_edit and not self._raw_text:
+            text = self.text_edit(text)
+        self._write(text)
+
+    def _emit(self, markup):
+        self._flush_text()
+        if not self._dropping:
+            self._write(markup)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        action = self._action(tag, attrs)
+        markup = self.get_starttag_text()
+
+        if tag in VOID_ELEMENTS:
+            if action is None:
+                self._emit(markup)
+            return
+
+        if action is None:
+            self._emit(markup)
+        self._stack.append((tag, action))
+        if action == DROP:
+            self._dropping += 1
+        if tag in RAW_TEXT_ELEMENTS:
+            self._raw_text = True
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush_text()
+        if self._action(tag, attrs) is None:
+            self._emit(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag in RAW_TEXT_ELEMENTS:
+            self._raw_text = False
+
+        for position in range(len(self._stack) - 1, -1, -1):
+            if self._stack[position][0] == tag:
+                break
+        else:
+            # Stray end tag: copy it through untouched
+            self._emit(f"</{tag}>")
+            return
+
+        closed = self._stack[position:]
+        del self._stack[position:]
+
+        # Elements left open inside this one end here without an end tag of their own
+        for _, action in closed[1:]:
+            if action == DROP:
+                self._dropping -= 1
+
+        action = closed[0][1]
+        if action is None:
+            self._emit(f"</{tag}>")
+        elif action == DROP:
+            self._dropping -= 1
+
+    def handle_data(self, data):
+        self._text.append(data)
+
+    def handle_entityref(self, name):
+        self._text.append(f"&{name};")
+
+    def handle_charref(self, name):
+        self._text.append(f"&#{name};")
+
+    def handle_comment(self, data):
+        self._emit(f"<!--{data}-->")
+
+    def handle_decl(self, decl):
+        self._emit(f"<!{decl}>")
+
+    def handle_pi(self, data):
+        self._emit(f"<?{data}>")
+
+    def unknown_decl(self, data):
+        self._emit(f"<![{data}]>")
+
+    def close(self):
+        super().close()
+        self._flush_text()
+
+
+def rewrite_html(content, rules=(), text_edit=None):
+    """Rewrite an HTML string in one streaming pass and return the result"""
+    output = io.StringIO()
+    parser = StreamRewriter(output.write, rules, text_edit)
+    parser.feed(content)
+    parser.close()
+    return output.getvalue()
+
+
+def rewrite_file(path, rules=(), text_edit=None, block_size=64 * 1024):
+    """Stream a file through the rewriter in blocks; returns True if its content changed.
+
+    Output goes to a temporary file next to the original, which replaces it
+    only when something changed. The temporary file is removed if the run fails.
+    """
+    path = Path(path)
+    temp_path = path.with_name(path.name + ".tmp")
+
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as source, \
+                open(temp_path, 'w', encoding='utf-8', newline='') as target:
+            parser = StreamRewriter(target.write, rules, text_edit)
+            while True:
+                block = source.read(block_size)
+                if not block:
+                    break
+                parser.feed(block)
+            parser.close()
+
+        if filecmp.cmp(path, temp_path, shallow=False):
+            temp_path.unlink()
+            return False
+
+        os.replace(temp_path, path)
+        return True
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Icon Registry
+Every SVG icon the generators and scripts put on a page, defined once and
+built into a single sprite, images/icons.svg. Pages reference an icon with
+
+    <svg width="16" height="16"><use href="images/icons.svg#folder"></use></svg>
+
+instead of repeating its path data at every use site, and browsers fetch and
+cache the sprite once for the whole course.
+
+Consumers: create_glossary.py (card meta icons), replace_glossary_icons.py
+(emoji replacement), add_navigation.py (chapter navigation), generate_quizzes.py
+(quiz shell) and js/ai_chat.js, which builds the same <use> markup.
+
+Icons are drawn in currentColor. icon() sets a color on the use site when the
+icon should not follow the surrounding text color.
+
+After adding or changing icons run:
+
+    python scripts/icons.py
+"""
+
+from pathlib import Path
+
+from output_writer import write_if_changed
+
+SPRITE_PATH = Path(__file__).parent.parent / "images" / "icons.svg"
+SPRITE_HREF = "images/icons.svg"
+
+# Paint styles, set on the <symbol> and inherited by its shapes
+STROKE = {"fill": "none", "stroke": "currentColor", "stroke-width": "2",
+          "stroke-linecap": "round", "stroke-linejoin": "round"}  # Feather icons
+OUTLINE = {"fill": "none", "stroke": "currentColor"}  # Heroicons, stroke width set per path
+SOLID = {"fill": "currentColor"}  # Material icons
+FILLED_STROKE = dict(STROKE, fill="currentColor")
+
+# name -> (paint style, shapes on a 24x24 grid)
+ICONS = {
+    # Glossary and quiz pages
+    "folder": (STROKE, '<path d="M22 19a2 2 0 0 1-2 2H4a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h5l2 3h9a2 2 0 0 1 2 2z"></path>'),
+    "calendar": (STROKE, '<rect x="3" y="4" width="18" height="18" rx="2" ry="2"></rect><line x1="16" y1="2" x2="16" y2="6"></line><line x1="8" y1="2" x2="8" y2="6"></line><line x1="3" y1="10" x2="21" y2="10"></line>'),
+    "file-text": (STROKE, '<path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z"></path><polyline points="14 2 14 8 20 8"></polyline><line x1="16" y1="13" x2="8" y2="13"></line><line x1="16" y1="17" x2="8" y2="17"></line><polyline points="10 9 9 9 8 9"></polyline>'),
+    "rocket": (STROKE, '<path d="M4.5 16.5c-1.5 1.26-2 5-2 5s3.74-.5 5-2c.71-.84.7-2.13-.09-2.91a2.18 2.18 0 0 0-2.91-.09z"></path><path d="M12 15l-3-3a22 22 0 0 1 2-3.95A12.88 12.88 0 0 1 22 2c0 2.72-.78 7.5-6 11a22.35 22.35 0 0 1-4 2z"></path><path d="M9 12H4s.55-3.03 2-4c1.62-1.08 5 0 5 0"></path><path d="M12 15v5s3.03-.55 4-2c1.08-1.62 0-5 0-5"></path>'),
+    "clipboard": (STROKE, '<path d="M16 4h2a2 2 0 0 1 2 2v14a2 2 0 0 1-2 2H6a2 2 0 0 1-2-2V6a2 2 0 0 1 2-2h2"></path><rect x="8" y="2" width="8" height="4" rx="1" ry="1"></rect>'),
+    "pencil": (STROKE, '<path d="M17 3a2.828 2.828 0 1 1 4 4L7.5 20.5 2 22l1.5-5.5L17 3z"></path>'),
+    "keyboard": (STROKE, '<rect x="2" y="4" width="20" height="16" rx="2" ry="2"></rect><line x1="6" y1="8" x2="6" y2="8"></line><line x1="10" y1="8" x2="10" y2="8"></line><line x1="14" y1="8" x2="14" y2="8"></line><line x1="18" y1="8" x2="18" y2="8"></line><line x1="6" y1="12" x2="6" y2="12"></line><line x1="10" y1="12" x2="10" y2="12"></line><line x1="14" y1="12" x2="14" y2="12"></line><line x1="18" y1="12" x2="18" y2="12"></line><line x1="6" y1="16" x2="18" y2="16"></line>'),
+    "star": (FILLED_STROKE, '<polygon points="12 2 15.09 8.26 22 9.27 17 14.14 18.18 21.02 12 17.77 5.82 21.02 7 14.14 2 9.27 8.91 8.26 12 2"></polygon>'),
+    "sparkles": (STROKE, '<path d="m12 3-1.912 5.813a2 2 0 0 1-1.275 1.275L3 12l5.813 1.912a2 2 0 0 1 1.275 1.275L12 21l1.912-5.813a2 2 0 0 1 1.275-1.275L21 12l-5.813-1.912a2 2 0 0 1-1.275-1.275L12 3Z"></path>'),
+    "book": (STROKE, '<path d="M4 19.5A2.5 2.5 0 0 1 6.5 17H20"></path><path d="M6.5 2H20v20H6.5A2.5 2.5 0 0 1 4 19.5v-15A2.5 2.5 0 0 1 6.5 2z"></path>'),
+    "refresh": (STROKE, '<path d="M23 4v6h-6"></path><path d="M1 20v-6h6"></path><path d="M3.51 9a9 9 0 0 1 14.85-3.36L23 10M1 14l4.64 4.36A9 9 0 0 0 20.49 15"></path>'),
+    "message": (STROKE, '<path d="M21 15a2 2 0 0 1-2 2H7l-4 4V5a2 2 0 0 1 2-2h14a2 2 0 0 1 2 2z"></path>'),
+    # Chapter navigation on the notes pages
+    "chevron-left": (OUTLINE, '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M15 19l-7-7 7-7"></path>'),
+    "chevron-right": (OUTLINE, '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 5l7 7-7 7"></path>'),
+    "home": (OUTLINE, '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M3 12l2-2m0 0l7-7 7 7M5 10v10a1 1 0 001 1h3m10-11l2 2m-2-2v10a1 1 0 01-1 1h-3m-6 0a1 1 0 001-1v-4a1 1 0 011-1h2a1 1 0 011 1v4a1 1 0 001 1m-6 0h6"></path>'),
+    # AI chat assistant (js/ai_chat.js)
+    "settings": (SOLID, '<path d="M19.14 12.94c.04-.3.06-.61.06-.94 0-.32-.02-.64-.07-.94l2.03-1.58a.49.49 0 0 0 .12-.61l-1.92-3.32a.488.488 0 0 0-.59-.22l-2.39.96c-.5-.38-1.03-.7-1.62-.94l-.36-2.54a.484.484 0 0 0-.48-.41h-3.84c-.24 0-.43.17-.47.41l-.36 2.54c-.59.24-1.13.57-1.62.94l-2.39-.96c-.22-.08-.47 0-.59.22L2.74 8.87c-.12.21-.08.47.12.61l2.03 1.58c-.05.3-.09.63-.09.94s.02.64.07.94l-2.03 1.58a.49.49 0 0 0-.12.61l1.92 3.32c.12.22.37.29.59.22l2.39-.96c.5.38 1.03.7 1.62.94l.36 2.54c.05.24.24.41.48.41h3.84c.24 0 .44-.17.47-.41l.36-2.54c.59-.24 1.13-.58 1.62-.94l2.39.96c.22.08.47 0 .59-.22l1.92-3.32c.12-.22.07-.47-.12-.61l-2.01-1.58zM12 15.6c-1.98 0-3.6-1.62-3.6-3.6s1.62-3.6 3.6-3.6 3.6 1.62 3.6 3.6-1.62 3.6-3.6 3.6z"/>'),
+    "info": (SOLID, '<path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm1 15h-2v-6h2v6zm0-8h-2V7h2v2z"/>'),
+    "check": (SOLID, '<path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm-2 15l-5-5 1.41-1.41L10 14.17l7.59-7.59L19 8l-9 9z"/>'),
+    "error": (SOLID, '<path d="M12 2C6.47 2 2 6.47 2 12s4.47 10 10 10 10-4.47 10-10S17.53 2 12 2zm5 13.59L15.59 17 12 13.41 8.41 17 7 15.59 10.59 12 7 8.41 8.41 7 12 10.59 15.59 7 17 8.41 13.41 12 17 15.59z"/>'),
+    "wait": (SOLID, '<path d="M11.99 2C6.47 2 2 6.48 2 12s4.47 10 9.99 10C17.52 22 22 17.52 22 12S17.52 2 11.99 2zM12 20c-4.42 0-8-3.58-8-8s3.58-8 8-8 8 3.58 8 8-3.58 8-8 8z"/><path d="M12.5 7H11v6l5.25 3.15.75-1.23-4.5-2.67z"/>'),
+    "alert": (SOLID, '<path d="M12 2L1 21h22L12 2zm1 17h-2v-2h2v2zm0-4h-2V8h2v7z"/>'),
+}
+
+
+def build_sprite():
+    """Full text of images/icons.svg: one <symbol> per registered icon"""
+    lines = ['<svg xmlns="http://www.w3.org/2000/svg">']
+    for name, (paint, shapes) in ICONS.items():
+        attributes = "".join(f' {key}="{value}"' for key, value in paint.items())
+        lines.append(f'<symbol id="{name}" viewBox="0 0 24 24"{attributes}>{shapes}</symbol>')
+    lines.append('</svg>')
+    return "\n".join(lines) + "\n"
+
+
+def icon(name, size=24, css_class=None, color=None, prefix=""):
+    """<svg> that shows a sprite icon; prefix is the path back to the site root (e.g. '../')"""
+    if name not in ICONS:
+        raise ValueError(f"Unknown icon: {name}")
+    attributes = f' width="{size}" height="{size}"'
+    if color:
+        attributes += f' color="{color}"'
+    if css_class:
+        attributes += f' class="{css_class}"'
+    return f'<svg{attributes}><use href="{prefix}{SPRITE_HREF}#{name}"></use></svg>'
+
+
+def write_sprite(path=SPRITE_PATH):
+    """Write the sprite if its content changed; returns True if it was written"""
+    sprite = build_sprite()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return write_if_changed(path, sprite)
+
+
+def main():
+    changed = write_sprite()
+    print(f"{'✅ Wrote' if changed else '✓ Up to date:'} {SPRITE_PATH} ({len(ICONS)} icons)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Student Notes Document Model
+Typed, parsed form of a Week_X_Student_Notes.html file, built in one linear
+walk over the <article> and shared by the generators that read the notes:
+convert_notes_to_slides.py (title, sections and blocks), convert_html_to_pptx.py
+(learning objectives) and generate_course_context.py (section text).
+
+    NotesDocument: title, objectives, intro text, sections
+      Section:     h2 title and text, subsections
+        Subsection: h3 title and text, blocks
+          Block:   text, list, code, table, image or quote
+
+Scripts, styles, the chapter bar and the glossary tooltip text repeated after
+every highlighted term are not part of the model.
+
+Models are stored in .build_cache/notes/<hash>.json, keyed by the content hash
+of the notes, so a full build parses each notes file once: the notes pipeline
+stores the model of every file it writes, and load_notes() only parses a file
+whose model is missing.
+"""
+
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+import copy
+import json
+
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+from build_cache import hash_bytes
+from html_parsing import make_soup, parser_name
+import tracing
+
+MODEL_DIR = Path(__file__).parent.parent / ".build_cache" / "notes"
+# Bump when the model or the way it is extracted changes, so stored models are rebuilt
+MODEL_VERSION = 2
+
+SECTION_TAGS = ("h2", "h3")
+SKIPPED_TAGS = ("script", "style")
+SKIPPED_CLASSES = ("chapter-navigation", "glossary-tooltip")
+# Buttons that make their box a call to action (the quiz box at the end of a page)
+CALL_TO_ACTION_IDS = ("start-quiz-btn",)
+OBJECTIVE_KEYWORDS = ("objective", "learning outcome", "what you will learn", "goals")
+
+
+@dataclass
+class Block:
+    """One content element of a subsection"""
+    kind: str  # text, list, code, table, image or quote
+    text: str = ""
+    items: list = field(default_factory=list)
+    html: str = ""
+    src: str = ""
+    alt: str = ""
+
+
+@dataclass
+class Subsection:
+    """h3 and the content up to the next heading"""
+    title: str
+    text: str = ""
+    blocks: list = field(default_factory=list)
+
+
+@dataclass
+class Section:
+    """h2, its own text and its subsections; title is empty for h3s before the first h2"""
+    title: str
+    text: str = ""
+    subsections: list = field(default_factory=list)
+
+
+@dataclass
+class NotesDocument:
+    """Parsed student notes"""
+    title: str
+    objectives: list = field(default_factory=list)
+    intro: str = ""  # text before the first heading
+    sections: list = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data):
+        sections = [
+            Section(section["title"], section["text"], [
+                Subsection(sub["title"], sub["text"], [Block(**block) for block in sub["blocks"]])
+                for sub in section["subsections"]
+            ])
+            for section in data["sections"]
+        ]
+        return cls(data["title"], data["objectives"], data["intro"], sections)
+
+
+def is_skipped(node):
+    """True for elements that are not course content"""
+    if node.name in SKIPPED_TAGS:
+        return True
+    classes = node.get("class") or []
+    return any(name in classes for name in SKIPPED_CLASSES)
+
+
+def is_call_to_action(node):
+    """True for a box around a button to another page: its heading is not a notes section"""
+    return node.name == 'div' and any(node.find(id=name) for name in CALL_TO_ACTION_IDS)
+
+
+def iter_strings(node):
+    """Text strings below a node, leaving out skipped elements and comments"""
+    for child in node.children:
+        if isinstance(child, Tag):
+            if not is_skipped(child):
+                yield from iter_strings(child)
+        elif type(child) in (NavigableString, CData):
+            yield str(child)
+
+
+def node_text(node, separator=""):
+    """get_text() of a node without the skipped elements"""
+    if not isinstance(node, Tag):
+        return str(node) if type(node) in (NavigableString, CData) else ""
+    return separator.join(iter_strings(node))
+
+
+def clean_text(text):
+    """Collapse whitespace"""
+    return " ".join(text.split())
+
+
+def iter_blocks(node):
+    """Yield the top-level blocks of the notes, descending into wrappers that hold headings"""
+    for child in node.children:
+        if isinstance(child, Tag):
+            if is_skipped(child) or is_call_to_action(child):
+                continue
+            if child.name not in SECTION_TAGS and child.find(SECTION_TAGS):
+                yield from iter_blocks(child)
+                continue
+        yield child
+
+
+def make_block(node):
+    """Block for a content element, or None if it carries nothing for the slides"""
+    if not isinstance(node, Tag):
+        return None
+    if node.name == 'p':
+        text = node_text(node).strip()
+        return Block('text', text=text) if text else None
+    if node.name == 'ul':
+        items = [node_text(li).strip() for li in node.find_all('li', recursive=False)]
+        return Block('list', items=items) if items else None
+    if node.name == 'pre' or (node.name == 'div' and 'code-block' in node.get('class', [])):
+        code = node_text(node).strip()
+        return Block('code', text=code) if code else None
+    if node.name == 'table':
+        table = copy.copy(node)
+        for element in table.find_all(is_skipped):
+            element.decompose()
+        return Block('table', html=str(table))
+    if node.name == 'img':
+        return Block('image', src=node.get('src', ''), alt=node.get('alt', ''))
+    if node.name == 'blockquote':
+        text = node_text(node).strip()
+        return Block('quote', text=text) if text else None
+    return None
+
+
+def extract_objectives(blocks):
+    """Items of the first objectives heading (h2/h3) among the top-level blocks"""
+    blocks = [block for block in blocks if isinstance(block, Tag)]
+    for position, block in enumerate(blocks[:-1]):
+        if block.name not in SECTION_TAGS:
+            continue
+        heading = node_text(block).lower()
+        if not any(keyword in heading for keyword in OBJECTIVE_KEYWORDS):
+            continue
+        following = blocks[position + 1]
+        if following.name in ('ul', 'ol'):
+            return [text for text in (node_text(li).strip() for li in following.find_all('li', recursive=False)) if text]
+        if following.name == 'p':
+            text = node_text(following).strip()
+            return [text] if text else []
+        return []
+    return []
+
+
+def parse_notes(html):
+    """Build the model of a notes page from its HTML (or an already parsed soup)"""
+    soup = html if isinstance(html, BeautifulSoup) else make_soup(html)
+    with tracing.span("transform", "notes_model"):
+        return build_document(soup)
+
+
+def build_document(soup):
+    """One walk over a parsed notes page"""
+    h1 = soup.find('h1')
+    article = soup.find('article') or soup.body or soup
+    blocks = list(iter_blocks(article))
+
+    document = NotesDocument(
+        title=node_text(h1).strip() if h1 else "Course Content",
+        objectives=extract_objectives(blocks),
+    )
+    section = None
+    subsection = None
+    parts = []
+
+    def flush():
+        text = clean_text(" ".join(parts))
+        if subsection is not None:
+            subsection.text = text
+        elif section is not None:
+            section.text = text
+        else:
+            document.intro = text
+
+    for block in blocks:
+        if isinstance(block, Tag) and block.name in SECTION_TAGS:
+            flush()
+            parts = []
+            heading = node_text(block).strip()
+            if block.name == 'h2':
+                section = Section(heading)
+                document.sections.append(section)
+                subsection = None
+            else:
+                if section is None:
+                    section = Section("")
+                    document.sections.append(section)
+                subsection = Subsection(heading)
+                section.subsections.append(subsection)
+        elif subsection is not None:
+            content = make_block(block)
+            if content:
+                subsection.blocks.append(content)
+        parts.append(node_text(block, separator=' '))
+
+    flush()
+    return document
+
+
+def model_path(html):
+    """Stored model of a notes page with this content (per parser backend)"""
+    return MODEL_DIR / f"{hash_bytes(f'{MODEL_VERSION}:{parser_name()}:{html}'.encode('utf-8'))}.json"
+
+
+def store_notes(html, document):
+    """Store the model of a notes page under the hash of its content"""
+    path = model_path(html)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    with tracing.span("write", "notes_model", file=path):
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(asdict(document), f, ensure_ascii=False, separators=(',', ':'))
+        temp_path.replace(path)
+
+
+def seed_notes(html, soup=None):
+    """Store the model of a page just written, reusing its parsed soup when there is one"""
+    if not model_path(html).exists():
+        store_notes(html, parse_notes(soup if soup is not None else html))
+
+
+def load_notes(notes_path):
+    """Model of a notes file: the stored one if its content is unchanged, otherwise parsed and stored"""
+    with tracing.span("read", file=notes_path) as span:
+        with open(notes_path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        span.set(bytes_in=len(html))
+    try:
+        with tracing.span("read", "notes_model", file=notes_path):
+            with open(model_path(html), 'r', encoding='utf-8') as f:
+                document = NotesDocument.from_dict(json.load(f))
+        tracing.count("notes_model_hits")
+        return document
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+        pass
+    tracing.count("notes_model_misses")
+    document = parse_notes(html)
+    store_notes(html, document)
+    return document
+
+
+def main():
+    """Store the model of every notes file (for a build that starts without the pipeline)"""
+    base_dir = Path(__file__).parent.parent
+    for notes_path in sorted(base_dir.glob("Week */Week_*_Student_Notes.html")):
+        document = load_notes(notes_path)
+        subsections = sum(len(section.subsections) for section in document.sections)
+        print(f"✓ {notes_path.name}: {len(document.sections)} sections, {subsections} subsections")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Student Notes Post-Processing Pipeline
+Runs the notes clean-up and enhancement stages over every Week_X_Student_Notes.html
+in a single pass: each file is read once, parsed at most once and written once.
+
+Stages always run in the order of PIPELINE_STAGES. "text" stages work on the raw
+HTML string, "tree" stages on a shared BeautifulSoup document; the engine only
+converts between the two when the stage kind changes. Nothing is written until
+every stage has succeeded, so a failing stage leaves the file untouched.
+
+With --stream the clean-up stages that have one use their single-pass,
+tag-aware streaming variant (html_stream.py) instead.
+
+The document model of every processed file (notes_model.py) is stored on the
+way out, built from the final tree when the last stage was a tree stage, so the
+slide, PowerPoint and course context generators do not parse the notes again.
+"""
+
+from bs4 import BeautifulSoup
+from pathlib import Path
+import argparse
+import re
+
+from remove_emojis import scrub_emojis, remove_emojis_stream
+from repair_html import repair_html, repair_html_stream
+from deep_clean import deep_clean_twice, deep_clean_stream
+from spot_repair import spot_repair, spot_repair_stream
+from refine_nav_and_tooltips import refine_content
+from add_glossary_tooltips import apply_glossary_tooltips
+from add_navigation import apply_navigation, find_neighbours
+from icons import write_sprite
+from html_parsing import make_soup
+from notes_model import seed_notes
+from output_writer import summary, write_if_changed
+import tracing
+from vut_theme import write_stylesheet
+
+
+def scrub_emojis_stage(content, html_file):
+    """Remove emoji icons in one pass and report how many were found"""
+    content, removed = scrub_emojis(content)
+    if removed:
+        print(f"  🧹 Removed {removed} emoji(s)")
+    return content
+
+
+def navigation_stage(soup, html_file):
+    """Rebuild the previous/next chapter bar for this week"""
+    prev_item, next_item = find_neighbours(html_file.name)
+    if not apply_navigation(soup, prev_item, next_item):
+        print("  ⚠️ No article tag found, navigation skipped")
+    return soup
+
+
+# (name, kind, function) - functions take (document, html_file) and return the document
+PIPELINE_STAGES = [
+    ("remove_emojis", "text", scrub_emojis_stage),
+    ("repair_html", "text", lambda content, html_file: repair_html(content)),
+    ("deep_clean", "text", lambda content, html_file: deep_clean_twice(content)),
+    ("spot_repair", "text", lambda content, html_file: spot_repair(content)),
+    ("refine_nav", "text", lambda content, html_file: refine_content(content)),
+    # Notes live one folder below glossary.html and css/
+    ("glossary_tooltips", "tree", lambda soup, html_file: apply_glossary_tooltips(soup, "../glossary.html", "../")),
+    ("navigation", "tree", navigation_stage),
+]
+
+# The repair stages strip glossary markup wholesale and are only meant for
+# recovering corrupted files, so they must be asked for explicitly.
+REPAIR_STAGES = ["repair_html", "deep_clean", "spot_repair"]
+DEFAULT_STAGES = [name for name, _, _ in PIPELINE_STAGES if name not in REPAIR_STAGES]
+
+# Streaming replacements for text stages, used with --stream
+STREAM_STAGES = {
+    "remove_emojis": lambda content, html_file: remove_emojis_stream(content),
+    "repair_html": lambda content, html_file: repair_html_stream(content),
+    "deep_clean": lambda content, html_file: deep_clean_stream(content),
+    "spot_repair": lambda content, html_file: spot_repair_stream(content),
+}
+
+
+def find_notes_files(base_dir):
+    """Return all student notes files in week order"""
+    notes_files = []
+    for week_dir in base_dir.glob("Week *"):
+        if week_dir.is_dir():
+            notes_files.extend(week_dir.glob("*Student_Notes.html"))
+    return sorted(notes_files, key=lambda p: int(re.search(r'Week_(\d+)_', p.name).group(1)))
+
+
+def run_stages(content, html_file, stage_names, stream=False):
+    """Run the selected stages in pipeline order and return the final document (str or soup)"""
+    document = content
+    kind = "text"
+
+    for name, stage_kind, stage in PIPELINE_STAGES:
+        if name not in stage_names:
+            continue
+        if stream and name in STREAM_STAGES:
+            stage = STREAM_STAGES[name]
+
+        if stage_kind != kind:
+            if stage_kind == "tree":
+                document = make_soup(document)
+            else:
+                document = str(document)
+            kind = stage_kind
+
+        with tracing.span("transform", name, file=html_file):
+            document = stage(document, html_file)
+
+    return document
+
+
+def process_file(html_file, stage_names, stream=False):
+    """Process one notes file; returns True if its content changed"""
+    with tracing.span("read", file=html_file) as span:
+        with open(html_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        span.set(bytes_in=len(content))
+
+    document = run_stages(content, html_file, stage_names, stream)
+    with tracing.span("serialize", file=html_file) as span:
+        processed = str(document)
+        span.set(bytes_out=len(processed))
+    seed_notes(processed, document if isinstance(document, BeautifulSoup) else None)
+
+    return write_if_changed(html_file, processed)
+
+
+def main():
+    stage_names = [name for name, _, _ in PIPELINE_STAGES]
+
+    parser = argparse.ArgumentParser(description="Run the student notes post-processing stages in one pass.")
+    parser.add_argument("--stages", help=f"Comma separated stages to run (default: {','.join(DEFAULT_STAGES)})")
+    parser.add_argument("--repair", action="store_true", help="Also run the corruption repair stages")
+    parser.add_argument("--stream", action="store_true", help="Use the streaming variants of the clean-up stages")
+    args = parser.parse_args()
+
+    if args.stages:
+        selected = [name.strip() for name in args.stages.split(",") if name.strip()]
+        unknown = [name for name in selected if name not in stage_names]
+        if unknown:
+            parser.error(f"Unknown stage(s): {', '.join(unknown)}. Available: {', '.join(stage_names)}")
+    else:
+        selected = list(DEFAULT_STAGES)
+    if args.repair:
+        selected += REPAIR_STAGES
+
+    base_dir = Path(__file__).parent.parent
+    print("=" * 70)
+    print("Student Notes Pipeline")
+    print("=" * 70)
+    print(f"Stages: {' -> '.join(name for name in stage_names if name in selected)}")
+    if args.stream:
+        print(f"Streaming: {', '.join(name for name in stage_names if name in selected and name in STREAM_STAGES)}")
+    print()
+
+    if "glossary_tooltips" in selected:
+        write_stylesheet()
+    if "navigation" in selected:
+        write_sprite()
+
+    processed = 0
+    changed = 0
+    for html_file in find_notes_files(base_dir):
+        print(f"Processing: {html_file.name}")
+        if process_file(html_file, selected, args.stream):
+            changed += 1
+        processed += 1
+
+    print()
+    print("=" * 70)
+    print(f"✅ Processed {processed} files ({changed} changed)")
+    print(summary())
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Optimize Week Images
+Image stage for the weekly images/ folders, run after new images are deployed
+(deploy_week4_images.py calls it for Week 4):
+- PNGs are recompressed losslessly; the result only replaces the original when
+  it is smaller
+- every image gets downscaled WebP variants (images/responsive/<name>-<width>w.webp)
+- <img> tags in the notes and slides that point at a week image get a srcset of
+  those variants, sizes for the rendered width, intrinsic width/height (so the
+  page does not jump while they load), loading="lazy" (except the first image of
+  a page, usually the hero) and decoding="async"
+
+The original file stays the src, so browsers without srcset support still get
+an image. Variants are cached by the content hash of their source (build cache),
+so only new or changed images are processed. Variants of deleted images are
+removed.
+
+Requires Pillow (pip install pillow); without it the stage is skipped.
+"""
+
+from pathlib import Path
+from urllib.parse import unquote
+import argparse
+import io
+import re
+
+from build_cache import BuildCache
+from output_writer import summary, write_if_changed
+import tracing
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg"}
+VARIANT_DIR = "responsive"
+VARIANT_WIDTHS = (480, 768, 1024)
+WEBP_QUALITY = 80
+
+# Rendered size limits of content images: the notes column (max-w-4xl) and the
+# prose img max-height
+CONTENT_WIDTH = 896
+MAX_IMAGE_HEIGHT = 500
+
+IMG_TAG = re.compile(r'<img\b([^>]*?)\s*(/?)>', re.IGNORECASE)
+ATTRIBUTE = re.compile(r'([^\s=/]+)(?:="([^"]*)")?')
+# Attributes this stage sets; older values are dropped before they are added again
+STAGE_ATTRIBUTES = {"srcset", "sizes", "width", "height", "loading", "decoding"}
+
+
+def variant_widths(width):
+    """Widths of the variants for an image this wide; never upscaled"""
+    return sorted({w for w in VARIANT_WIDTHS if w < width} | {min(width, VARIANT_WIDTHS[-1])})
+
+
+def variant_path(image_path, width):
+    """Path of one WebP variant of an image"""
+    image_path = Path(image_path)
+    return image_path.parent / VARIANT_DIR / f"{image_path.stem}-{width}w.webp"
+
+
+def recompress_png(image_path):
+    """Re-save a PNG with maximum lossless compression; returns the bytes saved (0 if kept)"""
+    image_path = Path(image_path)
+    with tracing.span("transform", "png_recompress", file=image_path), Image.open(image_path) as image:
+        image.load()
+        buffer = io.BytesIO()
+        image.save(buffer, "PNG", optimize=True)
+
+    saved = image_path.stat().st_size - buffer.tell()
+    if saved <= 0:
+        return 0
+    write_if_changed(image_path, buffer.getvalue())
+    return saved
+
+
+def build_variants(image_path, cache):
+    """Write the stale WebP variants of one image; returns how many were written"""
+    with Image.open(image_path) as image:
+        widths = variant_widths(image.width)
+        inputs = [image_path, ("variant_widths", VARIANT_WIDTHS), ("webp_quality", WEBP_QUALITY)]
+        stale = [w for w in widths if not cache.is_current(variant_path(image_path, w), inputs)]
+        if not stale:
+            return 0
+
+        image.load()
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+        for width in stale:
+            height = round(image.height * width / image.width)
+            variant = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            output_path = variant_path(image_path, width)
+            output_path.parent.mkdir(exist_ok=True)
+            with tracing.span("transform", "webp_variant", file=output_path, width=width):
+                buffer = io.BytesIO()
+                variant.save(buffer, "WEBP", quality=WEBP_QUALITY, method=6)
+            write_if_changed(output_path, buffer.getvalue())
+            cache.record(output_path, inputs)
+    return len(stale)
+
+
+def optimize_folder(images_dir, cache):
+    """Recompress and build variants for every image in a week's images/ folder.
+
+    Returns {resolved image path: (width, height)} for the page rewrite.
+    """
+    images_dir = Path(images_dir)
+    images = {}
+    wanted = set()
+    for image_path in sorted(images_dir.iterdir()):
+        if image_path.suffix.lower() not in IMAGE_SUFFIXES:
+            continue
+
+        if image_path.suffix.lower() == ".png" and not cache.is_current(image_path, [("png_optimize", True)]):
+            saved = recompress_png(image_path)
+            if saved:
+                print(f"  🗜️  {image_path.name}: {saved / 1024:.1f} KB smaller")
+            cache.record(image_path, [("png_optimize", True)])
+
+        written = build_variants(image_path, cache)
+        if written:
+            print(f"  🖼️  {image_path.name}: {written} variant(s)")
+
+        with Image.open(image_path) as image:
+            images[image_path.resolve()] = image.size
+        wanted.update(variant_path(image_path, w).name for w in variant_widths(image.width))
+
+    variants_dir = images_dir / VARIANT_DIR
+    if variants_dir.is_dir():
+        for stale in variants_dir.glob("*.webp"):
+            if stale.name not in wanted:
+                stale.unlink()
+    return images
+
+
+def responsive_attributes(src, size):
+    """srcset/sizes/width/height attributes for an image of the given size"""
+    width, height = size
+    base = src.rsplit('/', 1)[0] + '/' if '/' in src else ''
+    stem = Path(unquote(src.rsplit('/', 1)[-1])).stem
+    srcset = ", ".join(f"{base}{VARIANT_DIR}/{stem}-{w}w.webp {w}w" for w in variant_widths(width))
+    rendered = min(CONTENT_WIDTH, width, round(width * MAX_IMAGE_HEIGHT / height))
+    return {
+        "srcset": srcset,
+        "sizes": f"(max-width: {rendered}px) 100vw, {rendered}px",
+        "width": str(width),
+        "height": str(height),
+    }
+
+
+def rewrite_images(html, page_dir, images):
+    """Add srcset, sizes and lazy loading to the <img> tags that show a known image.
+
+    Returns (new html, number of tags rewritten).
+    """
+    page_dir = Path(page_dir)
+    rewritten = 0
+
+    def rewrite(match):
+        nonlocal rewritten
+        attributes = dict(ATTRIBUTE.findall(match.group(1)))
+        src = attributes.get("src")
+        if not src or "://" in src:
+            return match.group()
+        size = images.get((page_dir / unquote(src)).resolve())
+        if size is None:
+            return match.group()
+
+        attributes = {name: value for name, value in attributes.items() if name not in STAGE_ATTRIBUTES}
+        attributes.update(responsive_attributes(src, size))
+        # The first image of a page is usually above the fold
+        if rewritten:
+            attributes["loading"] = "lazy"
+        attributes["decoding"] = "async"
+        rewritten += 1
+        # Sorted the way BeautifulSoup writes them, so the notes pipeline keeps the tag as it is
+        text = " ".join(f'{name}="{value}"' for name, value in sorted(attributes.items()))
+        return f"<img {text}{match.group(2)}>"
+
+    return IMG_TAG.sub(rewrite, html), rewritten
+
+
+def rewrite_page(page_path, images):
+    """Rewrite one page in place (line endings preserved); returns True if it changed"""
+    with tracing.span("read", file=page_path) as span:
+        with open(page_path, 'r', encoding='utf-8', newline='') as f:
+            html = f.read()
+        span.set(bytes_in=len(html))
+    with tracing.span("transform", "responsive_images", file=page_path):
+        new_html, _ = rewrite_images(html, Path(page_path).parent, images)
+    return write_if_changed(page_path, new_html, newline='')
+
+
+def find_pages(base_dir):
+    """Notes and slide pages of every week"""
+    pages = []
+    for pattern in ("Week */*_Student_Notes.html", "Week */*_Slides.html"):
+        pages.extend(Path(base_dir).glob(pattern))
+    return sorted(pages)
+
+
+def optimize_images(base_dir, cache, week_dirs=None):
+    """Run the stage over the given week folders (default: all) and rewrite every page.
+
+    Pages of all weeks are rewritten, since notes can show another week's images.
+    Returns False if Pillow is not installed.
+    """
+    if Image is None:
+        print("⚠️  Pillow is not installed (pip install pillow), image optimization skipped")
+        return False
+
+    base_dir = Path(base_dir)
+    images = {}
+    for week_dir in sorted(week_dirs or base_dir.glob("Week *")):
+        images_dir = Path(week_dir) / "images"
+        if not images_dir.is_dir():
+            continue
+        print(f"Optimizing: {images_dir.relative_to(base_dir)}")
+        images.update(optimize_folder(images_dir, cache))
+
+    if week_dirs:
+        # Sizes of the other weeks' images, so their tags keep their attributes
+        for images_dir in base_dir.glob("Week */images"):
+            for image_path in images_dir.iterdir():
+                if image_path.suffix.lower() in IMAGE_SUFFIXES and image_path.resolve() not in images:
+                    with Image.open(image_path) as image:
+                        images[image_path.resolve()] = image.size
+
+    changed = [page for page in find_pages(base_dir) if rewrite_page(page, images)]
+    for page in changed:
+        print(f"  ✅ Responsive images: {page.name}")
+    cache.save()
+    print(summary())
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompress week images, build responsive variants and rewrite <img> tags.")
+    parser.add_argument("--force", action="store_true", help="Rebuild every variant even if it is up to date")
+    parser.add_argument("--week", type=int, action="append", help="Only optimize this week's images (repeatable)")
+    args = parser.parse_args()
+
+    base_dir = Path(__file__).parent.parent
+    cache = BuildCache(base_dir, force=args.force)
+    week_dirs = None
+    if args.week:
+        week_dirs = [path for path in base_dir.glob("Week *")
+                     if int(re.match(r'Week (\d+)', path.name).group(1)) in args.week]
+
+    print("=" * 70)
+    print("Optimizing Week Images")
+    print("=" * 70)
+    print()
+
+    optimize_images(base_dir, cache, week_dirs)
+
+
+if __name__ == "__main__":
+    main()
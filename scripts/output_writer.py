@@ -0,0 +1,94 @@
+"""
+Output Writer
+Every generator writes its output files through write_if_changed(), which:
+
+- leaves the file alone (mtime included) when it already holds exactly the new
+  content: compared by size first, then by content hash
+- otherwise writes a temporary file next to it and renames it into place, so
+  an interrupted run never leaves a half-written page behind
+
+A no-op rebuild therefore touches no files, and the deploy only uploads pages
+that really changed. The number of changed and unchanged outputs is counted
+per process; generators print summary() at the end. Counts made in week_pool
+worker processes are sent back to the parent like trace events.
+"""
+
+from pathlib import Path
+import os
+
+from build_cache import hash_bytes, hash_file
+import tracing
+
+_counts = {"changed": 0, "unchanged": 0}
+
+
+def encode(content, encoding='utf-8', newline=None):
+    """Bytes that open(path, 'w', encoding=encoding, newline=newline).write(content) would write"""
+    if isinstance(content, bytes):
+        return content
+    if newline is None:
+        newline = os.linesep
+    if newline:
+        content = content.replace('\n', newline)
+    return content.encode(encoding)
+
+
+def same_content(path, data):
+    """True if the file exists and holds exactly these bytes"""
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+    except FileNotFoundError:
+        return False
+    return hash_file(path) == hash_bytes(data)
+
+
+def replace_file(path, data):
+    """Write bytes to a temporary file next to path, then rename it over path"""
+    path = Path(path)
+    temp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        if path.exists():
+            os.chmod(temp_path, path.stat().st_mode & 0o7777)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_if_changed(path, content, encoding='utf-8', newline=None):
+    """Write content (str or bytes) to path unless it already holds it; returns True if written"""
+    data = encode(content, encoding, newline)
+    with tracing.span("write", file=path, bytes_out=len(data)) as span:
+        changed = not same_content(path, data)
+        if changed:
+            replace_file(path, data)
+        span.set(changed=changed)
+    _counts["changed" if changed else "unchanged"] += 1
+    return changed
+
+
+def counts():
+    """Changed and unchanged outputs written by this process so far"""
+    return dict(_counts)
+
+
+def drain():
+    """Take the counts made so far (sent back from worker processes)"""
+    taken = counts()
+    for key in _counts:
+        _counts[key] = 0
+    return taken
+
+
+def merge(taken):
+    """Add counts made in a worker process to this process's counts"""
+    for key, value in taken.items():
+        _counts[key] += value
+
+
+def summary():
+    """One line report of the outputs written, for the end of a generator's log"""
+    return f"📝 Outputs: {_counts['changed']} changed, {_counts['unchanged']} unchanged"
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Quiz Bank Compiler
+Validates the quiz question banks (QUIZ_QUESTIONS in generate_quizzes.py, which
+merges WEEKS_3_12_QUESTIONS) and compiles each week into the compact payload the
+shared quiz runtime (js/quiz_runtime.js) grades from.
+
+Validation runs once at build time, and any problem fails the build:
+- every question has the fields its type needs
+- a scenario's answer is one of its options, and its options are distinct
+- no question text appears twice anywhere in the course
+
+Compiled payload per week:
+    {"week": N,
+     "questions": [{"type", "question", "explanation",
+                    "options" + "answer" (index of the correct option)   scenario
+                    "accept" (normalized accepted answers)               fill_blank, command
+                    "prompt"                                             command}],
+     "by_type": {type: [question indices]}}
+
+The cumulative exam merges every week into one payload (compile_exam) with the
+same question format, each question also carrying its "week" and glossary
+"category", plus prebuilt indices so the runtime samples it without any scan:
+    {"exam": true, "paper_size": N, "stratify": "by_category",
+     "weights": {category: topic weight}, "questions": [...],
+     "by_week": {week: [indices]}, "by_type": {...}, "by_category": {...}}
+A question's category is the glossary category of the terms it mentions most
+(trie-matched glossary terms), or the main category of its week's glossary terms.
+
+Typed answers are normalized with normalize_answer(); quiz_runtime.js applies the
+same normalization to the student's input and grades with a Set lookup.
+
+Papers are drawn by a seeded, stratified sampler, implemented identically here
+and in quiz_runtime.js so a paper can be reconstructed from its seed:
+- mulberry32 generates the random stream from a 32-bit seed
+- each stratum (question type) gets a quota of the paper, allocated with the
+  Sainte-Lague method in proportion to its weight (default: its size)
+- each stratum keeps a sparse partial Fisher-Yates shuffle that later attempts
+  continue, so retries avoid earlier questions until the stratum runs out, and
+  a draw costs O(quota) whatever the pool size
+- the drawn questions are then shuffled into paper order
+
+Run directly to validate all banks without generating anything, or to rebuild
+the paper a student saw:
+
+    python scripts/quiz_bank.py
+    python scripts/quiz_bank.py --week 3 --seed 123456789 --attempt 2
+    python scripts/quiz_bank.py --exam --seed 123456789
+"""
+
+from collections import Counter
+import argparse
+import re
+import sys
+
+from glossary_store import glossary_terms
+from scrubber import trie_pattern
+
+QUESTION_TYPES = ("scenario", "fill_blank", "command")
+
+PAPER_SIZE = 15
+FALLBACK_CATEGORY = "General"
+
+REQUIRED_FIELDS = {
+    "scenario": ("question", "options", "answer", "explanation"),
+    "fill_blank": ("question", "answer", "explanation"),
+    "command": ("question", "prompt", "answer", "explanation"),
+}
+
+
+class QuizBankError(Exception):
+    """Raised with every problem found in the question banks"""
+
+    def __init__(self, problems):
+        self.problems = list(problems)
+        super().__init__(f"{len(self.problems)} problem(s) in the quiz question banks:\n"
+                         + "\n".join(f"  - {problem}" for problem in self.problems))
+
+
+def normalize_answer(text):
+    """Canonical form of a typed answer: trimmed, single-spaced, lowercase"""
+    return " ".join(str(text).split()).lower()
+
+
+def _describe(week, qtype, position, entry):
+    question = str(entry.get("question", "")) if isinstance(entry, dict) else ""
+    snippet = question[:60] + ("..." if len(question) > 60 else "")
+    return f"Week {week} {qtype} #{position + 1} ({snippet or 'no question text'})"
+
+
+def validate_question(week, qtype, position, entry):
+    """Return the problems with one question entry"""
+    where = _describe(week, qtype, position, entry)
+    if not isinstance(entry, dict):
+        return [f"{where}: entry is not a dict"]
+
+    problems = []
+    for field in REQUIRED_FIELDS[qtype]:
+        value = entry.get(field)
+        if value is None or (isinstance(value, str) and not value.strip()):
+            problems.append(f"{where}: missing '{field}'")
+    if problems:
+        return problems
+
+    if qtype == "scenario":
+        options = entry["options"]
+        if not isinstance(options, list) or len(options) < 2:
+            problems.append(f"{where}: needs a list of at least two options")
+        else:
+            if entry["answer"] not in options:
+                problems.append(f"{where}: answer {entry['answer']!r} is not one of the options")
+            if len(set(options)) != len(options):
+                problems.append(f"{where}: duplicate options")
+    else:
+        alternatives = entry.get("alternatives", [])
+        if not isinstance(alternatives, list):
+            problems.append(f"{where}: 'alternatives' must be a list")
+
+    return problems
+
+
+def compile_question(qtype, entry):
+    """Compile a validated question entry into its payload form"""
+    compiled = {"type": qtype, "question": entry["question"]}
+
+    if qtype == "scenario":
+        compiled["options"] = list(entry["options"])
+        compiled["answer"] = entry["options"].index(entry["answer"])
+    else:
+        if qtype == "command":
+            compiled["prompt"] = entry["prompt"]
+        accepted = [entry["answer"]] + list(entry.get("alternatives", []))
+        compiled["accept"] = sorted({normalize_answer(answer) for answer in accepted})
+
+    compiled["explanation"] = entry["explanation"]
+    return compiled
+
+
+def compile_banks(banks):
+    """Validate every week's bank and compile it; returns {week: payload}.
+
+    Raises QuizBankError listing all problems if any bank is malformed.
+    """
+    problems = []
+    seen = {}
+    payloads = {}
+
+    for week in sorted(banks):
+        bank = banks[week]
+        questions = []
+        by_type = {}
+
+        for qtype, entries in bank.items():
+            if qtype not in REQUIRED_FIELDS:
+                problems.append(f"Week {week}: unknown question type '{qtype}'")
+                continue
+            for position, entry in enumerate(entries):
+                entry_problems = validate_question(week, qtype, position, entry)
+                if entry_problems:
+                    problems.extend(entry_problems)
+                    continue
+
+                key = normalize_answer(entry["question"])
+                where = _describe(week, qtype, position, entry)
+                if key in seen:
+                    problems.append(f"{where}: duplicate of {seen[key]}")
+                    continue
+                seen[key] = where
+
+                by_type.setdefault(qtype, []).append(len(questions))
+                questions.append(compile_question(qtype, entry))
+
+        payloads[week] = {"week": week, "questions": questions, "by_type": by_type}
+
+    if problems:
+        raise QuizBankError(problems)
+    return payloads
+
+
+def term_names(term):
+    """Names a glossary term is written as: 'Virtual Machine (VM)' -> ['Virtual Machine', 'VM']"""
+    match = re.fullmatch(r'(.*?)\s*\((.*?)\)', term)
+    return [match.group(1), match.group(2)] if match else [term]
+
+
+class QuestionCategorizer:
+    """Assign questions the glossary category of the terms they mention"""
+
+    def __init__(self, entries):
+        self.categories = {}
+        week_categories = {}
+        for entry in entries:
+            for name in term_names(entry['term']):
+                self.categories.setdefault(name.lower(), entry['category'])
+            if entry.get('week') is not None:
+                week_categories.setdefault(entry['week'], Counter())[entry['category']] += 1
+
+        self.week_category = {week: counts.most_common(1)[0][0]
+                              for week, counts in week_categories.items()}
+        self.pattern = re.compile(r'\b' + trie_pattern(self.categories) + r'\b', re.IGNORECASE)
+
+    def __call__(self, week, question):
+        """Most mentioned category (first mentioned on a tie), else the week's main category"""
+        text = " ".join([question["question"], question.get("prompt", ""), question["explanation"]])
+        mentions = Counter(self.categories[match.group(0).lower()]
+                           for match in self.pattern.finditer(text))
+        if mentions:
+            return mentions.most_common(1)[0][0]
+        return self.week_category.get(week, FALLBACK_CATEGORY)
+
+
+def compile_exam(payloads, paper_size, weights=None, categorize=None):
+    """Merge compiled weekly payloads into the cumulative exam payload.
+
+    weights maps glossary category -> topic weight (the sampler's stratum
+    weight); categories without one get weight 1.
+    """
+    categorize = categorize or QuestionCategorizer(glossary_terms().values())
+    questions = []
+    by_week, by_type, by_category = {}, {}, {}
+
+    for week in sorted(payloads):
+        for question in payloads[week]["questions"]:
+            category = categorize(week, question)
+            index = len(questions)
+            by_week.setdefault(week, []).append(index)
+            by_type.setdefault(question["type"], []).append(index)
+            by_category.setdefault(category, []).append(index)
+            questions.append({**question, "week": week, "category": category})
+
+    weights = weights or {}
+    return {
+        "exam": True,
+        "paper_size": paper_size,
+        "stratify": "by_category",
+        "weights": {category: weights.get(category, 1) for category in sorted(by_category)},
+        "questions": questions,
+        "by_week": by_week,
+        "by_type": by_type,
+        "by_category": by_category,
+    }
+
+
+def mulberry32(seed):
+    """mulberry32 PRNG: returns a function yielding floats in [0, 1), same stream as quiz_runtime.js"""
+    state = seed & 0xffffffff
+
+    def next_float():
+        nonlocal state
+        state = (state + 0x6D2B79F5) & 0xffffffff
+        t = ((state ^ (state >> 15)) * (1 | state)) & 0xffffffff
+        t = ((t + (((t ^ (t >> 7)) * (61 | t)) & 0xffffffff)) & 0xffffffff) ^ t
+        return ((t ^ (t >> 14)) & 0xffffffff) / 4294967296
+
+    return next_float
+
+
+def allocate_quotas(sizes, weights, total):
+    """Split a paper of `total` questions over strata (Sainte-Lague, capped by stratum size).
+
+    sizes and weights map stratum key -> number; keys are handled in sorted order
+    and ties go to the earlier key.
+    """
+    keys = sorted(sizes)
+    quotas = {key: 0 for key in keys}
+    total = min(total, sum(sizes.values()))
+
+    for _ in range(total):
+        best = None
+        for key in keys:
+            if quotas[key] >= sizes[key] or weights.get(key, 0) <= 0:
+                continue
+            priority = weights[key] / (2 * quotas[key] + 1)
+            if best is None or priority > best_priority:
+                best, best_priority = key, priority
+        if best is None:
+            break
+        quotas[best] += 1
+
+    return quotas
+
+
+class StratumSampler:
+    """Sparse partial Fisher-Yates shuffle over one stratum, continued across attempts"""
+
+    def __init__(self, items):
+        self.items = items
+        self.swaps = {}
+        self.position = 0
+
+    def draw(self, count, rng):
+        """Draw `count` distinct items, restarting the shuffle if too few are left unseen"""
+        n = len(self.items)
+        if n - self.position < count:
+            self.swaps = {}
+            self.position = 0
+
+        drawn = []
+        for _ in range(count):
+            i = self.position
+            j = i + int(rng() * (n - i))
+            picked = self.swaps.get(j, j)
+            self.swaps[j] = self.swaps.get(i, i)
+            drawn.append(self.items[picked])
+            self.position += 1
+        return drawn
+
+
+def sample_paper(strata, seed, attempt=1, size=PAPER_SIZE, weights=None):
+    """Return the question indices of the paper for a seed and attempt number.
+
+    strata maps stratum key -> question indices. Attempts before `attempt` are
+    drawn first, exactly as the quiz page does on each retry.
+    """
+    rng = mulberry32(seed)
+    sizes = {key: len(items) for key, items in strata.items()}
+    weights = weights or sizes
+    samplers = {key: StratumSampler(strata[key]) for key in sorted(strata)}
+    quotas = allocate_quotas(sizes, weights, size)
+
+    for _ in range(attempt):
+        paper = []
+        for key in sorted(strata):
+            paper.extend(samplers[key].draw(quotas[key], rng))
+        for i in range(len(paper) - 1, 0, -1):
+            j = int(rng() * (i + 1))
+            paper[i], paper[j] = paper[j], paper[i]
+
+    return paper
+
+
+def sample_payload_paper(payload, seed, attempt=1):
+    """sample_paper with the strata, weights and size a payload declares (weekly quiz or exam)"""
+    strata = payload[payload.get("stratify", "by_type")]
+    return sample_paper({str(key): items for key, items in strata.items()}, seed, attempt,
+                        size=payload.get("paper_size", PAPER_SIZE), weights=payload.get("weights"))
+
+
+def print_paper(payload, seed, attempt):
+    """Print a reconstructed paper with its answers"""
+    paper = sample_payload_paper(payload, seed, attempt)
+    name = "Cumulative exam" if payload.get("exam") else f"Week {payload['week']} quiz"
+    print(f"{name} - seed {seed}, attempt {attempt} ({len(paper)} questions)")
+    print()
+    for number, index in enumerate(paper, 1):
+        question = payload["questions"][index]
+        if question["type"] == "scenario":
+            answer = question["options"][question["answer"]]
+        else:
+            answer = " | ".join(question["accept"])
+        label = question["type"]
+        if payload.get("exam"):
+            label = f"week {question['week']}, {question['category']}, {label}"
+        print(f"{number:2d}. [{label}] {question['question']}")
+        print(f"    Answer: {answer}")
+
+
+def main():
+    from generate_quizzes import EXAM_PAPER_SIZE, EXAM_TOPIC_WEIGHTS, QUIZ_QUESTIONS
+
+    parser = argparse.ArgumentParser(description="Validate the quiz banks or reconstruct a quiz paper from its seed.")
+    parser.add_argument("--week", type=int, help="Week of the paper to reconstruct")
+    parser.add_argument("--exam", action="store_true", help="Reconstruct a cumulative exam paper")
+    parser.add_argument("--seed", type=int, help="Paper seed shown on the quiz page")
+    parser.add_argument("--attempt", type=int, default=1, help="Attempt number (default: 1)")
+    args = parser.parse_args()
+
+    try:
+        payloads = compile_banks(QUIZ_QUESTIONS)
+    except QuizBankError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if args.exam:
+        if args.seed is None:
+            parser.error("--seed is required to reconstruct an exam paper")
+        print_paper(compile_exam(payloads, EXAM_PAPER_SIZE, EXAM_TOPIC_WEIGHTS), args.seed, args.attempt)
+        return
+
+    if args.seed is not None or args.week is not None:
+        if args.seed is None or args.week not in payloads:
+            parser.error("--week (with questions) and --seed are both required to reconstruct a paper")
+        print_paper(payloads[args.week], args.seed, args.attempt)
+        return
+
+    total = sum(len(payload["questions"]) for payload in payloads.values())
+    print(f"✅ {len(payloads)} question banks valid ({total} questions)")
+
+
+if __name__ == "__main__":
+    main()
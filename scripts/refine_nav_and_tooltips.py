@@ -5,10 +5,35 @@ Refine Navigation and Fix Tooltips
 2. Fixes glossary path in tooltips (from 'glossary.html' to '../glossary.html').
 """
 
-from bs4 import BeautifulSoup
 from pathlib import Path
 import re
 
+from output_writer import summary, write_if_changed
+
+def refine_content(content):
+    """Fix tooltip glossary paths and strip legacy index links from notes HTML"""
+    # 1. FIX TOOLTIP PATHS
+    # Replace 'href="glossary.html#' with 'href="../glossary.html#'
+    # But careful not to double-prefix if already correct (though current script wrote incorrect ones)
+    # The current script wrote: href="glossary.html#..."
+    # We want: href="../glossary.html#..."
+
+    # Simple string replacement is safest here as the pattern is distinct
+    content = content.replace('href="glossary.html#', 'href="../glossary.html#')
+
+    # 2. REMOVE LEGACY "BACK TO COURSE INDEX" LINKS
+    # Pattern: <p><a href="../index.html">← Back to Course Index</a></p>
+    # The arrow might be unicode char, so usage of regex is better.
+
+    # Regex for the specific paragraph containing the link
+    # Matches <p> ... <a ...>...Back to Course Index...</a> ... </p>
+    legacy_nav_pattern = r'<p>\s*<a href="\.\./index\.html">.*?Back to Course Index.*?</a>\s*</p>'
+
+    # Remove all occurrences (top and bottom)
+    content = re.sub(legacy_nav_pattern, '', content, flags=re.DOTALL | re.IGNORECASE)
+    
+    return content
+
 def refine_files():
     base_dir = Path(__file__).parent.parent
     print("=" * 70)
@@ -26,32 +51,14 @@ def refine_files():
                 with open(html_file, 'r', encoding='utf-8') as f:
                     content = f.read()
                 
-                # 1. FIX TOOLTIP PATHS
-                # Replace 'href="glossary.html#' with 'href="../glossary.html#'
-                # But careful not to double-prefix if already correct (though current script wrote incorrect ones)
-                # The current script wrote: href="glossary.html#..."
-                # We want: href="../glossary.html#..."
-                
-                # Simple string replacement is safest here as the pattern is distinct
-                content = content.replace('href="glossary.html#', 'href="../glossary.html#')
-                
-                # 2. REMOVE LEGACY "BACK TO COURSE INDEX" LINKS
-                # Pattern: <p><a href="../index.html">← Back to Course Index</a></p>
-                # The arrow might be unicode char, so usage of regex is better.
-                
-                # Regex for the specific paragraph containing the link
-                # Matches <p> ... <a ...>...Back to Course Index...</a> ... </p>
-                legacy_nav_pattern = r'<p>\s*<a href="\.\./index\.html">.*?Back to Course Index.*?</a>\s*</p>'
-                
-                # Remove all occurrences (top and bottom)
-                content = re.sub(legacy_nav_pattern, '', content, flags=re.DOTALL | re.IGNORECASE)
+                content = refine_content(content)
                 
-                with open(html_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                write_if_changed(html_file, content)
                 
                 processed += 1
                 
     print(f"✅ Refined {processed} files")
+    print(summary())
 
 if __name__ == "__main__":
     refine_files()
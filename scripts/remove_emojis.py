@@ -1,46 +1,59 @@
 #!/usr/bin/env python3
 """
 Remove all emoji icons from student notes HTML files
+
+With --stream the files are rewritten in one streaming pass (html_stream.py)
+that only touches text, leaving tags and attributes alone.
 """
 
 from pathlib import Path
-import re
+import argparse
+
+from html_stream import rewrite_file, rewrite_html
+from output_writer import summary, write_if_changed
+from scrubber import Scrubber
+
+# Common emoji icons to remove
+EMOJIS_TO_REMOVE = [
+    '📚', '📖', '💻', '🖥️', '⚙️', '🔧', '🌐', '🔒', 
+    '📊', '📈', '📉', '💾', '🗄️', '🔌', '📡', '🎯',
+    '✨', '🚀', '⭐', '🔥', '💡', '📝', '✅', '❌',
+    '🔍', '🎓', '📋', '📄', '📁', '🏗️', '🔑', '🌟',
+    '⚡', '🛠️', '📦', '🔐', '🌍', '☁️', '💬', '📞'
+]
+
+# Emoji unicode ranges (catches any emoji not listed above)
+EMOJI_RANGES = (
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "]"
+)
+
+EMOJI_SCRUBBER = Scrubber(EMOJIS_TO_REMOVE, [EMOJI_RANGES])
+
+def scrub_emojis(html_content):
+    """Remove emoji icons in one pass; returns (content, number of removals)"""
+    return EMOJI_SCRUBBER.scrub(html_content)
 
 def remove_emojis_from_html(html_content):
     """Remove common emoji icons from HTML content"""
-    
-    # List of emojis to remove
-    emojis_to_remove = [
-        '📚', '📖', '💻', '🖥️', '⚙️', '🔧', '🌐', '🔒', 
-        '📊', '📈', '📉', '💾', '🗄️', '🔌', '📡', '🎯',
-        '✨', '🚀', '⭐', '🔥', '💡', '📝', '✅', '❌',
-        '🔍', '🎓', '📋', '📄', '📁', '🏗️', '🔑', '🌟',
-        '⚡', '🛠️', '📦', '🔐', '🌍', '☁️', '💬', '📞'
-    ]
-    
-    # Remove each emoji
-    for emoji in emojis_to_remove:
-        html_content = html_content.replace(emoji, '')
-    
-    # Also remove emoji pattern using regex (catches any remaining emojis)
-    # This matches emoji unicode ranges
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F1E0-\U0001F1FF"  # flags
-        "\U00002702-\U000027B0"
-        "\U000024C2-\U0001F251"
-        "]+", 
-        flags=re.UNICODE
-    )
-    html_content = emoji_pattern.sub('', html_content)
-    
-    return html_content
+    return EMOJI_SCRUBBER(html_content)
+
+def remove_emojis_stream(html_content):
+    """Streaming variant: remove emojis from text nodes only"""
+    return rewrite_html(html_content, text_edit=remove_emojis_from_html)
 
 def main():
     """Remove emojis from all student notes HTML files"""
+    parser = argparse.ArgumentParser(description="Remove emoji icons from the student notes.")
+    parser.add_argument("--stream", action="store_true", help="Rewrite text nodes in a single streaming pass")
+    args = parser.parse_args()
+
     base_dir = Path(__file__).parent.parent
     
     print("=" * 70)
@@ -49,6 +62,7 @@ def main():
     print()
     
     processed = 0
+    total_removed = 0
     
     # Find all student notes HTML files
     for week_dir in base_dir.glob("Week *"):
@@ -58,30 +72,36 @@ def main():
             for html_file in notes_files:
                 print(f"Processing: {html_file.name}")
                 
-                # Read file
-                with open(html_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Count emojis before
-                original_length = len(content)
-                
-                # Remove emojis
-                cleaned_content = remove_emojis_from_html(content)
-                
-                # Count emojis removed
-                removed_count = original_length - len(cleaned_content)
-                
-                # Write back
-                with open(html_file, 'w', encoding='utf-8') as f:
-                    f.write(cleaned_content)
+                if args.stream:
+                    removed_count = 0
+
+                    def scrub_text(text):
+                        nonlocal removed_count
+                        text, count = scrub_emojis(text)
+                        removed_count += count
+                        return text
+
+                    rewrite_file(html_file, text_edit=scrub_text)
+                else:
+                    # Read file
+                    with open(html_file, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                    
+                    # Remove emojis in one pass, counting removals
+                    cleaned_content, removed_count = scrub_emojis(content)
+                    
+                    # Write back only if something changed
+                    write_if_changed(html_file, cleaned_content)
                 
                 processed += 1
-                print(f"  ✅ Removed {removed_count} emoji characters")
+                total_removed += removed_count
+                print(f"  ✅ Removed {removed_count} emoji(s)")
     
     print()
     print("=" * 70)
     print(f"✅ Processed {processed} HTML files")
-    print(f"   All emoji icons removed")
+    print(f"   {total_removed} emoji icons removed")
+    print(summary())
     print("=" * 70)
 
 if __name__ == "__main__":
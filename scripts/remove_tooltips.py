@@ -6,6 +6,8 @@ Remove all glossary tooltips from student notes HTML files using regex.
 from pathlib import Path
 import re
 
+from output_writer import summary, write_if_changed
+
 def remove_tooltips(html_content):
     # Pattern to match glossary links:
     # <a ... class="glossary-term">Term Text<span class="glossary-tooltip">Def</span></a>
@@ -56,11 +58,11 @@ def main():
                 
                 cleaned = remove_tooltips(content)
                 
-                with open(html_file, 'w', encoding='utf-8') as f:
-                    f.write(cleaned)
+                write_if_changed(html_file, cleaned)
                 processed += 1
                 
     print(f"✅ Cleaned {processed} files")
+    print(summary())
 
 if __name__ == "__main__":
     main()
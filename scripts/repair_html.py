@@ -2,11 +2,32 @@
 """
 Repair corrupted HTML files by stripping broken glossary markup and restoring clean text.
 Includes handling for encoded HTML entities.
+
+With --stream the repair runs as one tag-aware streaming pass (html_stream.py):
+tooltip and icon spans are dropped and glossary-term links unwrapped as elements,
+so other spans and links are never touched.
 """
 
 from pathlib import Path
+import argparse
 import re
 
+from html_stream import DROP, UNWRAP, TagRule, rewrite_file, rewrite_html
+from output_writer import summary, write_if_changed
+
+STREAM_RULES = [
+    TagRule("span", DROP, class_name="glossary-tooltip"),
+    TagRule("span", DROP, class_name="glossary-icon"),
+    TagRule("a", UNWRAP, class_name="glossary-term"),
+]
+
+# Glossary markup that leaked into text, in encoded or raw form
+LEAKED_MARKUP = [
+    'class="glossary-term"&gt;',
+    '&lt;span class="glossary-icon"&gt;&lt;/span&gt;',
+    '&lt;/a&gt;',
+]
+
 def clean_glossary_corruption(content):
     # Pattern 1: Fully formed but nested/broken tags
     # <a href="..." class="glossary-term">Term<span ...>Def</span></a>
@@ -37,7 +58,32 @@ def clean_glossary_corruption(content):
     
     return content
 
+def repair_html(content):
+    """Strip glossary corruption, then double clean common lingering artifacts"""
+    cleaned = clean_glossary_corruption(content)
+    
+    cleaned = cleaned.replace('<span class="glossary-tooltip">', '')
+    cleaned = cleaned.replace('</span></a>', '</a>')
+    cleaned = cleaned.replace('</span>', '') # Risky but necessary for the generic spans left behind? NO.
+    # Only remove spans that look like they belong to tooltips
+    
+    return cleaned
+
+def repair_text_node(text):
+    """Text part of the streaming repair: remove leaked glossary markup"""
+    for leaked in LEAKED_MARKUP:
+        text = text.replace(leaked, '')
+    return re.sub(r'class=["\']glossary-term["\'][^>]*>', '', text)
+
+def repair_html_stream(content):
+    """Streaming variant: drop tooltip/icon spans, unwrap glossary links, repair text nodes"""
+    return rewrite_html(content, STREAM_RULES, repair_text_node)
+
 def main():
+    parser = argparse.ArgumentParser(description="Strip broken glossary markup from the notes.")
+    parser.add_argument("--stream", action="store_true", help="Repair in a single tag-aware streaming pass")
+    args = parser.parse_args()
+
     base_dir = Path(__file__).parent.parent
     print("=" * 70)
     print("Reparing Corrupted HTML Files (Enhanced)")
@@ -49,22 +95,20 @@ def main():
             notes_files = list(week_dir.glob("*Student_Notes.html"))
             for html_file in notes_files:
                 print(f"Repairing: {html_file.name}")
+                if args.stream:
+                    rewrite_file(html_file, STREAM_RULES, repair_text_node)
+                    processed += 1
+                    continue
                 with open(html_file, 'r', encoding='utf-8') as f:
                     content = f.read()
                 
-                cleaned = clean_glossary_corruption(content)
-                
-                # Double clean common lingering artifacts
-                cleaned = cleaned.replace('<span class="glossary-tooltip">', '')
-                cleaned = cleaned.replace('</span></a>', '</a>')
-                cleaned = cleaned.replace('</span>', '') # Risky but necessary for the generic spans left behind? NO.
-                # Only remove spans that look like they belong to tooltips
+                cleaned = repair_html(content)
                 
-                with open(html_file, 'w', encoding='utf-8') as f:
-                    f.write(cleaned)
+                write_if_changed(html_file, cleaned)
                 processed += 1
                 
     print(f"✅ Repaired {processed} files")
+    print(summary())
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,66 @@
+"""
+Literal Scrubber
+Removes a whole list of strings from a document in one pass instead of one
+str.replace per string (emoji icons in remove_emojis.py, leaked glossary
+definitions in deep_clean.py).
+
+The removals are compiled once into a single regex: the literals as a
+character trie (shared prefixes factored out, longest match first) followed by
+any extra patterns, such as emoji code point ranges. Literals an extra pattern
+already matches on its own are left out of the trie.
+
+Single code point literals join the trie rather than a str.translate table:
+with the non-ASCII tables needed here, translate was several times slower than
+the regex scan on the notes files.
+"""
+
+import re
+
+
+def trie_pattern(strings):
+    """Build a regex alternation of strings from a character trie.
+
+    Shared prefixes are factored out so each position is checked in time
+    proportional to the string length, not the number of strings. A string
+    that is a prefix of a longer one becomes an optional tail, so the longest
+    string is tried first.
+    """
+    trie = {}
+    for string in strings:
+        node = trie
+        for char in string:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def node_pattern(node):
+        branches = [re.escape(char) + node_pattern(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            return '(?:' + body + ')?'
+        return body
+
+    return node_pattern(trie)
+
+
+class Scrubber:
+    """Compiled set of literal strings (and regex patterns) to remove"""
+
+    def __init__(self, literals=(), patterns=()):
+        extra = [re.compile(pattern) for pattern in patterns]
+        literals = sorted(literal for literal in set(literals)
+                          if literal and not any(p.fullmatch(literal) for p in extra))
+
+        alternatives = ([trie_pattern(literals)] if literals else []) + [p.pattern for p in extra]
+        self.pattern = re.compile("|".join(alternatives)) if alternatives else None
+
+    def scrub(self, text):
+        """Return (scrubbed text, number of removed matches)"""
+        if self.pattern is None:
+            return text, 0
+        return self.pattern.subn('', text)
+
+    def __call__(self, text):
+        return self.scrub(text)[0]
@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 """
 Final spot repair for specific text artifacts left after HTML repair.
+
+With --stream the repairs are applied to text nodes only, in one streaming pass
+(html_stream.py), so markup and <script>/<style> blocks are left alone.
 """
 
 from pathlib import Path
+import argparse
 import re
 
+from html_stream import rewrite_file, rewrite_html
+from output_writer import summary, write_if_changed
+
 def spot_repair(content):
     # Remove specific artifacts seen in logs
     content = content.replace('A Hypervisor" ', '')
@@ -21,7 +28,15 @@ def spot_repair(content):
     
     return content
 
+def spot_repair_stream(content):
+    """Streaming variant: apply the spot repairs to text nodes only"""
+    return rewrite_html(content, text_edit=spot_repair)
+
 def main():
+    parser = argparse.ArgumentParser(description="Fix text artifacts left after the HTML repair.")
+    parser.add_argument("--stream", action="store_true", help="Repair text nodes in a single streaming pass")
+    args = parser.parse_args()
+
     base_dir = Path(__file__).parent.parent
     print("=" * 70)
     print("Final Spot Repair")
@@ -33,18 +48,22 @@ def main():
             notes_files = list(week_dir.glob("*Student_Notes.html"))
             for html_file in notes_files:
                 print(f"Checking: {html_file.name}")
+                if args.stream:
+                    if rewrite_file(html_file, text_edit=spot_repair):
+                        print(f"  Fixed artifacts in {html_file.name}")
+                        processed += 1
+                    continue
                 with open(html_file, 'r', encoding='utf-8') as f:
                     content = f.read()
                 
                 cleaned = spot_repair(content)
                 
-                if cleaned != content:
+                if write_if_changed(html_file, cleaned):
                     print(f"  Fixed artifacts in {html_file.name}")
-                    with open(html_file, 'w', encoding='utf-8') as f:
-                        f.write(cleaned)
                     processed += 1
                 
     print(f"✅ Polished {processed} files")
+    print(summary())
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Build Tracing
+Per-file, per-stage timing for the build scripts, switched on with an
+environment variable so real rebuilds can be profiled without touching them:
+
+    OPS3_TRACE=traces python scripts/notes_pipeline.py
+    OPS3_TRACE=traces OPS3_TRACE_MEMORY=1 python scripts/convert_notes_to_slides.py -j 4
+    python scripts/tracing.py traces
+
+Scripts mark their work with spans, each in one of the stages read, parse,
+transform, serialize or write (plus a name, e.g. the transform it runs, and the
+file it works on):
+
+    with span("read", file=path) as s:
+        content = f.read()
+        s.set(bytes_in=len(content))
+
+and count events such as parses or cache hits with count("parses").
+
+With OPS3_TRACE=<directory> set, every process writes its spans to
+<directory>/<script>.<pid>.trace.json in Chrome trace format (load it in
+chrome://tracing or https://ui.perfetto.dev) when it exits, and prints a
+summary table per stage to stderr. Running this script on the directory merges
+all traces into one trace.json and prints the summary of the whole build.
+With OPS3_TRACE_MEMORY=1 each span also records the tracemalloc peak reached
+while it was open.
+
+Without OPS3_TRACE, span() and count() do nothing.
+"""
+
+from collections import defaultdict
+from pathlib import Path
+import argparse
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+TRACE_ENV = "OPS3_TRACE"
+MEMORY_ENV = "OPS3_TRACE_MEMORY"
+STAGES = ("read", "parse", "transform", "serialize", "write")
+MERGED_NAME = "trace.json"
+
+
+class Span:
+    """An open span; set() adds arguments such as bytes_in and bytes_out"""
+
+    def __init__(self, stage, name, args):
+        self.stage = stage
+        self.name = name
+        self.args = args
+        self.memory_peak = 0
+
+    def set(self, **args):
+        self.args.update(args)
+
+
+class _NullSpan:
+    """Span handed out while tracing is off"""
+
+    def set(self, **args):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Spans and counters recorded by this process"""
+
+    def __init__(self, trace_dir, memory=False):
+        self.trace_dir = Path(trace_dir)
+        self.memory = memory
+        self.events = []
+        self.counters = defaultdict(int)
+        self._local = threading.local()
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _fold_memory_peak(self):
+        """Credit the tracemalloc peak so far to the innermost open span, then restart it"""
+        stack = self._stack()
+        if stack:
+            stack[-1].memory_peak = max(stack[-1].memory_peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+
+    def span(self, stage, name=None, file=None, **args):
+        if file is not None:
+            args["file"] = Path(file).name
+        return _ActiveSpan(self, Span(stage, name or stage, args))
+
+    def record(self, span, start_ns, end_ns):
+        self.events.append({
+            "name": span.name,
+            "cat": span.stage,
+            "ph": "X",
+            "ts": start_ns / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": span.args,
+        })
+
+    def count(self, name, amount=1):
+        self.counters[name] += amount
+        self.events.append({
+            "name": name,
+            "ph": "C",
+            "ts": time.perf_counter_ns() / 1000,
+            "pid": os.getpid(),
+            "args": {name: self.counters[name]},
+        })
+
+    def drain(self):
+        """Take the events recorded so far (sent back from worker processes)"""
+        events, self.events = self.events, []
+        return events
+
+    def export(self):
+        """Write this process's trace file and print its summary"""
+        if not self.events:
+            return
+        self.trace_dir.mkdir(parents=True, exist_ok=True)
+        script = Path(sys.argv[0]).stem or "python"
+        path = self.trace_dir / f"{script}.{os.getpid()}.trace.json"
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+        print(f"\n⏱️  Trace: {path}", file=sys.stderr)
+        print(format_summary(self.events), file=sys.stderr)
+
+
+class _ActiveSpan:
+    """Context manager timing one span"""
+
+    def __init__(self, tracer, span):
+        self.tracer = tracer
+        self.span = span
+
+    def __enter__(self):
+        if self.tracer.memory:
+            self.tracer._fold_memory_peak()
+        self.tracer._stack().append(self.span)
+        self.start = time.perf_counter_ns()
+        return self.span
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        stack = self.tracer._stack()
+        stack.pop()
+        if self.tracer.memory:
+            peak = max(self.span.memory_peak, tracemalloc.get_traced_memory()[1])
+            self.span.args["memory_peak"] = peak
+            if stack:
+                stack[-1].memory_peak = max(stack[-1].memory_peak, peak)
+            tracemalloc.reset_peak()
+        self.tracer.record(self.span, self.start, end)
+        return False
+
+
+def _create_tracer():
+    trace_dir = os.environ.get(TRACE_ENV, "").strip()
+    if not trace_dir:
+        return None
+    tracer = Tracer(trace_dir, memory=os.environ.get(MEMORY_ENV, "") not in ("", "0"))
+    atexit.register(tracer.export)
+    return tracer
+
+
+_tracer = _create_tracer()
+
+
+def enabled():
+    """True if spans are being recorded"""
+    return _tracer is not None
+
+
+def span(stage, name=None, file=None, **args):
+    """Time a block of work: stage (read, parse, ...), optional name and file, extra arguments"""
+    if _tracer is None:
+        return _NULL_SPAN
+    return _tracer.span(stage, name, file, **args)
+
+
+def count(name, amount=1):
+    """Add to a counter (parses, cache hits, ...)"""
+    if _tracer is not None:
+        _tracer.count(name, amount)
+
+
+def drain():
+    """Events recorded in this process since the last drain (empty when tracing is off)"""
+    return _tracer.drain() if _tracer is not None else []
+
+
+def merge(events):
+    """Add events recorded by a worker process to this process's trace"""
+    if _tracer is not None:
+        _tracer.events.extend(events)
+
+
+def _format_bytes(value):
+    if not value:
+        return "-"
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+def format_summary(events, by_file=False):
+    """Table of spans per stage and name (and file): count, total, mean and max time, bytes, memory"""
+    rows = defaultdict(lambda: {"count": 0, "total": 0.0, "max": 0.0, "bytes_in": 0, "bytes_out": 0, "memory": 0})
+    counters = {}
+    for event in events:
+        if event["ph"] == "C":
+            # Counter events carry running totals per process
+            counters[(event["pid"], event["name"])] = event["args"][event["name"]]
+            continue
+        key = (event["cat"], event["name"], event["args"].get("file", "") if by_file else "")
+        row = rows[key]
+        row["count"] += 1
+        row["total"] += event["dur"] / 1000
+        row["max"] = max(row["max"], event["dur"] / 1000)
+        row["bytes_in"] += event["args"].get("bytes_in", 0)
+        row["bytes_out"] += event["args"].get("bytes_out", 0)
+        row["memory"] = max(row["memory"], event["args"].get("memory_peak", 0))
+
+    stage_order = {stage: position for position, stage in enumerate(STAGES)}
+    lines = [f"{'stage':<10} {'name':<28} {'count':>6} {'total ms':>10} {'mean ms':>9} {'max ms':>9} "
+             f"{'in':>9} {'out':>9} {'mem peak':>9}"]
+    for (stage, name, file), row in sorted(rows.items(), key=lambda item: (stage_order.get(item[0][0], len(STAGES)), -item[1]["total"])):
+        label = f"{name} {file}".strip()
+        lines.append(f"{stage:<10} {label[:28]:<28} {row['count']:>6} {row['total']:>10.1f} "
+                     f"{row['total'] / row['count']:>9.2f} {row['max']:>9.1f} "
+                     f"{_format_bytes(row['bytes_in']):>9} {_format_bytes(row['bytes_out']):>9} {_format_bytes(row['memory']):>9}")
+
+    totals = defaultdict(int)
+    for (pid, name), value in counters.items():
+        totals[name] += value
+    if totals:
+        lines.append("counters: " + ", ".join(f"{name}={value}" for name, value in sorted(totals.items())))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge the trace files of a build and print its summary.")
+    parser.add_argument("trace_dir", help="Directory OPS3_TRACE pointed at")
+    parser.add_argument("--by-file", action="store_true", help="One summary row per file instead of per stage")
+    args = parser.parse_args()
+
+    trace_dir = Path(args.trace_dir)
+    events = []
+    trace_files = sorted(trace_dir.glob("*.trace.json"))
+    for path in trace_files:
+        with open(path, 'r', encoding='utf-8') as f:
+            events.extend(json.load(f)["traceEvents"])
+    if not events:
+        print(f"⚠️  No traces found in {trace_dir}")
+        return
+
+    merged_path = trace_dir / MERGED_NAME
+    with open(merged_path, 'w', encoding='utf-8') as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    print(format_summary(events, by_file=args.by_file))
+    print()
+    print(f"✅ Merged {len(trace_files)} trace file(s) into {merged_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,876 @@
+#!/usr/bin/env python3
+"""
+VUT Theme
+Single definition of the VUT navy/gold palette and of the styles the generators
+used to inline into every page they wrote. Everything is built into one shared
+stylesheet, css/vut_theme.css, which the pages link instead (so browsers fetch
+and cache it once for the whole course):
+- notes pages (add_glossary_tooltips.py): glossary tooltips
+- glossary page (create_glossary.py, add_chatbot_to_glossary.py): page layout
+  and the AI chat assistant
+- slide decks (convert_notes_to_slides.py)
+- quiz pages (generate_quizzes.py): palette only, css/quiz.css uses the tokens
+
+The palette reaches CSS as custom properties (--vut-gold, and --vut-gold-rgb for
+rgba() with an alpha) and the PowerPoint export through rgb(). Page-specific rules
+are scoped with :where(.glossary-page) / :where(.slide-deck) on the page body, which
+keeps their original specificity.
+
+After changing the palette or the styles run:
+
+    python scripts/vut_theme.py
+"""
+
+from pathlib import Path
+
+from output_writer import write_if_changed
+
+STYLESHEET_PATH = Path(__file__).parent.parent / "css" / "vut_theme.css"
+STYLESHEET_HREF = "css/vut_theme.css"
+
+# VUT brand palette (from the VUT slide template)
+PALETTE = {
+    "navy": "#1e3a5f",        # Main background navy
+    "navy-dark": "#142a46",   # Darker navy for contrast
+    "gold": "#c9984a",        # Official VUT gold
+    "blue": "#002f6e",        # VUT blue, icons on gold buttons
+    "charcoal": "#3d3d3d",    # Dark gray accents
+    "light-gray": "#c8c8c8",  # Secondary text
+    "white": "#ffffff",       # Text and logo
+}
+
+TOOLTIP_STYLES = """
+.glossary-term {
+    color: var(--vut-gold);
+    border-bottom: 2px dotted var(--vut-gold);
+    cursor: help;
+    position: relative;
+    text-decoration: none;
+    transition: all 0.3s;
+}
+
+.glossary-term:hover {
+    color: #ffffff;
+    border-bottom-color: #ffffff;
+}
+
+.glossary-tooltip {
+    visibility: hidden;
+    opacity: 0;
+    position: absolute;
+    z-index: 1000;
+    background: var(--vut-gradient);
+    color: #ffffff;
+    padding: 12px 16px;
+    border-radius: 8px;
+    border: 2px solid var(--vut-gold);
+    font-size: 14px;
+    line-height: 1.5;
+    max-width: 300px;
+    width: max-content;
+    bottom: 125%;
+    left: 50%;
+    transform: translateX(-50%);
+    transition: opacity 0.3s, visibility 0.3s;
+    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
+}
+
+.glossary-tooltip::after {
+    content: "";
+    position: absolute;
+    top: 100%;
+    left: 50%;
+    margin-left: -8px;
+    border-width: 8px;
+    border-style: solid;
+    border-color: var(--vut-gold) transparent transparent transparent;
+}
+
+.glossary-term:hover .glossary-tooltip {
+    visibility: visible;
+    opacity: 1;
+}
+"""
+
+GLOSSARY_PAGE_STYLES = """
+:where(.glossary-page, .glossary-page *) {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body:where(.glossary-page) {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    background: var(--vut-gradient);
+    color: #ffffff;
+    line-height: 1.6;
+    padding: 20px;
+}
+
+:where(.glossary-page) .container {
+    max-width: 1400px;
+    margin: 0 auto;
+}
+
+:where(.glossary-page) header {
+    text-align: center;
+    padding: 40px 20px;
+    background: rgba(var(--vut-navy-rgb), 0.6);
+    border-radius: 15px;
+    margin-bottom: 30px;
+}
+
+:where(.glossary-page) header h1 {
+    font-size: 2.5em;
+    color: var(--vut-gold);
+    margin-bottom: 20px;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    gap: 15px;
+}
+
+:where(.glossary-page) header p {
+    font-size: 1.2em;
+    color: var(--vut-light-gray);
+}
+
+:where(.glossary-page) .search-bar {
+    margin: 30px 0;
+    text-align: center;
+}
+
+:where(.glossary-page) #searchInput {
+    width: 100%;
+    max-width: 600px;
+    padding: 15px 20px;
+    font-size: 1.1em;
+    border: 2px solid var(--vut-gold);
+    border-radius: 10px;
+    background: rgba(255, 255, 255, 0.1);
+    color: #ffffff;
+}
+
+:where(.glossary-page) #searchInput::placeholder {
+    color: var(--vut-light-gray);
+}
+
+:where(.glossary-page) .filter-bar {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 10px;
+    justify-content: center;
+    margin: 20px 0;
+}
+
+:where(.glossary-page) .filter-btn {
+    padding: 10px 20px;
+    background: rgba(var(--vut-gold-rgb), 0.2);
+    border: 2px solid var(--vut-gold);
+    border-radius: 25px;
+    color: #ffffff;
+    cursor: pointer;
+    transition: all 0.3s;
+    font-size: 0.9em;
+}
+
+:where(.glossary-page) .filter-btn:hover,
+:where(.glossary-page) .filter-btn.active {
+    background: var(--vut-gold);
+    color: var(--vut-navy);
+}
+
+:where(.glossary-page) .letter-index {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 10px;
+    justify-content: center;
+    margin: 30px 0;
+    padding: 20px;
+    background: rgba(var(--vut-navy-rgb), 0.4);
+    border-radius: 10px;
+}
+
+:where(.glossary-page) .letter-link {
+    width: 40px;
+    height: 40px;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    background: rgba(var(--vut-gold-rgb), 0.2);
+    border: 2px solid var(--vut-gold);
+    border-radius: 50%;
+    color: var(--vut-gold);
+    text-decoration: none;
+    font-weight: bold;
+    transition: all 0.3s;
+}
+
+:where(.glossary-page) .letter-link:hover {
+    background: var(--vut-gold);
+    color: var(--vut-navy);
+    transform: scale(1.1);
+}
+
+:where(.glossary-page) .glossary-section {
+    margin: 40px 0;
+}
+
+:where(.glossary-page) .letter-header {
+    font-size: 2.5em;
+    color: var(--vut-gold);
+    border-bottom: 3px solid var(--vut-gold);
+    padding-bottom: 10px;
+    margin-bottom: 20px;
+    margin-top: 40px;
+}
+
+:where(.glossary-page) .term-card {
+    background: rgba(var(--vut-navy-rgb), 0.6);
+    border-left: 5px solid var(--vut-gold);
+    padding: 25px;
+    margin-bottom: 20px;
+    border-radius: 10px;
+    transition: all 0.3s;
+}
+
+:where(.glossary-page) .term-card:hover {
+    background: rgba(var(--vut-navy-rgb), 0.8);
+    transform: translateX(10px);
+}
+
+:where(.glossary-page) .term-title {
+    font-size: 1.8em;
+    color: var(--vut-gold);
+    margin-bottom: 10px;
+    font-weight: bold;
+}
+
+:where(.glossary-page) .term-definition {
+    font-size: 1.1em;
+    line-height: 1.8;
+    margin-bottom: 15px;
+}
+
+:where(.glossary-page) .term-meta {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 15px;
+    margin-top: 15px;
+    padding-top: 15px;
+    border-top: 1px solid rgba(var(--vut-gold-rgb), 0.3);
+}
+
+:where(.glossary-page) .term-category,
+:where(.glossary-page) .term-week {
+    background: rgba(var(--vut-gold-rgb), 0.2);
+    padding: 5px 15px;
+    border-radius: 15px;
+    font-size: 0.9em;
+    color: var(--vut-gold);
+    text-decoration: none;
+    display: inline-block;
+}
+
+:where(.glossary-page) .term-week {
+    cursor: pointer;
+    transition: all 0.3s;
+}
+
+:where(.glossary-page) .term-week:hover {
+    background: var(--vut-gold);
+    color: var(--vut-navy);
+    transform: scale(1.05);
+}
+
+:where(.glossary-page) .related-terms {
+    margin-top: 10px;
+}
+
+:where(.glossary-page) .related-terms strong {
+    color: var(--vut-gold);
+}
+
+:where(.glossary-page) .related-link {
+    color: var(--vut-light-gray);
+    text-decoration: none;
+    margin-right: 10px;
+    transition: color 0.3s;
+}
+
+:where(.glossary-page) .related-link:hover {
+    color: var(--vut-gold);
+}
+
+:where(.glossary-page) .back-to-top {
+    position: fixed;
+    bottom: 30px;
+    right: 30px;
+    background: var(--vut-gold);
+    color: var(--vut-navy);
+    width: 50px;
+    height: 50px;
+    border-radius: 50%;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    font-size: 1.5em;
+    text-decoration: none;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
+    transition: all 0.3s;
+    display: none;
+}
+
+:where(.glossary-page) .back-to-top:hover {
+    transform: scale(1.1);
+}
+
+:where(.glossary-page) .home-button {
+    display: inline-block;
+    margin: 20px auto;
+    padding: 12px 30px;
+    background: var(--vut-gold);
+    color: var(--vut-navy);
+    text-decoration: none;
+    border-radius: 25px;
+    font-weight: bold;
+    transition: all 0.3s;
+}
+
+:where(.glossary-page) .home-button:hover {
+    background: #ffffff;
+    transform: scale(1.05);
+}
+
+:where(.glossary-page) .stats {
+    text-align: center;
+    margin: 20px 0;
+    padding: 20px;
+    background: rgba(var(--vut-navy-rgb), 0.4);
+    border-radius: 10px;
+}
+
+:where(.glossary-page) .stats-item {
+    display: inline-block;
+    margin: 0 20px;
+    font-size: 1.1em;
+}
+
+:where(.glossary-page) .stats-number {
+    font-size: 2em;
+    color: var(--vut-gold);
+    font-weight: bold;
+}
+
+
+@media (max-width: 768px) {
+    :where(.glossary-page) header h1 {
+        font-size: 2em;
+    }
+
+    :where(.glossary-page) .term-title {
+        font-size: 1.4em;
+    }
+
+    :where(.glossary-page) .letter-index {
+        gap: 5px;
+    }
+
+    :where(.glossary-page) .letter-link {
+        width: 35px;
+        height: 35px;
+    }
+}
+"""
+
+CHAT_STYLES = """
+.chat-container {
+    position: fixed;
+    bottom: 100px;
+    right: 30px;
+    width: 350px;
+    max-height: 600px;
+    background: var(--vut-gradient);
+    border-radius: 15px;
+    box-shadow: 0 8px 32px rgba(0, 0, 0, 0.4);
+    border: 2px solid var(--vut-gold);
+    display: flex;
+    flex-direction: column;
+    z-index: 1000;
+    transition: all 0.3s;
+}
+
+.chat-container.minimized {
+    max-height: 60px;
+}
+
+.chat-header {
+    background: var(--vut-gold);
+    color: var(--vut-navy);
+    padding: 15px;
+    border-radius: 13px 13px 0 0;
+    font-weight: bold;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    cursor: pointer;
+}
+
+.chat-header h3 {
+    margin: 0;
+    font-size: 1.1em;
+}
+
+.chat-toggle {
+    background: none;
+    border: none;
+    color: var(--vut-navy);
+    font-size: 1.2em;
+    cursor: pointer;
+    padding: 0 5px;
+}
+
+.chat-messages {
+    flex: 1;
+    overflow-y: auto;
+    padding: 15px;
+    display: flex;
+    flex-direction: column;
+    gap: 10px;
+    max-height: 400px;
+}
+
+.chat-message {
+    padding: 10px 12px;
+    border-radius: 10px;
+    max-width: 85%;
+    word-wrap: break-word;
+}
+
+.chat-message.user {
+    background: rgba(var(--vut-gold-rgb), 0.3);
+    align-self: flex-end;
+    border: 1px solid var(--vut-gold);
+    color: #ffffff;
+}
+
+.chat-message.bot {
+    background: rgba(var(--vut-navy-rgb), 0.8);
+    align-self: flex-start;
+    border: 1px solid rgba(var(--vut-gold-rgb), 0.5);
+    color: #ffffff;
+}
+
+.chat-message.bot strong {
+    color: var(--vut-gold);
+}
+
+.chat-input-container {
+    padding: 15px;
+    border-top: 1px solid rgba(var(--vut-gold-rgb), 0.3);
+}
+
+.chat-input {
+    width: 100%;
+    padding: 10px;
+    border: 2px solid var(--vut-gold);
+    border-radius: 8px;
+    background: rgba(255, 255, 255, 0.1);
+    color: #ffffff;
+    font-size: 0.9em;
+}
+
+.chat-input::placeholder {
+    color: var(--vut-light-gray);
+}
+
+.chat-send-btn {
+    width: 100%;
+    margin-top: 10px;
+    padding: 10px;
+    background: var(--vut-gold);
+    color: var(--vut-navy);
+    border: none;
+    border-radius: 8px;
+    font-weight: bold;
+    cursor: pointer;
+    transition: all 0.3s;
+}
+
+.chat-send-btn:hover {
+    background: #ffffff;
+    transform: scale(1.02);
+}
+
+.chat-suggestions {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 5px;
+    padding: 10px;
+    border-top: 1px solid rgba(var(--vut-gold-rgb), 0.2);
+}
+
+.suggestion-btn {
+    padding: 6px 12px;
+    background: rgba(var(--vut-gold-rgb), 0.2);
+    border: 1px solid var(--vut-gold);
+    border-radius: 15px;
+    color: var(--vut-gold);
+    font-size: 0.85em;
+    cursor: pointer;
+    transition: all 0.3s;
+}
+
+.suggestion-btn:hover {
+    background: var(--vut-gold);
+    color: var(--vut-navy);
+}
+
+.typing-indicator {
+    display: none;
+    align-self: flex-start;
+    padding: 10px;
+}
+
+.typing-indicator.active {
+    display: block;
+}
+
+.typing-dot {
+    display: inline-block;
+    width: 8px;
+    height: 8px;
+    border-radius: 50%;
+    background: var(--vut-gold);
+    margin: 0 2px;
+    animation: typing 1.4s infinite;
+}
+
+.typing-dot:nth-child(2) {
+    animation-delay: 0.2s;
+}
+
+.typing-dot:nth-child(3) {
+    animation-delay: 0.4s;
+}
+
+@keyframes typing {
+
+    0%,
+    60%,
+    100% {
+        transform: translateY(0);
+    }
+
+    30% {
+        transform: translateY(-10px);
+    }
+}
+
+/* Settings panel */
+.chat-settings-btn {
+    background: none;
+    border: none;
+    cursor: pointer;
+    font-size: 1.2rem;
+    margin-right: 10px;
+    transition: transform 0.2s;
+}
+
+.chat-settings-btn:hover {
+    transform: rotate(90deg);
+}
+
+.chat-header {
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+}
+
+.chat-header h3 {
+    flex-grow: 1;
+}
+
+.chat-settings-panel {
+    position: absolute;
+    bottom: 60px;
+    left: 20px;
+    right: 20px;
+    background: var(--vut-navy);
+    border: 2px solid var(--vut-gold);
+    border-radius: 10px;
+    padding: 15px;
+    color: white;
+    display: none;
+    z-index: 1000;
+    box-shadow: 0 -4px 20px rgba(0, 0, 0, 0.5);
+}
+
+.chat-settings-panel.active {
+    display: block;
+}
+
+.chat-settings-panel input {
+    width: 100%;
+    padding: 8px;
+    border-radius: 5px;
+    border: 1px solid var(--vut-gold);
+    background: #0f172a;
+    color: white;
+    margin: 5px 0 15px;
+}
+
+.chat-settings-panel button {
+    background: var(--vut-gold);
+    border: none;
+    padding: 8px 15px;
+    border-radius: 5px;
+    cursor: pointer;
+    color: var(--vut-navy);
+    font-weight: bold;
+}
+
+.chat-settings-panel .close-btn {
+    background: transparent;
+    border: 1px solid var(--vut-gold);
+    color: var(--vut-gold);
+    margin-left: 10px;
+}
+
+.small-text {
+    font-size: 0.8em;
+    color: #cbd5e1;
+    margin-bottom: 10px;
+}
+"""
+
+SLIDE_DECK_STYLES = """
+:where(.slide-deck, .slide-deck *) {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body:where(.slide-deck) {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
+    color: #ffffff;
+    line-height: 1.6;
+}
+
+:where(.slide-deck) .slide {
+    min-height: 100vh;
+    padding: 60px 80px;
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+    page-break-after: always;
+    border-bottom: 3px solid #0f3460;
+}
+
+:where(.slide-deck) .slide:nth-child(even) {
+    background: linear-gradient(135deg, #16213e 0%, #1a1a2e 100%);
+}
+
+:where(.slide-deck) .title-slide {
+    justify-content: center;
+    align-items: center;
+    text-align: center;
+    background: linear-gradient(135deg, #0f3460 0%, #16213e 100%);
+}
+
+:where(.slide-deck) .title-slide h1 {
+    font-size: 3.5em;
+    margin-bottom: 20px;
+    color: #e94560;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+}
+
+:where(.slide-deck) .title-slide .week-number {
+    font-size: 1.5em;
+    color: #ffd700;
+    margin-bottom: 40px;
+    letter-spacing: 2px;
+}
+
+:where(.slide-deck) .title-slide .course-code {
+    font-size: 1.2em;
+    color: #a8dadc;
+    margin-top: 30px;
+}
+
+:where(.slide-deck) h2 {
+    font-size: 2.5em;
+    color: #e94560;
+    margin-bottom: 30px;
+    border-bottom: 3px solid #ffd700;
+    padding-bottom: 15px;
+}
+
+:where(.slide-deck) h3 {
+    font-size: 2em;
+    color: #ffd700;
+    margin-bottom: 25px;
+}
+
+:where(.slide-deck) ul {
+    font-size: 1.4em;
+    margin-left: 40px;
+    margin-bottom: 20px;
+}
+
+:where(.slide-deck) ul li {
+    margin-bottom: 15px;
+    line-height: 1.8;
+}
+
+:where(.slide-deck) p {
+    font-size: 1.3em;
+    margin-bottom: 20px;
+    line-height: 1.8;
+}
+
+:where(.slide-deck) .code-block {
+    background: #0f0f0f;
+    border-left: 4px solid #e94560;
+    padding: 20px;
+    margin: 20px 0;
+    border-radius: 5px;
+    overflow-x: auto;
+}
+
+:where(.slide-deck) pre {
+    background: #0f0f0f;
+    border-left: 4px solid #e94560;
+    padding: 20px;
+    margin: 20px 0;
+    border-radius: 5px;
+    overflow-x: auto;
+    font-size: 1.1em;
+    line-height: 1.5;
+}
+
+:where(.slide-deck) code {
+    font-family: 'Courier New', monospace;
+    color: #a8dadc;
+}
+
+:where(.slide-deck) .quote {
+    background: rgba(233, 69, 96, 0.1);
+    border-left: 5px solid #e94560;
+    padding: 20px;
+    margin: 20px 0;
+    font-style: italic;
+    font-size: 1.2em;
+}
+
+:where(.slide-deck) table {
+    width: 100%;
+    border-collapse: collapse;
+    margin: 20px 0;
+    font-size: 1.2em;
+}
+
+:where(.slide-deck) th {
+    background: #0f3460;
+    color: #ffd700;
+    padding: 15px;
+    text-align: left;
+    border: 1px solid #16213e;
+}
+
+:where(.slide-deck) td {
+    padding: 12px;
+    border: 1px solid #16213e;
+    background: rgba(255, 255, 255, 0.05);
+}
+
+:where(.slide-deck) tr:hover {
+    background: rgba(233, 69, 96, 0.1);
+}
+
+:where(.slide-deck) img {
+    max-width: 100%;
+    height: auto;
+    margin: 20px 0;
+    border-radius: 10px;
+    box-shadow: 0 4px 6px rgba(0,0,0,0.3);
+}
+
+:where(.slide-deck) .key-points {
+    background: rgba(255, 215, 0, 0.1);
+    border: 2px solid #ffd700;
+    padding: 30px;
+    border-radius: 10px;
+    margin: 20px 0;
+}
+
+:where(.slide-deck) .vut-logo {
+    position: fixed;
+    bottom: 20px;
+    right: 30px;
+    height: 60px;
+   width: auto;
+    opacity: 0.8;
+}
+
+@media print {
+    :where(.slide-deck) .slide {
+        page-break-after: always;
+    }
+}
+"""
+
+SECTIONS = [
+    ("Glossary tooltips (notes pages)", TOOLTIP_STYLES),
+    ("Glossary page", GLOSSARY_PAGE_STYLES),
+    ("AI chat assistant (glossary page)", CHAT_STYLES),
+    ("Slide decks", SLIDE_DECK_STYLES),
+]
+
+
+def rgb(name):
+    """(red, green, blue) of a palette color, e.g. for pptx RGBColor(*rgb("navy"))"""
+    value = PALETTE[name].lstrip("#")
+    return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def palette_css():
+    """:root block declaring every palette color as --vut-<name> and --vut-<name>-rgb"""
+    lines = []
+    for name, value in PALETTE.items():
+        lines.append(f"    --vut-{name}: {value};")
+        lines.append(f"    --vut-{name}-rgb: {', '.join(str(c) for c in rgb(name))};")
+    lines.append("    --vut-gradient: linear-gradient(135deg, var(--vut-navy) 0%, var(--vut-navy-dark) 100%);")
+    return ":root {\n" + "\n".join(lines) + "\n}\n"
+
+
+def build_stylesheet():
+    """Full text of css/vut_theme.css"""
+    parts = ["/* VUT theme: palette and shared page styles. Generated by scripts/vut_theme.py, do not edit. */\n",
+             palette_css()]
+    for title, css in SECTIONS:
+        parts.append(f"\n/* {title} */\n" + css.lstrip("\n"))
+    return "".join(parts)
+
+
+def stylesheet_link(prefix=""):
+    """<link> to the theme stylesheet; prefix is the path back to the site root (e.g. '../')"""
+    return f'<link rel="stylesheet" href="{prefix}{STYLESHEET_HREF}">'
+
+
+def write_stylesheet(path=STYLESHEET_PATH):
+    """Write the theme stylesheet if its content changed; returns True if it was written"""
+    css = build_stylesheet()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return write_if_changed(path, css)
+
+
+def main():
+    changed = write_stylesheet()
+    print(f"{'✅ Wrote' if changed else '✓ Up to date:'} {STYLESHEET_PATH}")
+
+
+if __name__ == "__main__":
+    main()
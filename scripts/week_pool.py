@@ -0,0 +1,56 @@
+"""
+Parallel Week Builds
+Runs an independent per-week build function for many weeks, optionally fanned
+out over a process pool (--jobs N in the converters).
+
+Each call's printed output is captured and handed back together with its
+result or error, and results are yielded in the order the weeks were given,
+so the log reads the same whether one or twelve workers built it.
+
+Trace events (tracing.py) and output counts (output_writer.py) recorded in a
+worker are sent back with its result and added to the parent's.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import io
+import traceback
+
+import output_writer
+import tracing
+
+
+def _run_captured(func, args):
+    """Call func(*args) capturing stdout; returns (result, output, error)"""
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            result = func(*args)
+        return result, buffer.getvalue(), None
+    except Exception:
+        return None, buffer.getvalue(), traceback.format_exc().strip()
+
+
+def _run_in_worker(func, args):
+    """_run_captured in a worker process, plus the trace events and output counts it recorded"""
+    return _run_captured(func, args), tracing.drain(), output_writer.drain()
+
+
+def run_weeks(func, tasks, jobs=1):
+    """Yield (result, output, error) for func(*args) of every task, in task order.
+
+    func must be a module-level function so worker processes can import it.
+    """
+    tasks = list(tasks)
+    if jobs <= 1 or len(tasks) <= 1:
+        for args in tasks:
+            yield _run_captured(func, args)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        futures = [pool.submit(_run_in_worker, func, args) for args in tasks]
+        for future in futures:
+            captured, events, outputs = future.result()
+            tracing.merge(events)
+            output_writer.merge(outputs)
+            yield captured
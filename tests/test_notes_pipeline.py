@@ -0,0 +1,18 @@
+"""The notes pipeline settles after one run: running it on its own output changes nothing."""
+
+from pathlib import Path
+import sys
+
+import pytest
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR / "scripts"))
+
+from notes_pipeline import DEFAULT_STAGES, find_notes_files, run_stages  # noqa: E402
+
+
+@pytest.mark.parametrize("html_file", find_notes_files(BASE_DIR), ids=lambda path: path.name)
+def test_run_stages_is_idempotent(html_file):
+    once = str(run_stages(html_file.read_text(encoding='utf-8'), html_file, DEFAULT_STAGES))
+    twice = str(run_stages(once, html_file, DEFAULT_STAGES))
+    assert twice == once